@@ -3,43 +3,163 @@
 Quant toolkit for a crypto trading app.
 
 Provides:
-- Black–Scholes pricing and Greeks
-- Kelly position sizing
+- Scalar / array standard normal kernels (pdf, cdf, ppf)
+- Black–Scholes pricing and Greeks, scalar and vectorized over chains
+- Batch implied-volatility solver with warm starts
+- Implied-volatility surface with incremental per-expiry refits
+- Kelly position sizing, including a leverage-capped multi-asset optimizer
 - VaR / ES estimators (historical, parametric, Cornish–Fisher, Monte Carlo)
+  plus a batched historical VaR/ES over many series and alpha levels
+- Rolling-window VaR / ES with O(log n) per-tick updates
+- Correlated multi-asset VaR / ES with component and marginal allocation
 - Simple GBM Monte Carlo path simulator
-- Tiny linear-programming solver (simplex)
+- Process-parallel Monte Carlo with reproducible per-block RNG streams
+- Path-dependent MC option pricer with antithetic and control variates
+- Sparse revised-simplex LP solver with bounds, equalities and warm starts,
+  plus a batched solver for stacks of small same-shaped LPs
+- Integer fixed-point (ticks / lots) PnL accounting with exact Decimal edges
 """
 from __future__ import annotations
 
-from .black_scholes import bs_price, bs_greeks
-from .kelly import kelly_fraction, kelly_optimal_fraction
-from .var import (
-    historical_var,
-    cvar_historical,
-    parametric_var,
-    cvar_parametric,
-    cornish_fisher_var,
-    monte_carlo_var,
-    var_es,
-)
-from .monte_carlo import GBMSimulator
-from .lp import solve_lp
-from .precision import hp_decimal, set_precision
+import importlib
+import sys
+import types
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from .normal import norm_cdf, norm_pdf, norm_ppf
+    from .black_scholes import bs_price, bs_greeks, bs_price_batch, bs_greeks_batch
+    from .implied_vol import implied_vol, implied_vol_batch
+    from .vol_surface import VolSurface
+    from .kelly import KellyOptimizer, kelly_fraction, kelly_optimal_fraction, kelly_portfolio
+    from .var import (
+        historical_var,
+        cvar_historical,
+        parametric_var,
+        cvar_parametric,
+        cornish_fisher_var,
+        monte_carlo_var,
+        mc_var,
+        var_es,
+        var_es_batch,
+    )
+    from .rolling_var import RollingVaR
+    from .portfolio_var import PortfolioVaR
+    from .monte_carlo import GBMSimulator
+    from .parallel import parallel_gbm_terminal, parallel_monte_carlo_var
+    from .mc_pricer import MCPricer, Payoff
+    from .lp import CSCMatrix, solve_lp, solve_lp_batch, solve_lp_sparse
+    from .precision import hp_decimal, set_precision
+    from .fixed_point import FixedSpec, PnLBook
+
+# Public name -> submodule. Submodules (and numpy) are imported on first
+# attribute access, so `import quant` and CLI entry points stay cheap.
+_EXPORTS: Dict[str, str] = {
+    "norm_cdf": "normal",
+    "norm_pdf": "normal",
+    "norm_ppf": "normal",
+    "bs_price": "black_scholes",
+    "bs_greeks": "black_scholes",
+    "bs_price_batch": "black_scholes",
+    "bs_greeks_batch": "black_scholes",
+    "implied_vol": "implied_vol",
+    "implied_vol_batch": "implied_vol",
+    "VolSurface": "vol_surface",
+    "kelly_fraction": "kelly",
+    "kelly_optimal_fraction": "kelly",
+    "KellyOptimizer": "kelly",
+    "kelly_portfolio": "kelly",
+    "historical_var": "var",
+    "cvar_historical": "var",
+    "parametric_var": "var",
+    "cvar_parametric": "var",
+    "cornish_fisher_var": "var",
+    "monte_carlo_var": "var",
+    "mc_var": "var",
+    "var_es": "var",
+    "var_es_batch": "var",
+    "RollingVaR": "rolling_var",
+    "PortfolioVaR": "portfolio_var",
+    "GBMSimulator": "monte_carlo",
+    "parallel_monte_carlo_var": "parallel",
+    "parallel_gbm_terminal": "parallel",
+    "MCPricer": "mc_pricer",
+    "Payoff": "mc_pricer",
+    "solve_lp": "lp",
+    "solve_lp_sparse": "lp",
+    "solve_lp_batch": "lp",
+    "CSCMatrix": "lp",
+    "hp_decimal": "precision",
+    "set_precision": "precision",
+    "FixedSpec": "fixed_point",
+    "PnLBook": "fixed_point",
+}
 
 __all__ = [
+    "norm_cdf",
+    "norm_pdf",
+    "norm_ppf",
     "bs_price",
     "bs_greeks",
+    "bs_price_batch",
+    "bs_greeks_batch",
+    "implied_vol",
+    "implied_vol_batch",
+    "VolSurface",
     "kelly_fraction",
     "kelly_optimal_fraction",
+    "KellyOptimizer",
+    "kelly_portfolio",
     "historical_var",
     "cvar_historical",
     "parametric_var",
     "cvar_parametric",
     "cornish_fisher_var",
     "monte_carlo_var",
+    "mc_var",
     "var_es",
+    "var_es_batch",
+    "RollingVaR",
+    "PortfolioVaR",
     "GBMSimulator",
+    "parallel_monte_carlo_var",
+    "parallel_gbm_terminal",
+    "MCPricer",
+    "Payoff",
     "solve_lp",
+    "solve_lp_sparse",
+    "solve_lp_batch",
+    "CSCMatrix",
     "hp_decimal",
     "set_precision",
+    "FixedSpec",
+    "PnLBook",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    mod = _EXPORTS.get(name)
+    if mod is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{mod}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+class _Package(types.ModuleType):
+    # The import system binds every submodule on its package once loaded.
+    # `implied_vol` is both a submodule and the function it exports, so that
+    # binding would shadow the export for good (`from quant.vol_surface
+    # import ...` loads it); keep the export instead. The submodule stays
+    # importable through sys.modules.
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in _EXPORTS and isinstance(value, types.ModuleType):
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
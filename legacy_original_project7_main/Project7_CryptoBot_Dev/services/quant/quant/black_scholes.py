@@ -2,17 +2,14 @@
 from __future__ import annotations
 
 import math
-from typing import Dict
+from typing import Dict, Sequence, Union
 
+import numpy as np
 
-def _norm_cdf(x: float) -> float:
-    """Standard normal CDF using math.erf."""
-    return 0.5 * (1.0 + math.erf(x / math.sqrt(2.0)))
+from .normal import norm_cdf as _norm_cdf, norm_cdf_pair, norm_pdf as _norm_pdf
 
-
-def _norm_pdf(x: float) -> float:
-    """Standard normal PDF."""
-    return math.exp(-0.5 * x * x) / math.sqrt(2.0 * math.pi)
+ArrayLike = Union[float, Sequence[float], np.ndarray]
+CPLike = Union[str, Sequence[str], Sequence[bool], np.ndarray]
 
 
 def bs_price(
@@ -117,9 +114,8 @@ def bs_greeks(
     ediv = math.exp(-q * T)
     er = math.exp(-r * T)
 
-    price = bs_price(cp, S, K, T, r, sigma, q)
-
     if cp[0] == "c":
+        price = S * ediv * Nd1 - K * er * Nd2
         delta = ediv * Nd1
         theta = (
             -S * ediv * nd1 * sigma / (2.0 * sqrtT)
@@ -128,6 +124,7 @@ def bs_greeks(
         )
         rho = K * T * er * Nd2
     else:
+        price = K * er * _norm_cdf(-d2) - S * ediv * _norm_cdf(-d1)
         delta = -ediv * _norm_cdf(-d1)
         theta = (
             -S * ediv * nd1 * sigma / (2.0 * sqrtT)
@@ -147,3 +144,123 @@ def bs_greeks(
         "theta": theta,
         "rho": rho,
     }
+
+
+def _cp_is_call(cp: CPLike) -> np.ndarray:
+    """Boolean call mask from "c"/"call"/"p"/"put" flags or booleans (True = call)."""
+    arr = np.asarray(cp)
+    if arr.dtype == bool:
+        return arr
+    # Parse each distinct flag once; chains repeat a handful of spellings
+    uniq, inv = np.unique(arr.astype(str), return_inverse=True)
+    flags = [str(u).lower() for u in uniq]
+    if any(f not in {"c", "call", "p", "put"} for f in flags):
+        raise ValueError("cp must be 'c'/'call' or 'p'/'put'")
+    return np.array([f[0] == "c" for f in flags], dtype=bool)[inv].reshape(arr.shape)
+
+
+def _bs_batch(
+    cp: CPLike,
+    S: ArrayLike,
+    K: ArrayLike,
+    T: ArrayLike,
+    r: ArrayLike,
+    sigma: ArrayLike,
+    q: ArrayLike,
+    greeks: bool,
+) -> Dict[str, np.ndarray]:
+    is_call, S, K, T, r, sigma, q = np.broadcast_arrays(
+        _cp_is_call(cp),
+        np.asarray(S, dtype=float),
+        np.asarray(K, dtype=float),
+        np.maximum(0.0, np.asarray(T, dtype=float)),
+        np.asarray(r, dtype=float),
+        np.asarray(sigma, dtype=float),
+        np.asarray(q, dtype=float),
+    )
+    degen = (T == 0.0) | (sigma <= 0.0)
+    ediv = np.exp(-q * T)
+    er = np.exp(-r * T)
+
+    # Dummy T / sigma on degenerate rows keep the log/divide warning-free;
+    # those rows are overwritten below.
+    T_s = np.where(degen, 1.0, T)
+    sig_s = np.where(degen, 1.0, sigma)
+    sqrtT = np.sqrt(T_s)
+    sig_sqrtT = sig_s * sqrtT
+    d1 = (np.log(S / K) + (r - q + 0.5 * sig_s * sig_s) * T_s) / sig_sqrtT
+    d2 = d1 - sig_sqrtT
+    Nd1, Nmd1 = norm_cdf_pair(d1)
+    Nd2, Nmd2 = norm_cdf_pair(d2)
+    S_ediv = S * ediv
+    K_er = K * er
+
+    price = np.where(is_call, S_ediv * Nd1 - K_er * Nd2, K_er * Nmd2 - S_ediv * Nmd1)
+    if np.any(degen):
+        intrinsic = np.where(
+            is_call, np.maximum(0.0, S_ediv - K_er), np.maximum(0.0, K_er - S_ediv)
+        )
+        price = np.where(degen, intrinsic, price)
+    out = {"price": price}
+    if not greeks:
+        return out
+
+    nd1 = _norm_pdf(d1)
+    delta = np.where(is_call, ediv * Nd1, -ediv * Nmd1)
+    decay = -S_ediv * nd1 * sig_s / (2.0 * sqrtT)
+    theta = np.where(
+        is_call,
+        decay - r * K_er * Nd2 + q * S_ediv * Nd1,
+        decay + r * K_er * Nmd2 - q * S_ediv * Nmd1,
+    )
+    rho = np.where(is_call, K * T_s * er * Nd2, -K * T_s * er * Nmd2)
+    gamma = ediv * nd1 / (S * sig_sqrtT)
+    vega = S_ediv * nd1 * sqrtT
+
+    if np.any(degen):
+        zero = np.zeros_like(price)
+        delta = np.where(degen, np.where(is_call & (S_ediv > K_er), 1.0, 0.0), delta)
+        gamma = np.where(degen, zero, gamma)
+        vega = np.where(degen, zero, vega)
+        theta = np.where(degen, zero, theta)
+        rho = np.where(degen, zero, rho)
+    out.update(delta=delta, gamma=gamma, vega=vega, theta=theta, rho=rho)
+    return out
+
+
+def bs_price_batch(
+    cp: CPLike,
+    S: ArrayLike,
+    K: ArrayLike,
+    T: ArrayLike,
+    r: ArrayLike,
+    sigma: ArrayLike,
+    q: ArrayLike = 0.0,
+) -> np.ndarray:
+    """
+    Vectorized `bs_price` over broadcastable arrays (e.g. a whole chain).
+
+    cp: a single flag, an array of "c"/"call"/"p"/"put", or booleans
+        (True = call). Rows with T == 0 or sigma <= 0 price at discounted
+        intrinsic, as in the scalar function.
+    Returns an array of prices in the broadcast shape.
+    """
+    return _bs_batch(cp, S, K, T, r, sigma, q, greeks=False)["price"]
+
+
+def bs_greeks_batch(
+    cp: CPLike,
+    S: ArrayLike,
+    K: ArrayLike,
+    T: ArrayLike,
+    r: ArrayLike,
+    sigma: ArrayLike,
+    q: ArrayLike = 0.0,
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized `bs_greeks`: d1/d2, discount factors and CDFs are computed
+    once per contract and shared between price and Greeks.
+
+    Returns columnar dict of arrays: price, delta, gamma, vega, theta, rho.
+    """
+    return _bs_batch(cp, S, K, T, r, sigma, q, greeks=True)
@@ -0,0 +1,214 @@
+# fixed_point.py
+"""
+Integer fixed-point accounting for prices, quantities and cash.
+
+Per symbol, prices are int64 ticks (price = ticks * tick_size), quantities
+are int64 lots (qty = lots * lot_size) and cash is an integer count of
+tick_size * lot_size, so the notional of a fill (ticks * lots) is exact
+with no rounding at all. Fees are rounded once, half-even, to the cash
+unit. Decimal only appears at the edges (`to_*` / `*_decimal`), which
+keeps the hot path at numpy integer speed without touching the global
+Decimal context that `quant.precision` manages.
+"""
+from __future__ import annotations
+
+from decimal import ROUND_HALF_EVEN, Decimal
+from typing import Dict, Union
+
+import numpy as np
+
+Number = Union[int, float, str, Decimal]
+IntLike = Union[int, np.ndarray]
+
+_INT64_MAX = np.iinfo(np.int64).max
+
+
+def _dec(x: Number) -> Decimal:
+    if isinstance(x, Decimal):
+        return x
+    return Decimal(str(x))
+
+
+def _check_range(x: np.ndarray, mul: int = 1) -> None:
+    if x.size and int(np.abs(x).max()) > _INT64_MAX // max(abs(mul), 1):
+        raise OverflowError("fixed-point value out of int64 range")
+
+
+def round_div(num: IntLike, den: int) -> IntLike:
+    """num / den rounded half-even, in integers (scalar or int64 array)."""
+    if den <= 0:
+        raise ValueError("den must be > 0")
+    if np.ndim(num) == 0:
+        q, r = divmod(int(num), den)
+        return q + (1 if 2 * r > den or (2 * r == den and q % 2) else 0)
+    q, r = np.divmod(np.asarray(num, dtype=np.int64), den)
+    twice = 2 * r
+    up = (twice > den) | ((twice == den) & (q % 2 == 1))
+    return (q + up).astype(np.int64)
+
+
+class FixedSpec:
+    """
+    Fixed-point precision of one symbol.
+
+    tick_size: price increment (quote currency)
+    lot_size: quantity increment (base currency)
+    """
+
+    def __init__(self, symbol: str, tick_size: Number, lot_size: Number) -> None:
+        tick = _dec(tick_size)
+        lot = _dec(lot_size)
+        if tick <= 0 or lot <= 0:
+            raise ValueError("tick_size and lot_size must be > 0")
+        self.symbol = symbol
+        self.tick_size = tick
+        self.lot_size = lot
+        self.cash_unit = tick * lot
+        self._tick_f = float(tick)
+        self._lot_f = float(lot)
+
+    def __repr__(self) -> str:
+        return f"FixedSpec({self.symbol!r}, tick_size={self.tick_size}, lot_size={self.lot_size})"
+
+    def _to_units(self, x, step: Decimal, step_f: float) -> IntLike:
+        if np.ndim(x) == 0 and not isinstance(x, np.ndarray):
+            return int((_dec(x) / step).quantize(Decimal(1), rounding=ROUND_HALF_EVEN))
+        arr = np.asarray(x, dtype=float)
+        units = np.rint(arr / step_f)
+        if units.size and float(np.abs(units).max()) > 2.0**62:
+            raise OverflowError("fixed-point value out of int64 range")
+        return units.astype(np.int64)
+
+    def to_ticks(self, price) -> IntLike:
+        """Price(s) to ticks, nearest tick (half-even); arrays go through float."""
+        return self._to_units(price, self.tick_size, self._tick_f)
+
+    def to_lots(self, qty) -> IntLike:
+        """Quantity(ies) to lots, nearest lot (half-even)."""
+        return self._to_units(qty, self.lot_size, self._lot_f)
+
+    def price_decimal(self, ticks: int) -> Decimal:
+        return int(ticks) * self.tick_size
+
+    def qty_decimal(self, lots: int) -> Decimal:
+        return int(lots) * self.lot_size
+
+    def cash_decimal(self, units: int) -> Decimal:
+        return int(units) * self.cash_unit
+
+    def cash_units(self, amount: Number) -> int:
+        """Cash amount to units (half-even)."""
+        return int((_dec(amount) / self.cash_unit).quantize(Decimal(1), rounding=ROUND_HALF_EVEN))
+
+    def price_float(self, ticks: IntLike):
+        return np.asarray(ticks) * self._tick_f if np.ndim(ticks) else int(ticks) * self._tick_f
+
+    def qty_float(self, lots: IntLike):
+        return np.asarray(lots) * self._lot_f if np.ndim(lots) else int(lots) * self._lot_f
+
+    def cash_float(self, units: IntLike):
+        return float(self.cash_decimal(units)) if np.ndim(units) == 0 else np.asarray(units) * float(self.cash_unit)
+
+
+def notional_units(price_ticks: IntLike, lots: IntLike) -> IntLike:
+    """Exact notional in cash units: ticks * lots (int64, overflow-checked)."""
+    t = np.asarray(price_ticks, dtype=np.int64)
+    q = np.asarray(lots, dtype=np.int64)
+    t, q = np.broadcast_arrays(t, q)
+    if t.size and q.size:
+        _check_range(t, int(np.abs(q).max()))
+    out = t * q
+    return int(out) if out.ndim == 0 else out
+
+
+def fee_units(notional: IntLike, rate: Number) -> IntLike:
+    """
+    Fee on a notional (cash units) at a rate (e.g. Decimal("0.0002") for
+    2 bps), rounded half-even to the cash unit using integers only.
+    """
+    num, den = _dec(rate).as_integer_ratio()
+    if np.ndim(notional) == 0:
+        return round_div(int(notional) * num, den)
+    n = np.asarray(notional, dtype=np.int64)
+    _check_range(n, num)
+    return round_div(n * num, den)
+
+
+class PnLBook:
+    """
+    Exact running cash / position / fee totals for one symbol.
+
+    Totals are Python ints (unbounded); each batch of fills is reduced
+    with int64 numpy sums first, so array bookings cost a few vector ops.
+    side: +1 buy / -1 sell (or "buy" / "sell" for the scalar `fill`).
+    """
+
+    def __init__(self, spec: FixedSpec) -> None:
+        self.spec = spec
+        self.cash = 0
+        self.position = 0
+        self.fees = 0
+        self.trades = 0
+
+    def fill(self, side: str, price: Number, qty: Number, fee_rate: Number = 0) -> int:
+        """Book one fill from decimal-ish price / qty; returns its fee in cash units."""
+        s = 1 if side == "buy" else -1
+        ticks = self.spec.to_ticks(price)
+        lots = self.spec.to_lots(qty)
+        notional = ticks * lots
+        fee = fee_units(notional, fee_rate)
+        self.cash -= s * notional
+        self.position += s * lots
+        self.fees += fee
+        self.trades += 1
+        return fee
+
+    def fills(
+        self,
+        sides: np.ndarray,
+        price_ticks: np.ndarray,
+        lots: np.ndarray,
+        fee_rate: Number = 0,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Book many fills at once (already in ticks / lots).
+        Returns per-leg "cash" (signed cash flow) and "fee", in cash units.
+        """
+        s = np.asarray(sides, dtype=np.int64)
+        notional = notional_units(price_ticks, lots)
+        notional = np.asarray(notional, dtype=np.int64)
+        fee = np.asarray(fee_units(notional, fee_rate), dtype=np.int64)
+        cash = -s * notional
+        self.cash += int(cash.sum())
+        self.position += int((s * np.asarray(lots, dtype=np.int64)).sum())
+        self.fees += int(fee.sum())
+        self.trades += int(s.size)
+        return {"cash": cash, "fee": fee}
+
+    def equity(self, mark_ticks: int) -> int:
+        """Cash plus position marked at mark_ticks, before fees (cash units)."""
+        return self.cash + self.position * int(mark_ticks)
+
+    def snapshot(self, mark: Number | None = None) -> Dict[str, Decimal]:
+        """Exact Decimal view of the book (pnl is net of fees when mark given)."""
+        out = {
+            "cash": self.spec.cash_decimal(self.cash),
+            "position": self.spec.qty_decimal(self.position),
+            "fees": self.spec.cash_decimal(self.fees),
+        }
+        if mark is not None:
+            eq = self.equity(self.spec.to_ticks(mark))
+            out["pnl"] = self.spec.cash_decimal(eq - self.fees)
+        return out
+
+
+def leg_pnl(
+    sides: np.ndarray,
+    price_ticks: np.ndarray,
+    lots: np.ndarray,
+    mark_ticks: IntLike,
+) -> np.ndarray:
+    """Per-leg mark-to-market PnL in cash units: side * lots * (mark - price)."""
+    s = np.asarray(sides, dtype=np.int64)
+    move = np.asarray(mark_ticks, dtype=np.int64) - np.asarray(price_ticks, dtype=np.int64)
+    return s * np.asarray(notional_units(move, lots), dtype=np.int64)
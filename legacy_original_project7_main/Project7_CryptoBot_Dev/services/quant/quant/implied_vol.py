@@ -0,0 +1,169 @@
+# implied_vol.py
+from __future__ import annotations
+
+import math
+from typing import Dict
+
+import numpy as np
+
+from .black_scholes import ArrayLike, CPLike, _cp_is_call
+from .normal import norm_cdf_pair, norm_pdf
+
+# Per-quote status codes
+IV_CONVERGED = "converged"
+IV_MAX_ITER = "max_iter"
+IV_BELOW_INTRINSIC = "below_intrinsic"
+IV_ABOVE_MAX = "above_max"
+IV_BAD_INPUT = "bad_input"
+
+
+def _price_vega(
+    is_call: np.ndarray,
+    S_ediv: np.ndarray,
+    K_er: np.ndarray,
+    sqrtT: np.ndarray,
+    sigma: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Black–Scholes price and vega written on discounted spot / strike."""
+    sig_sqrtT = sigma * sqrtT
+    d1 = np.log(S_ediv / K_er) / sig_sqrtT + 0.5 * sig_sqrtT
+    d2 = d1 - sig_sqrtT
+    Nd1, Nmd1 = norm_cdf_pair(d1)
+    Nd2, Nmd2 = norm_cdf_pair(d2)
+    price = np.where(is_call, S_ediv * Nd1 - K_er * Nd2, K_er * Nmd2 - S_ediv * Nmd1)
+    vega = S_ediv * norm_pdf(d1) * sqrtT
+    return price, vega
+
+
+def implied_vol_batch(
+    price: ArrayLike,
+    cp: CPLike,
+    S: ArrayLike,
+    K: ArrayLike,
+    T: ArrayLike,
+    r: ArrayLike = 0.0,
+    q: ArrayLike = 0.0,
+    sigma0: ArrayLike | None = None,
+    tol: float = 1e-10,
+    max_iter: int = 50,
+    sigma_lo: float = 1e-6,
+    sigma_hi: float = 10.0,
+) -> Dict[str, np.ndarray]:
+    """
+    Implied volatility for many European quotes at once.
+
+    Starts from the Corrado–Miller rational approximation (or from sigma0,
+    e.g. the previous snapshot's vols, where it is finite and positive),
+    then takes Newton steps on vega. Every quote keeps a [lo, hi] bracket
+    on sigma; a Newton step that leaves the bracket, or a vanishing vega,
+    falls back to bisection, so each quote converges or runs out of
+    iterations without diverging.
+
+    tol: absolute price tolerance, relative to spot (|model - quote| <= tol * S).
+
+    Returns columnar dict:
+      - "sigma": implied vols (nan where not solved)
+      - "status": per quote, one of "converged", "max_iter",
+        "below_intrinsic", "above_max", "bad_input"
+      - "iterations": Newton/bisection steps taken per quote
+    """
+    is_call, target, S, K, T, r, q = np.broadcast_arrays(
+        _cp_is_call(cp),
+        np.asarray(price, dtype=float),
+        np.asarray(S, dtype=float),
+        np.asarray(K, dtype=float),
+        np.asarray(T, dtype=float),
+        np.asarray(r, dtype=float),
+        np.asarray(q, dtype=float),
+    )
+    shape = target.shape
+    is_call, target, S, K, T, r, q = (
+        a.ravel() for a in (is_call, target, S, K, T, r, q)
+    )
+    n = target.size
+    sigma = np.full(n, np.nan)
+    status = np.full(n, IV_MAX_ITER, dtype=object)
+    iters = np.zeros(n, dtype=np.int64)
+
+    bad = ~((S > 0.0) & (K > 0.0) & (T > 0.0) & np.isfinite(target))
+    Tc = np.where(bad, 1.0, T)
+    S_ediv = S * np.exp(-q * Tc)
+    K_er = K * np.exp(-r * Tc)
+    sqrtT = np.sqrt(Tc)
+    intrinsic = np.where(
+        is_call, np.maximum(0.0, S_ediv - K_er), np.maximum(0.0, K_er - S_ediv)
+    )
+    p_hi, _ = _price_vega(is_call, S_ediv, K_er, sqrtT, np.full(n, sigma_hi))
+    below = ~bad & (target <= intrinsic)
+    above = ~bad & ~below & (target > p_hi)
+    status[bad] = IV_BAD_INPUT
+    status[below] = IV_BELOW_INTRINSIC
+    status[above] = IV_ABOVE_MAX
+    idx = np.flatnonzero(~(bad | below | above))
+
+    # Corrado–Miller on the call price (puts via parity)
+    c = np.where(is_call[idx], target[idx], target[idx] + S_ediv[idx] - K_er[idx])
+    s_, x_ = S_ediv[idx], K_er[idx]
+    m = c - 0.5 * (s_ - x_)
+    root = np.sqrt(np.maximum(m * m - (s_ - x_) ** 2 / math.pi, 0.0))
+    guess = math.sqrt(2.0 * math.pi) / (s_ + x_) * (m + root) / sqrtT[idx]
+    if sigma0 is not None:
+        warm = np.broadcast_to(np.asarray(sigma0, dtype=float), shape).ravel()[idx]
+        ok = np.isfinite(warm) & (warm > 0.0)
+        guess = np.where(ok, warm, guess)
+    bad_guess = ~np.isfinite(guess) | (guess <= sigma_lo) | (guess >= sigma_hi)
+    guess = np.where(bad_guess, min(max(0.5, 2.0 * sigma_lo), 0.5 * sigma_hi), guess)
+
+    lo = np.full(idx.size, sigma_lo)
+    hi = np.full(idx.size, sigma_hi)
+    sig = guess
+    tol_abs = tol * S[idx]
+    for _ in range(max_iter):
+        if idx.size == 0:
+            break
+        p, vega = _price_vega(is_call[idx], S_ediv[idx], K_er[idx], sqrtT[idx], sig)
+        f = p - target[idx]
+        done = np.abs(f) <= tol_abs
+        sigma[idx[done]] = sig[done]
+        status[idx[done]] = IV_CONVERGED
+        keep = ~done
+        iters[idx] += keep
+
+        # Shrink brackets (price increases in sigma), then step
+        lo = np.where(f < 0.0, sig, lo)
+        hi = np.where(f > 0.0, sig, hi)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            newton = sig - f / vega
+        ok = np.isfinite(newton) & (newton > lo) & (newton < hi)
+        sig = np.where(ok, newton, 0.5 * (lo + hi))
+        # A collapsed bracket means the price tolerance is below float noise
+        flat = keep & (hi - lo <= 1e-15 * hi)
+        sigma[idx[flat]] = sig[flat]
+        status[idx[flat]] = IV_CONVERGED
+        keep &= ~flat
+
+        idx, sig, lo, hi, tol_abs = idx[keep], sig[keep], lo[keep], hi[keep], tol_abs[keep]
+
+    return {
+        "sigma": sigma.reshape(shape),
+        "status": status.astype(str).reshape(shape),
+        "iterations": iters.reshape(shape),
+    }
+
+
+def implied_vol(
+    price: float,
+    cp: str,
+    S: float,
+    K: float,
+    T: float,
+    r: float = 0.0,
+    q: float = 0.0,
+    sigma0: float | None = None,
+) -> float:
+    """Scalar wrapper around `implied_vol_batch`; raises if the solve fails."""
+    out = implied_vol_batch(price, cp, S, K, T, r, q, sigma0=sigma0)
+    status = str(out["status"])
+    if status != IV_CONVERGED:
+        raise ValueError(f"implied vol not found: {status}")
+    return float(out["sigma"])
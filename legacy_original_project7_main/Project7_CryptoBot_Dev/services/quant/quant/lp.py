@@ -1,97 +1,659 @@
 # lp.py
 from __future__ import annotations
 
-from typing import Dict, List, Tuple
+import math
+from typing import Dict, List, Sequence, Tuple, Union
+
+import numpy as np
+
+Bounds = Union[
+    None,
+    Tuple[Union[float, None], Union[float, None]],
+    Sequence[Tuple[Union[float, None], Union[float, None]]],
+]
+
+
+class CSCMatrix:
+    """
+    Minimal compressed-sparse-column matrix for the simplex solver.
+
+    Only the products the revised simplex needs are provided: A @ x,
+    A.T @ y and dense extraction of single columns.
+    """
+
+    def __init__(
+        self,
+        data: np.ndarray,
+        indices: np.ndarray,
+        indptr: np.ndarray,
+        shape: Tuple[int, int],
+    ) -> None:
+        self.data = np.asarray(data, dtype=float)
+        self.indices = np.asarray(indices, dtype=np.intp)
+        self.indptr = np.asarray(indptr, dtype=np.intp)
+        self.shape = (int(shape[0]), int(shape[1]))
+        if self.indptr.shape != (self.shape[1] + 1,):
+            raise ValueError("indptr length must be number of columns + 1")
+        # Column index per stored entry, for bincount-based A.T @ y
+        self._cols = np.repeat(np.arange(self.shape[1]), np.diff(self.indptr))
+
+    @classmethod
+    def from_dense(cls, A: Sequence[Sequence[float]] | np.ndarray) -> "CSCMatrix":
+        arr = np.asarray(A, dtype=float)
+        if arr.ndim != 2:
+            raise ValueError("A must be 2-D")
+        cols, rows = np.nonzero(arr.T)
+        indptr = np.concatenate(([0], np.cumsum(np.bincount(cols, minlength=arr.shape[1]))))
+        return cls(arr[rows, cols], rows, indptr, arr.shape)
+
+    @classmethod
+    def from_triplets(
+        cls,
+        rows: Sequence[int],
+        cols: Sequence[int],
+        vals: Sequence[float],
+        shape: Tuple[int, int],
+    ) -> "CSCMatrix":
+        """Build from (row, col, value) entries; duplicates are summed."""
+        r = np.asarray(rows, dtype=np.intp)
+        c = np.asarray(cols, dtype=np.intp)
+        v = np.asarray(vals, dtype=float)
+        m, n = shape
+        if r.size and (r.min() < 0 or r.max() >= m or c.min() < 0 or c.max() >= n):
+            raise ValueError("triplet index out of range")
+        key = c * m + r
+        uniq, inv = np.unique(key, return_inverse=True)
+        summed = np.bincount(inv, weights=v, minlength=uniq.size)
+        keep = summed != 0.0
+        uniq, summed = uniq[keep], summed[keep]
+        ucols = uniq // max(m, 1)
+        indptr = np.concatenate(([0], np.cumsum(np.bincount(ucols, minlength=n))))
+        return cls(summed, uniq % max(m, 1), indptr, shape)
+
+    @property
+    def nnz(self) -> int:
+        return int(self.data.size)
+
+    def matvec(self, x: np.ndarray) -> np.ndarray:
+        return np.bincount(self.indices, weights=self.data * x[self._cols], minlength=self.shape[0])
+
+    def rmatvec(self, y: np.ndarray) -> np.ndarray:
+        return np.bincount(self._cols, weights=self.data * y[self.indices], minlength=self.shape[1])
+
+    def col(self, j: int) -> Tuple[np.ndarray, np.ndarray]:
+        """(row indices, values) of column j."""
+        lo, hi = self.indptr[j], self.indptr[j + 1]
+        return self.indices[lo:hi], self.data[lo:hi]
+
+    def hstack(self, other: "CSCMatrix") -> "CSCMatrix":
+        if other.shape[0] != self.shape[0]:
+            raise ValueError("row counts differ")
+        return CSCMatrix(
+            np.concatenate((self.data, other.data)),
+            np.concatenate((self.indices, other.indices)),
+            np.concatenate((self.indptr, other.indptr[1:] + self.indptr[-1])),
+            (self.shape[0], self.shape[1] + other.shape[1]),
+        )
+
+    def vstack(self, other: "CSCMatrix") -> "CSCMatrix":
+        if other.shape[1] != self.shape[1]:
+            raise ValueError("column counts differ")
+        m = self.shape[0]
+        rows = np.concatenate((self.indices, other.indices + m))
+        cols = np.concatenate((self._cols, other._cols))
+        vals = np.concatenate((self.data, other.data))
+        return CSCMatrix.from_triplets(rows, cols, vals, (m + other.shape[0], self.shape[1]))
+
+
+def _as_csc(A, n: int) -> CSCMatrix:
+    if isinstance(A, CSCMatrix):
+        M = A
+    else:
+        arr = np.asarray(A, dtype=float)
+        if arr.size == 0:
+            arr = arr.reshape(0, n)
+        if arr.ndim != 2:
+            raise ValueError("constraint matrices must be 2-D")
+        M = CSCMatrix.from_dense(arr)
+    if M.shape[1] != n:
+        raise ValueError("All rows of A must have length len(c)")
+    return M
+
+
+def _bounds(bounds: Bounds, n: int) -> Tuple[np.ndarray, np.ndarray]:
+    if bounds is None:
+        pairs = [(0.0, None)] * n
+    elif len(bounds) == 2 and not isinstance(bounds[0], (tuple, list)):
+        pairs = [tuple(bounds)] * n  # type: ignore[list-item]
+    else:
+        pairs = list(bounds)  # type: ignore[arg-type]
+    if len(pairs) != n:
+        raise ValueError("bounds must have one (lo, hi) pair per variable")
+    lo = np.array([-math.inf if p[0] is None else float(p[0]) for p in pairs])
+    hi = np.array([math.inf if p[1] is None else float(p[1]) for p in pairs])
+    if np.any(lo > hi):
+        raise ValueError("bounds must satisfy lo <= hi")
+    return lo, hi
+
+
+class _RevisedSimplex:
+    """
+    Bounded-variable revised simplex on  A x = b,  lo <= x <= hi  (minimize).
+
+    B^-1 is kept explicitly, updated by one eta (rank-1) step per pivot and
+    refactorized from scratch every `refactor_every` pivots to shed drift.
+    Nonbasic variables sit at a bound (or at 0 when free); their position
+    is read off x, so no separate status array is needed.
+    """
+
+    def __init__(
+        self,
+        A: CSCMatrix,
+        b: np.ndarray,
+        lo: np.ndarray,
+        hi: np.ndarray,
+        head: np.ndarray,
+        x: np.ndarray,
+        tol: float,
+        refactor_every: int = 100,
+    ) -> None:
+        self.A = A
+        self.b = b
+        self.lo = lo
+        self.hi = hi
+        self.head = head
+        self.x = x
+        self.tol = tol
+        self.refactor_every = refactor_every
+        self.basic = np.zeros(A.shape[1], dtype=bool)
+        self.basic[head] = True
+        self.refactorizations = 0
+        self.factor()
+
+    def factor(self) -> None:
+        m = self.A.shape[0]
+        B = np.zeros((m, m))
+        for k, j in enumerate(self.head):
+            rows, vals = self.A.col(j)
+            B[rows, k] = vals
+        self.Binv = np.linalg.inv(B)
+        self.refactorizations += 1
+        self._since_factor = 0
+        xN = np.where(self.basic, 0.0, self.x)
+        self.x[self.head] = self.Binv @ (self.b - self.A.matvec(xN))
+
+    def ftran(self, j: int) -> np.ndarray:
+        rows, vals = self.A.col(j)
+        return self.Binv[:, rows] @ vals
+
+    def reduced_costs(self, cost: np.ndarray) -> np.ndarray:
+        y = self.Binv.T @ cost[self.head]
+        d = cost - self.A.rmatvec(y)
+        d[self.head] = 0.0
+        return d
+
+    def _pivot(self, r: int, q: int, alpha: np.ndarray) -> None:
+        self.basic[self.head[r]] = False
+        self.basic[q] = True
+        self.head[r] = q
+        piv = self.Binv[r] / alpha[r]
+        self.Binv -= np.outer(alpha, piv)
+        self.Binv[r] = piv
+        self._since_factor += 1
+        if self._since_factor >= self.refactor_every:
+            self.factor()
+
+    def _movable(self) -> Tuple[np.ndarray, np.ndarray]:
+        nb = ~self.basic
+        return nb & (self.x < self.hi), nb & (self.x > self.lo)
+
+    def primal(self, cost: np.ndarray, max_iter: int) -> Tuple[str, int]:
+        tol = self.tol
+        degenerate = 0
+        for it in range(max_iter):
+            d = self.reduced_costs(cost)
+            can_inc, can_dec = self._movable()
+            score = np.maximum(np.where(can_inc, -d, 0.0), np.where(can_dec, d, 0.0))
+            if degenerate > 50:
+                # Bland's rule breaks cycling on long degenerate runs
+                cand = np.flatnonzero(score > tol)
+                if cand.size == 0:
+                    return "optimal", it
+                q = int(cand[0])
+            else:
+                q = int(np.argmax(score))
+                if score[q] <= tol:
+                    return "optimal", it
+            direction = 1.0 if (can_inc[q] and d[q] < 0.0) else -1.0
+
+            alpha = self.ftran(q)
+            g = -direction * alpha  # rate of change of x_B per unit step
+            xB = self.x[self.head]
+            lo_B, hi_B = self.lo[self.head], self.hi[self.head]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                t = np.where(
+                    g < -1e-11,
+                    (xB - lo_B) / -g,
+                    np.where(g > 1e-11, (hi_B - xB) / g, math.inf),
+                )
+            t = np.maximum(t, 0.0)
+            theta_B = float(t.min()) if t.size else math.inf
+            theta_q = float(self.hi[q] - self.lo[q])
+            theta = min(theta_B, theta_q)
+            if not math.isfinite(theta):
+                return "unbounded", it + 1
+            degenerate = degenerate + 1 if theta <= tol else 0
+
+            if theta_q <= theta_B:
+                # Bound flip: the entering variable crosses its own range
+                self.x[self.head] = xB + g * theta_q
+                self.x[q] = self.hi[q] if direction > 0 else self.lo[q]
+                continue
+            # Among near-ties prefer the largest pivot for stability
+            near = np.flatnonzero(t <= theta_B + tol)
+            r = int(near[np.argmax(np.abs(alpha[near]))])
+            theta = float(t[r])
+            leaving = self.head[r]
+            self.x[self.head] = xB + g * theta
+            self.x[leaving] = self.lo[leaving] if g[r] < 0.0 else self.hi[leaving]
+            self.x[q] += direction * theta
+            self._pivot(r, q, alpha)
+        return "iter_limit", max_iter
+
+    def primal_infeasibility(self) -> np.ndarray:
+        xB = self.x[self.head]
+        return np.maximum(self.lo[self.head] - xB, 0.0) + np.maximum(xB - self.hi[self.head], 0.0)
+
+    def dual_feasible(self, cost: np.ndarray) -> bool:
+        d = self.reduced_costs(cost)
+        can_inc, can_dec = self._movable()
+        return not np.any((can_inc & (d < -self.tol)) | (can_dec & (d > self.tol)))
+
+    def dual(self, cost: np.ndarray, max_iter: int) -> Tuple[str, int]:
+        """Dual simplex from a dual-feasible basis until primal feasible."""
+        tol = self.tol
+        for it in range(max_iter):
+            infeas = self.primal_infeasibility()
+            r = int(np.argmax(infeas)) if infeas.size else 0
+            if infeas.size == 0 or infeas[r] <= tol * (1.0 + abs(self.x[self.head[r]])):
+                return "optimal", it
+            leaving = self.head[r]
+            xr = self.x[leaving]
+            below = xr < self.lo[leaving]
+            bound = self.lo[leaving] if below else self.hi[leaving]
+
+            d = self.reduced_costs(cost)
+            row = self.A.rmatvec(self.Binv[r])
+            can_inc, can_dec = self._movable()
+            # x_Br moves by -row_j per unit increase of x_j
+            up = row < -1e-9 if below else row > 1e-9
+            dn = row > 1e-9 if below else row < -1e-9
+            elig = (can_inc & up) | (can_dec & dn)
+            cand = np.flatnonzero(elig)
+            if cand.size == 0:
+                return "infeasible", it + 1
+            ratio = np.abs(d[cand]) / np.abs(row[cand])
+            best = ratio.min()
+            near = cand[ratio <= best + tol]
+            q = int(near[np.argmax(np.abs(row[near]))])
+
+            alpha = self.ftran(q)
+            step = (xr - bound) / alpha[r]
+            self.x[self.head] -= alpha * step
+            self.x[q] += step
+            self.x[leaving] = bound
+            self._pivot(r, q, alpha)
+        return "iter_limit", max_iter
+
+
+def solve_lp_sparse(
+    c: Sequence[float] | np.ndarray,
+    A_ub: Sequence[Sequence[float]] | np.ndarray | CSCMatrix | None = None,
+    b_ub: Sequence[float] | np.ndarray | None = None,
+    A_eq: Sequence[Sequence[float]] | np.ndarray | CSCMatrix | None = None,
+    b_eq: Sequence[float] | np.ndarray | None = None,
+    bounds: Bounds = None,
+    maximize: bool = True,
+    warm_start: Dict[str, List[int]] | None = None,
+    max_iter: int | None = None,
+    tol: float = 1e-9,
+) -> Dict[str, object]:
+    """
+    Revised simplex for
+
+        max (or min) c^T x
+        s.t. A_ub x <= b_ub,  A_eq x == b_eq,  lo <= x <= hi
+
+    A_ub / A_eq: dense rows or a `CSCMatrix`.
+    bounds: None (x >= 0), one (lo, hi) pair for all variables, or one
+        pair per variable; None in a pair means unbounded on that side.
+    warm_start: the "basis" of a previous result on a problem with the same
+        shape (typically only b or c changed). A still primal-feasible
+        basis resumes the primal simplex; a basis made infeasible by a new
+        b, but still dual feasible, is repaired with the dual simplex;
+        otherwise the solver falls back to a cold start (Phase I).
+
+    Returns dict with:
+      - "status": "optimal" | "infeasible" | "unbounded" | "iter_limit"
+      - "x": structural solution list (None unless optimal / iter_limit)
+      - "slack": b_ub - A_ub x per inequality row
+      - "objective": c^T x
+      - "duals": row prices (d objective / d b) for [ub rows..., eq rows...]
+      - "iterations": total pivots and bound flips, "phases": per phase
+      - "basis": warm-start token for the next solve
+      - "warm_started": whether the supplied basis was used
+    """
+    c_arr = np.asarray(c, dtype=float).ravel()
+    n = c_arr.size
+    blocks = []
+    rhs = []
+    n_ub = 0
+    if A_ub is not None:
+        M = _as_csc(A_ub, n)
+        n_ub = M.shape[0]
+        blocks.append(M)
+        rhs.append(np.asarray(b_ub, dtype=float).ravel())
+        if rhs[-1].size != n_ub:
+            raise ValueError("b length must equal number of rows in A")
+    if A_eq is not None:
+        M = _as_csc(A_eq, n)
+        blocks.append(M)
+        rhs.append(np.asarray(b_eq, dtype=float).ravel())
+        if rhs[-1].size != M.shape[0]:
+            raise ValueError("b_eq length must equal number of rows in A_eq")
+    if not blocks:
+        blocks.append(CSCMatrix.from_dense(np.zeros((0, n))))
+        rhs.append(np.zeros(0))
+    A = blocks[0] if len(blocks) == 1 else blocks[0].vstack(blocks[1])
+    b = np.concatenate(rhs)
+    m = A.shape[0]
+    lo_x, hi_x = _bounds(bounds, n)
+
+    # Slack per row: [0, inf) for <= rows, [0, 0] for == rows
+    A_full = A.hstack(CSCMatrix(np.ones(m), np.arange(m), np.arange(m + 1), (m, m)))
+    lo = np.concatenate((lo_x, np.zeros(m)))
+    hi = np.concatenate((hi_x, np.where(np.arange(m) < n_ub, math.inf, 0.0)))
+    cost = np.concatenate((-c_arr if maximize else c_arr, np.zeros(m)))
+    n_tot = n + m
+    if max_iter is None:
+        max_iter = 1000 + 20 * (n_tot)
+    phases = {"phase1": 0, "phase2": 0, "dual": 0}
+
+    def _nonbasic_start(lo_: np.ndarray, hi_: np.ndarray) -> np.ndarray:
+        return np.where(np.isfinite(lo_), lo_, np.where(np.isfinite(hi_), hi_, 0.0))
+
+    solver = None
+    warm = False
+    status = "iter_limit"
+    if warm_start is not None:
+        head = np.asarray(warm_start.get("basis", []), dtype=np.intp)
+        if head.size == m and (m == 0 or (head.min() >= 0 and head.max() < n_tot)) and np.unique(head).size == m:
+            x = _nonbasic_start(lo, hi)
+            at_upper = np.asarray(warm_start.get("at_upper", []), dtype=np.intp)
+            at_upper = at_upper[(at_upper >= 0) & (at_upper < n_tot)]
+            x[at_upper] = np.where(np.isfinite(hi[at_upper]), hi[at_upper], x[at_upper])
+            try:
+                solver = _RevisedSimplex(A_full, b, lo, hi, head.copy(), x, tol)
+            except np.linalg.LinAlgError:
+                solver = None
+            if solver is not None:
+                feasible = not np.any(solver.primal_infeasibility() > tol * (1.0 + np.abs(b).max(initial=0.0)))
+                if feasible:
+                    warm = True
+                elif solver.dual_feasible(cost):
+                    status, phases["dual"] = solver.dual(cost, max_iter)
+                    warm = status != "iter_limit"
+                    if status == "infeasible":
+                        return _result("infeasible", None, n, n_ub, maximize, c_arr, phases, None, True)
+                if not warm:
+                    solver = None
+
+    if solver is None:
+        # Cold start: slack basis; rows whose slack would violate its bounds
+        # get an artificial column instead and Phase I drives those to zero.
+        x = np.concatenate((_nonbasic_start(lo_x, hi_x), np.zeros(m)))
+        resid = b - A.matvec(x[:n])
+        ok = (resid >= lo[n:] - tol) & (resid <= hi[n:] + tol)
+        art_rows = np.flatnonzero(~ok)
+        k = art_rows.size
+        head = np.arange(n, n + m)
+        if k:
+            sign = np.sign(resid[art_rows])
+            A_full = A_full.hstack(CSCMatrix(sign, art_rows, np.arange(k + 1), (m, k)))
+            lo = np.concatenate((lo, np.zeros(k)))
+            hi = np.concatenate((hi, np.full(k, math.inf)))
+            x = np.concatenate((x, np.zeros(k)))
+            head[art_rows] = n_tot + np.arange(k)
+        x[n:n_tot] = np.clip(resid, lo[n:n_tot], hi[n:n_tot])
+        solver = _RevisedSimplex(A_full, b, lo, hi, head, x, tol)
+        if k:
+            cost1 = np.concatenate((np.zeros(n_tot), np.ones(k)))
+            status, phases["phase1"] = solver.primal(cost1, max_iter)
+            if status == "iter_limit":
+                return _result("iter_limit", None, n, n_ub, maximize, c_arr, phases, None, False)
+            if float(solver.x[n_tot:].sum()) > tol * (1.0 + np.abs(b).max(initial=0.0)) * 10:
+                return _result("infeasible", None, n, n_ub, maximize, c_arr, phases, None, False)
+            # Pin artificials at zero; any still basic stay degenerate
+            solver.hi[n_tot:] = 0.0
+            solver.x[n_tot:] = np.where(solver.basic[n_tot:], solver.x[n_tot:], 0.0)
+            cost = np.concatenate((cost, np.zeros(k)))
+
+    left = max_iter - sum(phases.values())
+    status, phases["phase2"] = solver.primal(cost, left)
+    return _result(status, solver, n, n_ub, maximize, c_arr, phases, cost, warm)
+
+
+def _result(
+    status: str,
+    solver: _RevisedSimplex | None,
+    n: int,
+    n_ub: int,
+    maximize: bool,
+    c: np.ndarray,
+    phases: Dict[str, int],
+    cost: np.ndarray | None,
+    warm: bool,
+) -> Dict[str, object]:
+    iterations = int(sum(phases.values()))
+    if solver is None or status in ("infeasible", "unbounded"):
+        if status == "unbounded":
+            objective = math.inf if maximize else -math.inf
+        else:
+            objective = -math.inf if maximize else math.inf
+        return {
+            "status": status,
+            "x": None,
+            "slack": None,
+            "objective": objective,
+            "duals": None,
+            "iterations": iterations,
+            "phases": phases,
+            "basis": None,
+            "warm_started": warm,
+        }
+    m = solver.A.shape[0]
+    n_tot = n + m
+    x = solver.x[:n]
+    slack = solver.x[n : n + n_ub]
+    # Artificials left in the basis sit at zero in place of their row's slack
+    head = solver.head.copy()
+    art = head >= n_tot
+    if np.any(art):
+        rows = np.array([solver.A.col(j)[0][0] for j in head[art]], dtype=np.intp)
+        head[art] = n + rows
+    nonbasic = ~solver.basic[:n_tot]
+    at_upper = np.flatnonzero(nonbasic & np.isfinite(solver.hi[:n_tot]) & (solver.x[:n_tot] >= solver.hi[:n_tot]) & (solver.hi[:n_tot] > solver.lo[:n_tot]))
+    y = solver.Binv.T @ cost[solver.head]
+    duals = -y if maximize else y
+    return {
+        "status": status,
+        "x": x.tolist(),
+        "slack": slack.tolist(),
+        "objective": float(c @ x),
+        "duals": duals.tolist(),
+        "iterations": iterations,
+        "phases": phases,
+        "basis": {"basis": head.tolist(), "at_upper": at_upper.tolist()},
+        "warm_started": warm,
+    }
 
 
 def solve_lp(
     c: List[float],
     A: List[List[float]],
     b: List[float],
+    warm_start: Dict[str, List[int]] | None = None,
+    max_iter: int | None = None,
 ) -> Dict[str, object]:
     """
-    Very small dense simplex for:
+    Small LP in the original call shape:
 
         max c^T x
         s.t. A x <= b, x >= 0
 
+    Solved by `solve_lp_sparse` (revised simplex).
+
     Returns dict with:
-      - "x": primal solution list
+      - "x": primal solution list followed by the slack of each row
       - "objective": optimal value
       - "status": "optimal" | "infeasible" | "unbounded" | "iter_limit"
+      - "iterations", "basis": see `solve_lp_sparse`
     """
-    m = len(A)
     n = len(c)
     if any(len(row) != n for row in A):
         raise ValueError("All rows of A must have length len(c)")
-    if len(b) != m:
+    if len(b) != len(A):
         raise ValueError("b length must equal number of rows in A")
+    res = solve_lp_sparse(
+        c, np.asarray(A, dtype=float).reshape(len(A), n), b, warm_start=warm_start, max_iter=max_iter
+    )
+    x = None if res["x"] is None else res["x"] + res["slack"]
+    return {
+        "status": res["status"],
+        "x": x,
+        "objective": res["objective"],
+        "iterations": res["iterations"],
+        "basis": res["basis"],
+    }
 
-    # Build initial tableau with slack variables
-    # [x vars ... | slack vars ... | RHS]
-    tableau: List[List[float]] = []
-    for i in range(m):
-        row = list(A[i]) + [0.0] * m + [float(b[i])]
-        row[n + i] = 1.0  # slack i
-        tableau.append(row)
-
-    # Objective row (we maximize, simplex uses -c)
-    obj = [-ci for ci in c] + [0.0] * m + [0.0]
-
-    basis = list(range(n, n + m))  # indices of slack vars
-
-    def _pivot(piv_row: int, piv_col: int) -> None:
-        # Normalize pivot row
-        pivot = tableau[piv_row][piv_col]
-        if abs(pivot) < 1e-12:
-            raise ZeroDivisionError("Pivot too small")
-        inv = 1.0 / pivot
-        tableau[piv_row] = [v * inv for v in tableau[piv_row]]
-        # Eliminate other rows
-        for r in range(m):
-            if r == piv_row:
-                continue
-            factor = tableau[r][piv_col]
-            if abs(factor) < 1e-12:
-                continue
-            tableau[r] = [
-                tableau[r][j] - factor * tableau[piv_row][j]
-                for j in range(len(obj))
-            ]
-        # Objective
-        factor = obj[piv_col]
-        if abs(factor) >= 1e-12:
-            for j in range(len(obj)):
-                obj[j] -= factor * tableau[piv_row][j]
-
-    max_iter = 1000
-    for _ in range(max_iter):
-        # Entering variable: most negative reduced cost
-        entering = min(range(len(obj) - 1), key=lambda j: obj[j])
-        if obj[entering] >= -1e-9:
-            status = "optimal"
-            break
-
-        # Leaving variable: minimum positive ratio test
-        ratios: List[Tuple[float, int]] = []
-        for i in range(m):
-            col = tableau[i][entering]
-            if col > 1e-12:
-                ratios.append((tableau[i][-1] / col, i))
-        if not ratios:
-            return {"status": "unbounded", "x": None, "objective": float("inf")}
-
-        _, piv_row = min(ratios)
-        basis[piv_row] = entering
-        _pivot(piv_row, entering)
-    else:
-        status = "iter_limit"
 
-    # Extract solution
-    x = [0.0] * (len(obj) - 1)
-    for i, var_idx in enumerate(basis):
-        if var_idx < len(x):
-            x[var_idx] = tableau[i][-1]
-    objective = -obj[-1]  # undo sign
+def solve_lp_batch(
+    c: Sequence[Sequence[float]] | np.ndarray,
+    A: Sequence[Sequence[Sequence[float]]] | np.ndarray,
+    b: Sequence[Sequence[float]] | np.ndarray,
+    max_iter: int | None = None,
+    tol: float = 1e-9,
+) -> Dict[str, np.ndarray]:
+    """
+    Many same-shaped small LPs in the `solve_lp` form at once:
+
+        max c_k^T x  s.t.  A_k x <= b_k,  x >= 0      for k = 1..K
+
+    c: (K, n), A: (K, m, n), b: (K, m).
+
+    Problems with b_k >= 0 start feasible from the slack basis and run
+    through one dense tableau stack, every pivot applied to all still
+    active problems in a single numpy step (Dantzig pricing, smallest
+    ratio; a problem switches to Bland's rule after a long degenerate run,
+    as `solve_lp_sparse` does). Problems needing Phase I (some b_k < 0) go
+    through `solve_lp` one by one.
+
+    Returns columnar dict:
+      - "status": per problem, as in `solve_lp`
+      - "x": (K, n + m) variables then slacks; the last feasible iterate
+        for "iter_limit", nan for unbounded / infeasible
+      - "objective": (K,) c_k^T x_k (+/-inf for unbounded / infeasible)
+      - "iterations": (K,) pivots per problem
+    """
+    c = np.asarray(c, dtype=float)
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    if A.ndim != 3:
+        raise ValueError("A must be (batch, rows, cols)")
+    K, m, n = A.shape
+    if c.shape != (K, n):
+        raise ValueError("c must be (batch, cols) matching A")
+    if b.shape != (K, m):
+        raise ValueError("b must be (batch, rows) matching A")
+    if max_iter is None:
+        max_iter = 1000 + 20 * (n + m)
+
+    status = np.full(K, "iter_limit", dtype=object)
+    x = np.full((K, n + m), np.nan)
+    objective = np.full(K, np.nan)
+    iterations = np.zeros(K, dtype=np.int64)
+
+    fast = np.all(b >= 0.0, axis=1)
+    idx = np.flatnonzero(fast)
+    if idx.size:
+        k = idx.size
+        # Tableau rows 0..m-1: [A | I | b]; row m: [-c | 0 | 0]
+        T = np.zeros((k, m + 1, n + m + 1))
+        T[:, :m, :n] = A[idx]
+        T[:, np.arange(m), n + np.arange(m)] = 1.0
+        T[:, :m, -1] = b[idx]
+        T[:, m, :n] = -c[idx]
+        basis = np.tile(np.arange(n, n + m), (k, 1))
+        live = np.arange(k)
+        degenerate = np.zeros(k, dtype=np.int64)
+        for _ in range(max_iter):
+            if live.size == 0:
+                break
+            Tl = T[live]
+            d = Tl[:, m, :-1]
+            enter = np.argmin(d, axis=1)
+            # Bland's rule breaks cycling on long degenerate runs
+            bland = degenerate[live] > 50
+            if bland.any():
+                neg = d < -tol
+                enter = np.where(bland & neg.any(axis=1), np.argmax(neg, axis=1), enter)
+            rows = np.arange(live.size)
+            done = Tl[rows, m, enter] >= -tol
+            status[idx[live[done]]] = "optimal"
+
+            col = Tl[rows, :m, enter]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                ratio = np.where(col > 1e-12, Tl[:, :m, -1] / col, np.inf)
+            leave = np.argmin(ratio, axis=1)
+            if bland.any():
+                # among ratio ties the basic variable with the smallest index leaves
+                tie = ratio <= ratio[rows, leave][:, None] + tol
+                leave = np.where(bland, np.argmin(np.where(tie, basis[live], n + m), axis=1), leave)
+            unbounded = ~done & ~np.isfinite(ratio[rows, leave])
+            status[idx[live[unbounded]]] = "unbounded"
+
+            go = ~(done | unbounded)
+            theta = ratio[rows, leave][go]
+            live, Tl, enter, leave, rows = live[go], Tl[go], enter[go], leave[go], rows[: int(go.sum())]
+            if live.size == 0:
+                break
+            degenerate[live] = np.where(theta <= tol, degenerate[live] + 1, 0)
+            piv = Tl[rows, leave] / Tl[rows, leave, enter][:, None]
+            Tl -= Tl[rows, :, enter][:, :, None] * piv[:, None, :]
+            Tl[rows, leave] = piv
+            T[live] = Tl
+            basis[live, leave] = enter
+            iterations[idx[live]] += 1
+
+        opt = status[idx] == "optimal"
+        for j in np.flatnonzero(opt | (status[idx] == "iter_limit")):
+            sol = np.zeros(n + m)
+            sol[basis[j]] = T[j, :m, -1]
+            x[idx[j]] = sol
+            objective[idx[j]] = float(c[idx[j]] @ sol[:n])
+        objective[idx[status[idx] == "unbounded"]] = math.inf
+
+    for i in np.flatnonzero(~fast):
+        res = solve_lp(c[i].tolist(), A[i].tolist(), b[i].tolist(), max_iter=max_iter)
+        status[i] = res["status"]
+        iterations[i] = res["iterations"]
+        objective[i] = res["objective"]
+        if res["x"] is not None:
+            x[i] = res["x"]
 
-    return {"status": status, "x": x, "objective": objective}
+    return {
+        "status": status.astype(str),
+        "x": x,
+        "objective": objective,
+        "iterations": iterations,
+    }
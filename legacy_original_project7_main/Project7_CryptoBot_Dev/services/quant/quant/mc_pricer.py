@@ -0,0 +1,215 @@
+# mc_pricer.py
+from __future__ import annotations
+
+import math
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+
+from .black_scholes import bs_price
+from .monte_carlo import DEFAULT_CHUNK
+from .var import SeedLike, _rng
+
+PAYOFF_KINDS = (
+    "european",
+    "asian",
+    "up-and-out",
+    "up-and-in",
+    "down-and-out",
+    "down-and-in",
+)
+
+
+class Payoff:
+    """
+    A call/put payoff on one simulated path set.
+
+    kind: "european" (terminal), "asian" (arithmetic average over the
+        monitoring dates, S0 excluded) or a knock-out / knock-in barrier
+        ("up-and-out", "up-and-in", "down-and-out", "down-and-in") on a
+        European payoff, monitored discretely at the simulation steps.
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        cp: str,
+        K: float,
+        barrier: float | None = None,
+        name: str | None = None,
+    ) -> None:
+        kind = kind.lower()
+        if kind not in PAYOFF_KINDS:
+            raise ValueError(f"kind must be one of {PAYOFF_KINDS}")
+        cp = cp.lower()
+        if cp not in {"c", "call", "p", "put"}:
+            raise ValueError("cp must be 'c'/'call' or 'p'/'put'")
+        if K <= 0.0:
+            raise ValueError("K must be > 0")
+        if ("-and-" in kind) != (barrier is not None):
+            raise ValueError("barrier is required for barrier payoffs only")
+        self.kind = kind
+        self.cp = cp
+        self.K = float(K)
+        self.barrier = None if barrier is None else float(barrier)
+        self.name = name or (
+            f"{kind}_{cp[0]}_{self.K:g}" + ("" if barrier is None else f"_{self.barrier:g}")
+        )
+
+    def __call__(self, summary: Dict[str, np.ndarray]) -> np.ndarray:
+        """Undiscounted payoff per path from the pricer's path summaries."""
+        under = summary["mean"] if self.kind == "asian" else summary["terminal"]
+        if self.cp in ("c", "call"):
+            pay = np.maximum(under - self.K, 0.0)
+        else:
+            pay = np.maximum(self.K - under, 0.0)
+        if self.barrier is not None:
+            if self.kind.startswith("up"):
+                hit = summary["max"] >= self.barrier
+            else:
+                hit = summary["min"] <= self.barrier
+            pay = np.where(hit, pay, 0.0) if self.kind.endswith("in") else np.where(hit, 0.0, pay)
+        return pay
+
+
+class MCPricer:
+    """
+    Monte Carlo pricer for path-dependent payoffs on one shared path set.
+
+    Risk-neutral GBM paths (drift r - q) are simulated once, in chunks, and
+    reduced to per-path summaries (terminal, arithmetic mean, running max
+    and min), so memory is O(paths) whatever the number of steps and every
+    payoff / strike reuses the same draws.
+
+    Variance reduction:
+      - antithetic: paths come in (z, -z) pairs; statistics are computed on
+        pair averages so the reported standard error is honest.
+      - control variate: each payoff is regressed on a payoff with a
+        closed-form `bs_price` value and the same cp and K: the European
+        for European / barrier payoffs, and the discretely monitored
+        geometric-average option (lognormal, so Black–Scholes with adjusted
+        vol and carry) for Asian payoffs.
+    """
+
+    def __init__(
+        self,
+        S0: float,
+        r: float,
+        sigma: float,
+        T: float,
+        steps: int = 64,
+        paths: int = 50_000,
+        q: float = 0.0,
+        seed: SeedLike = None,
+        antithetic: bool = True,
+        chunk: int = DEFAULT_CHUNK,
+    ) -> None:
+        if S0 <= 0.0:
+            raise ValueError("S0 must be > 0")
+        if sigma < 0.0:
+            raise ValueError("sigma must be >= 0")
+        if T <= 0.0:
+            raise ValueError("T must be > 0")
+        if steps <= 0 or paths <= 1:
+            raise ValueError("steps must be > 0 and paths > 1")
+        self.S0 = float(S0)
+        self.r = float(r)
+        self.sigma = float(sigma)
+        self.T = float(T)
+        self.q = float(q)
+        self.steps = int(steps)
+        self.antithetic = antithetic
+        self.paths = 2 * ((paths + 1) // 2) if antithetic else int(paths)
+        self._rng = _rng(seed)
+        self._chunk = chunk
+        self._summary: Dict[str, np.ndarray] | None = None
+
+    def _simulate(self) -> Dict[str, np.ndarray]:
+        dt = self.T / self.steps
+        drift = (self.r - self.q - 0.5 * self.sigma * self.sigma) * dt
+        vol = self.sigma * math.sqrt(dt)
+        n_draw = self.paths // 2 if self.antithetic else self.paths
+        out = {k: np.empty(self.paths) for k in ("terminal", "mean", "gmean", "max", "min")}
+        rows = max(1, self._chunk // self.steps)
+        signs = (1.0, -1.0) if self.antithetic else (1.0,)
+        for start in range(0, n_draw, rows):
+            n = min(rows, n_draw - start)
+            z = self._rng.standard_normal((n, self.steps))
+            for j, sgn in enumerate(signs):
+                s = self.S0 * np.exp(np.cumsum(drift + sgn * vol * z, axis=1))
+                lo = start + j * n_draw
+                sl = slice(lo, lo + n)
+                out["terminal"][sl] = s[:, -1]
+                out["mean"][sl] = s.mean(axis=1)
+                out["gmean"][sl] = np.exp(np.log(s).mean(axis=1))
+                out["max"][sl] = np.maximum(s.max(axis=1), self.S0)
+                out["min"][sl] = np.minimum(s.min(axis=1), self.S0)
+        return out
+
+    def summary(self) -> Dict[str, np.ndarray]:
+        """Per-path terminal / mean / gmean / max / min; simulated on first use."""
+        if self._summary is None:
+            self._summary = self._simulate()
+        return self._summary
+
+    def _pairs(self, x: np.ndarray) -> np.ndarray:
+        if not self.antithetic:
+            return x
+        h = self.paths // 2
+        return 0.5 * (x[:h] + x[h:])
+
+    def _control(self, p: Payoff, summ: Dict[str, np.ndarray]) -> Tuple[np.ndarray, float]:
+        """Undiscounted control payoff per path and its exact price."""
+        if p.kind != "asian":
+            exact = bs_price(p.cp, self.S0, p.K, self.T, self.r, self.sigma, self.q)
+            return Payoff("european", p.cp, p.K)(summ), exact
+        # ln G ~ N(ln S0 + nu dt (n+1)/2, sigma^2 dt (n+1)(2n+1)/(6n))
+        n = self.steps
+        dt = self.T / n
+        nu = self.r - self.q - 0.5 * self.sigma * self.sigma
+        var = self.sigma * self.sigma * dt * (n + 1) * (2 * n + 1) / (6.0 * n)
+        carry = (nu * dt * (n + 1) / 2.0 + 0.5 * var) / self.T
+        exact = bs_price(p.cp, self.S0, p.K, self.T, self.r, math.sqrt(var / self.T), self.r - carry)
+        g = summ["gmean"]
+        pay = np.maximum(g - p.K, 0.0) if p.cp in ("c", "call") else np.maximum(p.K - g, 0.0)
+        return pay, exact
+
+    def price(
+        self,
+        payoffs: Iterable[Payoff],
+        control: bool = True,
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Price several payoffs on the shared path set.
+
+        Returns {payoff.name: {"price", "stderr", "price_plain",
+        "stderr_plain", "beta"}}, where *_plain is the estimate without the
+        control variate and beta is the fitted control coefficient.
+        """
+        summ = self.summary()
+        disc = math.exp(-self.r * self.T)
+        out: Dict[str, Dict[str, float]] = {}
+        for p in payoffs:
+            y = self._pairs(disc * p(summ))
+            n = y.size
+            plain = float(y.mean())
+            se_plain = float(y.std(ddof=1) / math.sqrt(n))
+            price, se, beta = plain, se_plain, 0.0
+            if control:
+                x, exact = self._control(p, summ)
+                x = self._pairs(disc * x)
+                xc = x - x.mean()
+                var_x = float(xc @ xc)
+                if var_x > 0.0:
+                    beta = float((y - plain) @ xc) / var_x
+                adj = y - beta * (x - exact)
+                price = float(adj.mean())
+                se = float(adj.std(ddof=1) / math.sqrt(n))
+            out[p.name] = {
+                "price": price,
+                "stderr": se,
+                "price_plain": plain,
+                "stderr_plain": se_plain,
+                "beta": beta,
+            }
+        return out
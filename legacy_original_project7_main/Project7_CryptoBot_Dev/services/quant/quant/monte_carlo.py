@@ -2,8 +2,14 @@
 from __future__ import annotations
 
 import math
-import random
-from typing import List
+from typing import Iterator, List
+
+import numpy as np
+
+from .var import SeedLike, _rng
+
+# Default chunk size, in normal draws (8 MB of float64 per chunk)
+DEFAULT_CHUNK = 1 << 20
 
 
 class GBMSimulator:
@@ -11,6 +17,15 @@ class GBMSimulator:
     Simple geometric Brownian motion simulator.
 
     dS_t = mu S_t dt + sigma S_t dW_t
+
+    Paths are generated as (paths x steps) matrices in chunks of at most
+    `chunk` normal draws. Draws are consumed path by path (row-major), so a
+    chunked run and a single full-size run with the same seed produce the
+    same numbers. Arithmetic is float64; dtype=np.float32 only narrows the
+    output, so both dtypes see the same random stream.
+
+    seed on the generating methods overrides the simulator's own stream
+    for that call; without it calls continue the shared stream.
     """
 
     def __init__(
@@ -19,7 +34,7 @@ class GBMSimulator:
         mu: float,
         sigma: float,
         dt: float = 1.0 / 252.0,
-        seed: int | None = None,
+        seed: SeedLike = None,
     ) -> None:
         if sigma < 0.0:
             raise ValueError("sigma must be >= 0")
@@ -29,33 +44,83 @@ class GBMSimulator:
         self.mu = float(mu)
         self.sigma = float(sigma)
         self.dt = float(dt)
-        self.rng = random.Random(seed)
+        self.rng = _rng(seed)
+        self._drift = (self.mu - 0.5 * self.sigma * self.sigma) * self.dt
+        self._vol = self.sigma * math.sqrt(self.dt)
+
+    def _chunk_rows(self, width: int, chunk: int) -> int:
+        if chunk <= 0:
+            raise ValueError("chunk must be > 0")
+        return max(1, chunk // max(width, 1))
 
-    def _step(self, S: float) -> float:
-        z = self.rng.normalvariate(0.0, 1.0)
-        drift = (self.mu - 0.5 * self.sigma * self.sigma) * self.dt
-        diff = self.sigma * math.sqrt(self.dt) * z
-        return S * math.exp(drift + diff)
+    def iter_paths(
+        self,
+        paths: int,
+        steps: int,
+        chunk: int = DEFAULT_CHUNK,
+        dtype: type = np.float64,
+        seed: SeedLike = None,
+    ) -> Iterator[np.ndarray]:
+        """
+        Yield blocks of full paths, each (rows x steps) including S0 in
+        column 0, until `paths` rows have been produced.
+        """
+        if steps <= 0 or paths <= 0:
+            raise ValueError("steps and paths must be > 0")
+        rng = self.rng if seed is None else _rng(seed)
+        rows = self._chunk_rows(steps - 1, chunk)
+        for start in range(0, paths, rows):
+            n = min(rows, paths - start)
+            out = np.empty((n, steps))
+            out[:, 0] = self.S0
+            if steps > 1:
+                z = rng.standard_normal((n, steps - 1))
+                np.cumsum(self._drift + self._vol * z, axis=1, out=out[:, 1:])
+                np.exp(out[:, 1:], out=out[:, 1:])
+                out[:, 1:] *= self.S0
+            yield out.astype(dtype, copy=False)
+
+    def iter_terminal(
+        self,
+        horizon_steps: int,
+        paths: int,
+        chunk: int = DEFAULT_CHUNK,
+        dtype: type = np.float64,
+        seed: SeedLike = None,
+    ) -> Iterator[np.ndarray]:
+        """
+        Yield blocks of terminal values after horizon_steps without keeping
+        the paths; peak memory is one chunk regardless of `paths`.
+        """
+        if horizon_steps <= 0 or paths <= 0:
+            raise ValueError("horizon_steps and paths must be > 0")
+        rng = self.rng if seed is None else _rng(seed)
+        rows = self._chunk_rows(horizon_steps, chunk)
+        drift = horizon_steps * self._drift
+        for start in range(0, paths, rows):
+            n = min(rows, paths - start)
+            zsum = rng.standard_normal((n, horizon_steps)).sum(axis=1)
+            yield (self.S0 * np.exp(drift + self._vol * zsum)).astype(dtype, copy=False)
+
+    def path_matrix(
+        self,
+        paths: int,
+        steps: int,
+        chunk: int = DEFAULT_CHUNK,
+        dtype: type = np.float64,
+        seed: SeedLike = None,
+    ) -> np.ndarray:
+        """(paths x steps) matrix of GBM paths (column 0 is S0)."""
+        return np.concatenate(list(self.iter_paths(paths, steps, chunk, dtype, seed)))
 
     def path(self, steps: int) -> List[float]:
         """One GBM path with given number of steps (including S0)."""
         if steps <= 0:
             raise ValueError("steps must be > 0")
-        S = self.S0
-        out = [S]
-        for _ in range(steps - 1):
-            S = self._step(S)
-            out.append(S)
-        return out
+        return self.path_matrix(1, steps)[0].tolist()
 
     def terminal(self, horizon_steps: int, paths: int) -> List[float]:
         """Terminal values after horizon_steps for multiple paths."""
         if horizon_steps <= 0 or paths <= 0:
             raise ValueError("horizon_steps and paths must be > 0")
-        out: List[float] = []
-        for _ in range(paths):
-            S = self.S0
-            for _ in range(horizon_steps):
-                S = self._step(S)
-            out.append(S)
-        return out
+        return np.concatenate(list(self.iter_terminal(horizon_steps, paths))).tolist()
@@ -0,0 +1,310 @@
+# parallel.py
+"""
+Process-parallel Monte Carlo with reproducible, independent RNG streams.
+
+Work is cut into a fixed number of blocks (independent of the worker
+count). Block i draws from the i-th child of one master
+`np.random.SeedSequence`, so streams are statistically independent and a
+given (seed, paths, blocks) triple yields the same numbers on 1 or 64
+workers. Workers return per-block (n, mean, M2), merged with Chan's
+pairwise formula, plus bounded summaries for the quantiles:
+
+- tail levels, whose order statistic lies within k = min(MAX_TAIL_K,
+  TAIL_FRACTION * paths) of either end, are exact: each block sends its k
+  most extreme samples and the k extremes of the union are among them;
+- interior levels come from a fixed-bin histogram (HIST_BINS bins over
+  +/- HIST_SIGMAS model standard deviations, in log space for GBM), exact
+  to one bin width.
+
+So a block never sends back more than k + HIST_BINS numbers, whatever
+the path count.
+"""
+from __future__ import annotations
+
+import math
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+from .monte_carlo import DEFAULT_CHUNK, GBMSimulator
+from .var import _tail_index
+
+MAX_TAIL_K = 100_000
+TAIL_FRACTION = 0.1
+HIST_BINS = 8192
+HIST_SIGMAS = 10.0
+
+# (n, mean, M2, k_lo lowest, k_hi highest, histogram counts incl. under/overflow)
+_Partial = Tuple[int, float, float, np.ndarray, np.ndarray, np.ndarray]
+
+
+def _normal_chunks(
+    rng: np.random.Generator, n: int, chunk: int, mu_h: float, sig_h: float
+) -> Iterator[np.ndarray]:
+    for start in range(0, n, chunk):
+        yield mu_h + sig_h * rng.standard_normal(min(chunk, n - start))
+
+
+def _gbm_chunks(
+    rng: np.random.Generator,
+    n: int,
+    chunk: int,
+    S0: float,
+    mu: float,
+    sigma: float,
+    dt: float,
+    horizon_steps: int,
+) -> Iterator[np.ndarray]:
+    sim = GBMSimulator(S0, mu, sigma, dt, seed=rng)
+    return sim.iter_terminal(horizon_steps, n, chunk=chunk)
+
+
+_SAMPLERS: Dict[str, Callable[..., Iterator[np.ndarray]]] = {
+    "normal": _normal_chunks,
+    "gbm": _gbm_chunks,
+}
+
+
+def _normal_space(mu_h: float, sig_h: float) -> Tuple[bool, float, float]:
+    return False, mu_h, sig_h
+
+
+def _gbm_space(S0: float, mu: float, sigma: float, dt: float, horizon_steps: int) -> Tuple[bool, float, float]:
+    # log S_T is normal with this centre and scale
+    return True, math.log(S0) + (mu - 0.5 * sigma * sigma) * dt * horizon_steps, sigma * math.sqrt(dt * horizon_steps)
+
+
+# per sampler: (histogram in log space?, centre, scale) of the model distribution
+_SPACES: Dict[str, Callable[..., Tuple[bool, float, float]]] = {
+    "normal": _normal_space,
+    "gbm": _gbm_space,
+}
+
+
+def _hist_edges(sampler: str, args: tuple) -> Tuple[bool, np.ndarray]:
+    log, centre, scale = _SPACES[sampler](*args)
+    half = HIST_SIGMAS * max(scale, 1e-12 * max(1.0, abs(centre)))
+    return log, np.linspace(centre - half, centre + half, HIST_BINS + 1)
+
+
+def _merge_moments(a: Tuple[int, float, float], b: Tuple[int, float, float]) -> Tuple[int, float, float]:
+    """Chan et al. pairwise update of (n, mean, M2)."""
+    na, ma, m2a = a
+    nb, mb, m2b = b
+    if na == 0:
+        return b
+    if nb == 0:
+        return a
+    n = na + nb
+    d = mb - ma
+    return n, ma + d * nb / n, m2a + m2b + d * d * na * nb / n
+
+
+def _keep(prev: np.ndarray, x: np.ndarray, k: int, lowest: bool) -> np.ndarray:
+    x = np.concatenate((prev, x))
+    if x.size > k:
+        x = np.partition(x, k - 1)[:k] if lowest else np.partition(x, x.size - k)[x.size - k :]
+    return x
+
+
+def _run_block(
+    sampler: str,
+    args: tuple,
+    seed: np.random.SeedSequence,
+    n: int,
+    k_lo: int,
+    k_hi: int,
+    chunk: int,
+    hist: bool,
+) -> _Partial:
+    """One block: (n, mean, M2), the k_lo / k_hi extremes and, if asked, the histogram."""
+    rng = np.random.default_rng(seed)
+    moments = (0, 0.0, 0.0)
+    lo = np.empty(0)
+    hi = np.empty(0)
+    log, edges = _hist_edges(sampler, args)
+    counts = np.zeros(HIST_BINS + 2, dtype=np.int64)
+    for x in _SAMPLERS[sampler](rng, n, chunk, *args):
+        x = np.asarray(x, dtype=float)
+        m = float(x.mean())
+        moments = _merge_moments(moments, (x.size, m, float(np.dot(x - m, x - m))))
+        if k_lo:
+            lo = _keep(lo, x, k_lo, True)
+        if k_hi:
+            hi = _keep(hi, x, k_hi, False)
+        if hist:
+            # bin 0 = underflow, HIST_BINS + 1 = overflow
+            counts += np.bincount(np.searchsorted(edges, np.log(x) if log else x, side="right"),
+                                  minlength=HIST_BINS + 2)
+    return moments[0], moments[1], moments[2], np.sort(lo), np.sort(hi), counts if hist else counts[:0]
+
+
+def _run(
+    sampler: str,
+    args: tuple,
+    paths: int,
+    levels: Sequence[float],
+    seed: int | None,
+    workers: int | None,
+    blocks: int,
+    chunk: int,
+) -> Dict[str, object]:
+    if paths <= 0:
+        raise ValueError("paths must be > 0")
+    if blocks <= 0:
+        raise ValueError("blocks must be > 0")
+    for q in levels:
+        if not (0.0 < q < 1.0):
+            raise ValueError("quantile levels must be in (0,1)")
+    blocks = min(blocks, paths)
+    master = np.random.SeedSequence(seed)
+    children = master.spawn(blocks)
+    sizes = [paths // blocks + (1 if i < paths % blocks else 0) for i in range(blocks)]
+
+    # Order-statistic index per level; tail levels need this many extremes of the union
+    idx = [_tail_index(1.0 - q, paths) for q in levels]
+    cap = min(MAX_TAIL_K, max(1, int(TAIL_FRACTION * paths)))
+    need = [i + 1 if i < paths // 2 else paths - i for i in idx]
+    exact = [k <= cap for k in need]
+    k_lo = max([k for i, k, e in zip(idx, need, exact) if e and i < paths // 2], default=0)
+    k_hi = max([k for i, k, e in zip(idx, need, exact) if e and i >= paths // 2], default=0)
+    hist = not all(exact)
+
+    jobs = [(sampler, args, children[i], sizes[i], min(k_lo, sizes[i]), min(k_hi, sizes[i]), chunk, hist)
+            for i in range(blocks)]
+    if workers == 1:
+        parts: List[_Partial] = [_run_block(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_run_block, *zip(*jobs)))
+
+    # Merge in block order so the result never depends on scheduling
+    moments = (0, 0.0, 0.0)
+    for p in parts:
+        moments = _merge_moments(moments, p[:3])
+    _, mean, m2 = moments
+    var = m2 / (paths - 1) if paths > 1 else 0.0
+    lo = np.sort(np.concatenate([p[3] for p in parts]))[:k_lo]
+    hi = np.sort(np.concatenate([p[4] for p in parts]))[::-1][:k_hi]
+    log, edges = _hist_edges(sampler, args)
+    return {
+        "mean": mean,
+        "std": math.sqrt(var),
+        "idx": idx,
+        "exact": exact,
+        "lo": lo,
+        "hi": hi,
+        "counts": np.sum([p[5] for p in parts], axis=0) if hist else None,
+        "edges": edges,
+        "log": log,
+        "paths": paths,
+        "blocks": blocks,
+        "seed": master.entropy,
+    }
+
+
+def _hist_quantile(res: Dict[str, object], i: int) -> float:
+    """Order statistic i from the merged histogram, interpolated within its bin."""
+    counts = res["counts"]
+    edges = res["edges"]
+    cum = np.cumsum(counts)
+    b = int(np.searchsorted(cum, i, side="right"))  # bin holding the (i+1)-th smallest
+    b = min(max(b, 1), HIST_BINS)  # under/overflow: clamp to the range ends
+    before = cum[b] - counts[b]
+    frac = (i + 0.5 - before) / counts[b] if counts[b] else 0.5
+    x = edges[b - 1] + min(max(frac, 0.0), 1.0) * (edges[b] - edges[b - 1])
+    return float(math.exp(x) if res["log"] else x)
+
+
+def _quantile(res: Dict[str, object], i: int, exact: bool = True) -> float:
+    paths = int(res["paths"])
+    if not exact:
+        return _hist_quantile(res, i)
+    if i < paths // 2:
+        return float(res["lo"][i])
+    return float(res["hi"][paths - 1 - i])
+
+
+def parallel_monte_carlo_var(
+    mu: float,
+    sigma: float,
+    alpha: float = 0.95,
+    horizon: float = 1.0,
+    paths: int = 1_000_000,
+    seed: int | None = None,
+    workers: int | None = None,
+    blocks: int = 64,
+    chunk: int = DEFAULT_CHUNK,
+) -> Dict[str, float]:
+    """
+    Gaussian Monte Carlo VaR / ES (the `monte_carlo_var` model) spread over
+    a process pool.
+
+    workers: pool size (None = os.cpu_count(), 1 = run in-process).
+    blocks: number of independent RNG streams; keep it fixed to reproduce
+        results across machines.
+    seed: master seed; when None, fresh entropy is drawn and reported
+        back as "seed" so the run can be repeated.
+
+    The loss tail must be exact (see module docstring): 1 - alpha may
+    cover at most min(MAX_TAIL_K, TAIL_FRACTION * paths) paths.
+
+    Returns dict with VaR, ES, mean, std, paths, seed.
+    """
+    if sigma < 0.0:
+        raise ValueError("sigma must be >= 0")
+    if not (0.0 < alpha < 1.0):
+        raise ValueError("alpha must be in (0,1)")
+    args = (mu * horizon, sigma * math.sqrt(horizon))
+    res = _run("normal", args, paths, [1.0 - alpha], seed, workers, blocks, chunk)
+    if not res["exact"][0]:
+        raise ValueError(f"1 - alpha must cover at most min({MAX_TAIL_K}, {TAIL_FRACTION} * paths) paths")
+    i = res["idx"][0]
+    return {
+        "VaR": -_quantile(res, i),
+        "ES": -float(res["lo"][: i + 1].mean()),
+        "mean": res["mean"],
+        "std": res["std"],
+        "paths": paths,
+        "seed": res["seed"],
+    }
+
+
+def parallel_gbm_terminal(
+    S0: float,
+    mu: float,
+    sigma: float,
+    horizon_steps: int,
+    paths: int = 1_000_000,
+    quantiles: Sequence[float] = (0.01, 0.05, 0.95, 0.99),
+    dt: float = 1.0 / 252.0,
+    seed: int | None = None,
+    workers: int | None = None,
+    blocks: int = 64,
+    chunk: int = DEFAULT_CHUNK,
+) -> Dict[str, object]:
+    """
+    Terminal-price statistics of `GBMSimulator` paths over a process pool.
+
+    Same worker / block / seed semantics as `parallel_monte_carlo_var`.
+    Tail quantiles are exact order statistics; interior ones (e.g. 0.5)
+    come from the log-space histogram, to within one bin.
+    Returns dict with mean, std, quantiles ({level: value}), paths, seed.
+    """
+    if horizon_steps <= 0:
+        raise ValueError("horizon_steps must be > 0")
+    if sigma < 0.0:
+        raise ValueError("sigma must be >= 0")
+    if dt <= 0.0:
+        raise ValueError("dt must be > 0")
+    levels = [float(q) for q in quantiles]
+    args = (float(S0), float(mu), float(sigma), float(dt), int(horizon_steps))
+    res = _run("gbm", args, paths, levels, seed, workers, blocks, chunk)
+    return {
+        "mean": res["mean"],
+        "std": res["std"],
+        "quantiles": {q: _quantile(res, i, e) for q, i, e in zip(levels, res["idx"], res["exact"])},
+        "paths": paths,
+        "seed": res["seed"],
+    }
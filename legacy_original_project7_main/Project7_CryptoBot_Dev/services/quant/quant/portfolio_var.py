@@ -0,0 +1,210 @@
+# portfolio_var.py
+from __future__ import annotations
+
+import math
+from typing import Dict, Sequence
+
+import numpy as np
+
+from .normal import norm_pdf, norm_ppf
+from .var import SeedLike, _rng, _tail_index
+
+
+def _factor(cov: np.ndarray) -> np.ndarray:
+    """
+    A factor L with L @ L.T == cov: the lower-triangular Cholesky factor
+    when cov is positive definite, else V * sqrt(clip(lambda, 0)) from the
+    eigendecomposition, which is not triangular (sample covariances of
+    short histories are often only semi-definite).
+    """
+    try:
+        return np.linalg.cholesky(cov)
+    except np.linalg.LinAlgError:
+        vals, vecs = np.linalg.eigh(cov)
+        return vecs * np.sqrt(np.clip(vals, 0.0, None))
+
+
+class PortfolioVaR:
+    """
+    Multi-asset Monte Carlo VaR / ES with Euler (component) allocation.
+
+    Returns are Gaussian with mean vector mu and covariance cov per unit of
+    time. The covariance is factorized once per version and the correlated
+    scenario matrix (paths x assets) is cached against that version, so
+    `evaluate` with new positions only re-prices existing scenarios. The
+    standard normal draws are kept across versions (common random numbers),
+    so a covariance update costs one matrix product, not a redraw.
+
+    positions are exposures in currency units; PnL of a scenario is
+    scenario_returns @ positions.
+    """
+
+    def __init__(
+        self,
+        cov: Sequence[Sequence[float]] | np.ndarray | None = None,
+        mu: Sequence[float] | np.ndarray | None = None,
+        returns: Sequence[Sequence[float]] | np.ndarray | None = None,
+        paths: int = 20000,
+        horizon: float = 1.0,
+        seed: SeedLike = None,
+        antithetic: bool = True,
+    ) -> None:
+        if paths <= 1:
+            raise ValueError("paths must be > 1")
+        if horizon <= 0.0:
+            raise ValueError("horizon must be > 0")
+        self.paths = int(paths)
+        self.horizon = float(horizon)
+        self.antithetic = antithetic
+        self._rng = _rng(seed)
+        self._z: np.ndarray | None = None
+        self._version = 0
+        self._cov: np.ndarray | None = None
+        self._mu: np.ndarray | None = None
+        self._factor: np.ndarray | None = None
+        self._scenarios: np.ndarray | None = None
+        self._scenario_version = -1
+        if returns is not None:
+            self.fit(returns)
+        elif cov is not None:
+            self.set_covariance(cov, mu)
+
+    @property
+    def version(self) -> int:
+        """Bumped on every covariance / mean update."""
+        return self._version
+
+    @property
+    def n_assets(self) -> int:
+        return 0 if self._cov is None else self._cov.shape[0]
+
+    def set_covariance(
+        self,
+        cov: Sequence[Sequence[float]] | np.ndarray,
+        mu: Sequence[float] | np.ndarray | None = None,
+    ) -> int:
+        """Install a new covariance (and optional mean); returns the new version."""
+        cov = np.array(cov, dtype=float)
+        if cov.ndim != 2 or cov.shape[0] != cov.shape[1]:
+            raise ValueError("cov must be a square matrix")
+        if not np.allclose(cov, cov.T):
+            raise ValueError("cov must be symmetric")
+        n = cov.shape[0]
+        mu_arr = np.zeros(n) if mu is None else np.array(mu, dtype=float)
+        if mu_arr.shape != (n,):
+            raise ValueError("mu length must match cov")
+        self._cov = cov
+        self._mu = mu_arr
+        self._factor = _factor(cov)
+        self._version += 1
+        return self._version
+
+    def fit(self, returns: Sequence[Sequence[float]] | np.ndarray) -> int:
+        """Estimate mu and cov from a (observations x assets) return history."""
+        r = np.asarray(returns, dtype=float)
+        if r.ndim != 2 or r.shape[0] < 2:
+            raise ValueError("returns must be 2-D with at least 2 observations")
+        return self.set_covariance(np.cov(r, rowvar=False).reshape(r.shape[1], r.shape[1]), r.mean(axis=0))
+
+    def _normals(self, n: int) -> np.ndarray:
+        if self._z is None or self._z.shape[1] != n:
+            if self.antithetic:
+                half = self._rng.standard_normal(((self.paths + 1) // 2, n))
+                self._z = np.concatenate((half, -half))[: self.paths]
+            else:
+                self._z = self._rng.standard_normal((self.paths, n))
+        return self._z
+
+    def scenarios(self) -> np.ndarray:
+        """Correlated horizon returns (paths x assets) for the current version."""
+        if self._cov is None:
+            raise ValueError("no covariance set; call set_covariance or fit")
+        if self._scenario_version != self._version:
+            z = self._normals(self.n_assets)
+            h = self.horizon
+            self._scenarios = self._mu * h + (z @ self._factor.T) * math.sqrt(h)
+            self._scenario_version = self._version
+        return self._scenarios
+
+    def evaluate(
+        self,
+        positions: Sequence[float] | np.ndarray,
+        alpha: float = 0.95,
+        method: str = "mc",
+    ) -> Dict[str, object]:
+        """
+        Total, component and marginal VaR / ES for a position vector.
+
+        method: "mc" uses the cached scenarios; "parametric" uses the
+            delta-normal closed form on the same (mu, cov).
+        Components sum to the totals (Euler allocation); marginal values
+        are per unit of exposure.
+
+        Returns dict with VaR, ES, component_VaR, component_ES,
+        marginal_VaR, marginal_ES (arrays per position) and version.
+        """
+        if not (0.0 < alpha < 1.0):
+            raise ValueError("alpha must be in (0,1)")
+        w = np.asarray(positions, dtype=float)
+        if self._cov is None:
+            raise ValueError("no covariance set; call set_covariance or fit")
+        if w.shape != (self.n_assets,):
+            raise ValueError("positions length must match number of assets")
+        if method == "mc":
+            out = self._evaluate_mc(w, alpha)
+        elif method == "parametric":
+            out = self._evaluate_parametric(w, alpha)
+        else:
+            raise ValueError("method must be 'mc' or 'parametric'")
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out["marginal_VaR"] = np.where(w != 0.0, out["component_VaR"] / w, 0.0)
+            out["marginal_ES"] = np.where(w != 0.0, out["component_ES"] / w, 0.0)
+        out["version"] = self._version
+        return out
+
+    def _evaluate_mc(self, w: np.ndarray, alpha: float) -> Dict[str, object]:
+        s = self.scenarios()
+        pnl = s @ w
+        n = pnl.shape[0]
+        k = _tail_index(alpha, n)
+        order = np.argpartition(pnl, k)
+        tail = order[: k + 1]
+        var = -pnl[order[k]]
+        es = -pnl[tail].mean()
+        comp_es = -(s[tail] * w).mean(axis=0)
+
+        # Component VaR: average position PnL over scenarios ranked near the
+        # VaR order statistic, rescaled so the components add up to VaR.
+        band = max(1, int(0.005 * n))
+        lo, hi = max(0, k - band), min(n - 1, k + band)
+        near = np.argpartition(pnl, (lo, hi))[lo : hi + 1]
+        comp_var = -(s[near] * w).mean(axis=0)
+        total = comp_var.sum()
+        if total != 0.0:
+            comp_var *= var / total
+        return {
+            "VaR": float(var),
+            "ES": float(es),
+            "component_VaR": comp_var,
+            "component_ES": comp_es,
+        }
+
+    def _evaluate_parametric(self, w: np.ndarray, alpha: float) -> Dict[str, object]:
+        h = self.horizon
+        z = norm_ppf(1.0 - alpha)
+        cov_w = self._cov @ w
+        sig = math.sqrt(max(float(w @ cov_w), 0.0)) * math.sqrt(h)
+        mu_h = self._mu * h
+        pdf = norm_pdf(z)
+        if sig > 0.0:
+            beta = cov_w * h / sig
+        else:
+            beta = np.zeros_like(w)
+        comp_var = -w * (mu_h + z * beta)
+        comp_es = -w * (mu_h - beta * pdf / (1.0 - alpha))
+        return {
+            "VaR": float(comp_var.sum()),
+            "ES": float(comp_es.sum()),
+            "component_VaR": comp_var,
+            "component_ES": comp_es,
+        }
@@ -4,19 +4,16 @@ from __future__ import annotations
 
 import argparse
 import json
-from typing import List
+import math
+import os
+import sys
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
 
-from .black_scholes import bs_price, bs_greeks
-from .kelly import kelly_fraction, kelly_optimal_fraction
-from .var import (
-    historical_var,
-    cvar_historical,
-    parametric_var,
-    cvar_parametric,
-    cornish_fisher_var,
-    monte_carlo_var,
-)
-from .lp import solve_lp
+# Heavy imports (numpy and the solver modules) happen inside the command
+# handlers, so `--help` and single small commands start fast.
+
+Request = Dict[str, Any]
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -54,9 +51,18 @@ def build_parser() -> argparse.ArgumentParser:
     hv.add_argument(
         "returns",
         type=float,
-        nargs="+",
+        nargs="*",
         help="Series of returns (space separated)",
     )
+    hv.add_argument(
+        "--returns-file",
+        help="Read returns from a .npy file or a CSV column instead of argv",
+    )
+    hv.add_argument(
+        "--column",
+        default=None,
+        help="CSV column (name or 0-based index) for --returns-file; default first",
+    )
 
     # Parametric VaR
     pv = sub.add_parser("var_param", help="Gaussian parametric VaR/CVaR")
@@ -81,82 +87,353 @@ def build_parser() -> argparse.ArgumentParser:
     mv.add_argument("alpha", type=float, nargs="?", default=0.95)
     mv.add_argument("--horizon", type=float, default=1.0)
     mv.add_argument("--paths", type=int, default=10000)
+    mv.add_argument("--seed", type=int, default=None, help="RNG seed")
+    mv.add_argument(
+        "--sampling",
+        choices=["pseudo", "antithetic", "sobol"],
+        default="pseudo",
+        help="Sampling scheme (variance reduction)",
+    )
+    mv.add_argument(
+        "--ci-width",
+        type=float,
+        default=None,
+        help="Stop early once the VaR confidence interval is this narrow",
+    )
 
     # LP solver
     lp = sub.add_parser("lp", help="Solve tiny LP: max c^T x, s.t. A x <= b, x>=0")
-    lp.add_argument("c", type=float, nargs="+", help="Objective coefficients")
-    lp.add_argument("--A", type=float, nargs="+", required=True, help="Row-major A")
-    lp.add_argument("--rows", type=int, required=True, help="Number of rows of A")
-    lp.add_argument("--b", type=float, nargs="+", required=True, help="RHS vector")
+    lp.add_argument("c", type=float, nargs="*", help="Objective coefficients")
+    lp.add_argument("--A", type=float, nargs="+", help="Row-major A")
+    lp.add_argument("--rows", type=int, help="Number of rows of A")
+    lp.add_argument("--b", type=float, nargs="+", help="RHS vector")
+    lp.add_argument(
+        "--jsonl",
+        help='File with one {"c": [...], "A": [[...]], "b": [...]} problem per line; '
+        "same-shaped problems are solved as one batch, results printed as JSONL",
+    )
+
+    # Batch / streaming
+    bt = sub.add_parser(
+        "batch",
+        help="Run many requests from JSONL, streaming JSONL results in input order",
+        description=(
+            'Each input line is a JSON object with "cmd" (bs, kelly, var_hist, '
+            "var_param, var_cf, var_mc, lp) and the same fields as the "
+            'subcommand\'s arguments (e.g. {"cmd": "bs", "cp": "c", "S": 100, '
+            '"K": 100, "T": 1, "r": 0, "sigma": 0.2}). var_hist also accepts '
+            '"returns_file" (.npy or CSV) and "column". An optional "id" is '
+            'echoed back. Each output line is {"id", "ok", "result"} or '
+            '{"id", "ok": false, "error"}.'
+        ),
+    )
+    bt.add_argument("input", nargs="?", default="-", help="JSONL file, or - for stdin")
+    bt.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPU count; 1 = in-process)",
+    )
+    bt.add_argument(
+        "--chunk",
+        type=int,
+        default=64,
+        help="Requests per task sent to a worker",
+    )
 
     return p
 
 
-def main(argv: List[str] | None = None) -> None:
-    parser = build_parser()
-    args = parser.parse_args(argv)
+def load_series(path: str, column: str | int | None = None):
+    """
+    Numeric series from a .npy file (memory-mapped) or one CSV column.
+    A non-numeric first CSV row is taken as a header, so column can be a
+    name or a 0-based index.
+    """
+    import numpy as np
 
-    if args.cmd == "bs":
-        if args.greeks:
-            out = bs_greeks(args.cp, args.S, args.K, args.T, args.r, args.sigma, args.q)
-        else:
-            out = {
-                "price": bs_price(
-                    args.cp, args.S, args.K, args.T, args.r, args.sigma, args.q
-                )
-            }
-        print(json.dumps(out, indent=2))
-        return
+    if path.endswith(".npy"):
+        arr = np.load(path, mmap_mode="r")
+        return np.asarray(arr, dtype=float).ravel()
+    with open(path, "r", encoding="utf-8") as fh:
+        first = fh.readline()
+    cells = [c.strip() for c in first.split(",")]
+    try:
+        [float(c) for c in cells if c]
+        header = None
+    except ValueError:
+        header = cells
+    if column is None:
+        idx = 0
+    elif isinstance(column, int) or str(column).lstrip("-").isdigit():
+        idx = int(column)
+    elif header is not None and column in header:
+        idx = header.index(column)
+    else:
+        raise ValueError(f"column {column!r} not found in {path}")
+    return np.loadtxt(
+        path,
+        delimiter=",",
+        skiprows=0 if header is None else 1,
+        usecols=idx,
+        ndmin=1,
+        dtype=float,
+    )
+
+
+def _bs(req: Request) -> Dict[str, Any]:
+    from .black_scholes import bs_greeks, bs_price
+
+    args = (req["cp"], req["S"], req["K"], req["T"], req["r"], req["sigma"], req.get("q", 0.0))
+    if req.get("greeks"):
+        return bs_greeks(*args)
+    return {"price": bs_price(*args)}
+
+
+def _kelly(req: Request) -> Dict[str, Any]:
+    from .kelly import kelly_fraction, kelly_optimal_fraction
+
+    if req.get("p") is not None and req.get("b") is not None:
+        return {"fraction": kelly_fraction(req["p"], req["b"])}
+    if req.get("mu") is not None and req.get("sigma2") is not None:
+        return {"fraction": kelly_optimal_fraction(req["mu"], req["sigma2"])}
+    raise ValueError("Provide either (p,b) or (mu,sigma2) for kelly")
+
+
+def _var_hist(req: Request) -> Dict[str, Any]:
+    alpha = req.get("alpha", 0.95)
+    if req.get("returns_file"):
+        from .var import var_es_batch
+
+        series = load_series(req["returns_file"], req.get("column"))
+        var, cvar = var_es_batch(series, [alpha])
+        return {"VaR": float(var[0, 0]), "CVaR": float(cvar[0, 0])}
+    from .var import cvar_historical, historical_var
+
+    returns = req.get("returns")
+    if not returns:
+        raise ValueError("var_hist needs returns or returns_file")
+    return {"VaR": historical_var(returns, alpha), "CVaR": cvar_historical(returns, alpha)}
+
+
+def _var_param(req: Request) -> Dict[str, Any]:
+    from .var import cvar_parametric, parametric_var
+
+    args = (req["mu"], req["sigma"], req.get("alpha", 0.95), req.get("horizon", 1.0))
+    return {"VaR": parametric_var(*args), "CVaR": cvar_parametric(*args)}
+
+
+def _var_cf(req: Request) -> Dict[str, Any]:
+    from .var import cornish_fisher_var
+
+    var = cornish_fisher_var(
+        req["mu"],
+        req["sigma"],
+        req["skew"],
+        req["kurt"],
+        req.get("alpha", 0.95),
+        req.get("horizon", 1.0),
+    )
+    return {"VaR": var}
 
-    if args.cmd == "kelly":
-        if args.p is not None and args.b is not None:
-            out = {"fraction": kelly_fraction(args.p, args.b)}
-        elif args.mu is not None and args.sigma2 is not None:
-            out = {"fraction": kelly_optimal_fraction(args.mu, args.sigma2)}
+
+def _var_mc(req: Request) -> Dict[str, Any]:
+    from .var import mc_var
+
+    return mc_var(
+        req["mu"],
+        req["sigma"],
+        req.get("alpha", 0.95),
+        req.get("horizon", 1.0),
+        req.get("paths", 10000),
+        seed=req.get("seed"),
+        sampling=req.get("sampling", "pseudo"),
+        ci_width=req.get("ci_width"),
+    )
+
+
+def _lp(req: Request) -> Dict[str, Any]:
+    from .lp import solve_lp
+
+    A = req["A"]
+    if req.get("rows") is not None:
+        rows = req["rows"]
+        if len(A) % rows != 0:
+            raise ValueError("length of A must be divisible by rows")
+        cols = len(A) // rows
+        A = [A[i * cols : (i + 1) * cols] for i in range(rows)]
+    return solve_lp(req["c"], A, req["b"])
+
+
+COMMANDS: Dict[str, Callable[[Request], Dict[str, Any]]] = {
+    "bs": _bs,
+    "kelly": _kelly,
+    "var_hist": _var_hist,
+    "var_param": _var_param,
+    "var_cf": _var_cf,
+    "var_mc": _var_mc,
+    "lp": _lp,
+}
+
+
+def run_request(req: Request) -> Dict[str, Any]:
+    """Run one batch request; errors are reported in the result, not raised."""
+    out: Dict[str, Any] = {"id": req.get("id")} if isinstance(req, dict) else {"id": None}
+    try:
+        if not isinstance(req, dict):
+            raise ValueError("request must be a JSON object")
+        cmd = req.get("cmd")
+        if cmd not in COMMANDS:
+            raise ValueError(f"unknown cmd {cmd!r}; expected one of {sorted(COMMANDS)}")
+        out["ok"] = True
+        out["result"] = COMMANDS[cmd](req)
+    except Exception as exc:  # one bad line must not kill the job
+        out["ok"] = False
+        out["error"] = f"{type(exc).__name__}: {exc}"
+        out.pop("result", None)
+    return out
+
+
+def _run_lines(lines: Sequence[str]) -> List[str]:
+    """Worker task: parse, run and serialize a chunk of JSONL lines."""
+    out = []
+    for line in lines:
+        try:
+            req = json.loads(line)
+        except json.JSONDecodeError as exc:
+            res: Dict[str, Any] = {"id": None, "ok": False, "error": f"JSONDecodeError: {exc}"}
         else:
-            raise SystemExit("Provide either (p,b) or (mu,sigma2) for kelly")
-        print(json.dumps(out, indent=2))
-        return
+            res = run_request(req)
+        out.append(_dumps(res))
+    return out
+
+
+def _jsonable(obj: Any) -> Any:
+    # numpy scalars / arrays to Python; inf / nan (unbounded or infeasible
+    # LPs, ...) to null, since JSON has no such numbers
+    if isinstance(obj, dict):
+        return {k: _jsonable(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_jsonable(v) for v in obj]
+    if hasattr(obj, "tolist"):
+        return _jsonable(obj.tolist())
+    if isinstance(obj, float) and not math.isfinite(obj):
+        return None
+    return obj
+
+
+def _dumps(obj: Any, **kwargs: Any) -> str:
+    """Strict JSON (no Infinity / NaN tokens) for JSONL consumers."""
+    return json.dumps(_jsonable(obj), allow_nan=False, **kwargs)
 
-    if args.cmd == "var_hist":
-        var = historical_var(args.returns, args.alpha)
-        cvar = cvar_historical(args.returns, args.alpha)
-        out = {"VaR": var, "CVaR": cvar}
-        print(json.dumps(out, indent=2))
-        return
 
-    if args.cmd == "var_param":
-        var = parametric_var(args.mu, args.sigma, args.alpha, args.horizon)
-        cvar = cvar_parametric(args.mu, args.sigma, args.alpha, args.horizon)
-        out = {"VaR": var, "CVaR": cvar}
-        print(json.dumps(out, indent=2))
+def _chunks(lines: Iterable[str], size: int) -> Iterator[List[str]]:
+    buf: List[str] = []
+    for line in lines:
+        if not line.strip():
+            continue
+        buf.append(line)
+        if len(buf) >= size:
+            yield buf
+            buf = []
+    if buf:
+        yield buf
+
+
+def iter_batch(
+    lines: Iterable[str],
+    workers: int | None = None,
+    chunk: int = 64,
+) -> Iterator[str]:
+    """
+    Stream JSONL result lines for JSONL request lines, in input order.
+
+    Chunks of `chunk` lines go to a process pool; at most a few chunks per
+    worker are in flight, so input is read lazily and memory stays bounded
+    on arbitrarily long streams.
+    """
+    if chunk <= 0:
+        raise ValueError("chunk must be > 0")
+    if workers == 1:
+        for block in _chunks(lines, chunk):
+            yield from _run_lines(block)
         return
+    from concurrent.futures import ProcessPoolExecutor
+
+    n_workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        pending: deque = deque()
+        for block in _chunks(lines, chunk):
+            pending.append(pool.submit(_run_lines, block))
+            if len(pending) >= 4 * n_workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
 
-    if args.cmd == "var_cf":
-        var = cornish_fisher_var(
-            args.mu, args.sigma, args.skew, args.kurt, args.alpha, args.horizon
+def _batch(args: argparse.Namespace) -> None:
+    fh = sys.stdin if args.input == "-" else open(args.input, "r", encoding="utf-8")
+    try:
+        for line in iter_batch(fh, args.workers, args.chunk):
+            sys.stdout.write(line + "\n")
+    finally:
+        if fh is not sys.stdin:
+            fh.close()
+    sys.stdout.flush()
+
+
+def _lp_jsonl(path: str) -> None:
+    """Solve a JSONL file of LPs, batching problems of equal shape."""
+    from .lp import solve_lp_batch
+
+    with open(path, "r", encoding="utf-8") as fh:
+        problems = [json.loads(line) for line in fh if line.strip()]
+    groups: Dict[Tuple[int, int], List[int]] = {}
+    for i, prob in enumerate(problems):
+        shape = (len(prob["b"]), len(prob["c"]))
+        groups.setdefault(shape, []).append(i)
+    results: List[Dict[str, object]] = [{} for _ in problems]
+    for idx in groups.values():
+        res = solve_lp_batch(
+            [problems[i]["c"] for i in idx],
+            [problems[i]["A"] for i in idx],
+            [problems[i]["b"] for i in idx],
         )
-        out = {"VaR": var}
-        print(json.dumps(out, indent=2))
-        return
+        for k, i in enumerate(idx):
+            ok = res["status"][k] in ("optimal", "iter_limit")
+            results[i] = {
+                "status": str(res["status"][k]),
+                "x": res["x"][k].tolist() if ok else None,
+                "objective": float(res["objective"][k]),
+                "iterations": int(res["iterations"][k]),
+            }
+    for out in results:
+        print(_dumps(out))
+
 
-    if args.cmd == "var_mc":
-        var = monte_carlo_var(args.mu, args.sigma, args.alpha, args.horizon, args.paths)
-        out = {"VaR": var}
-        print(json.dumps(out, indent=2))
+def main(argv: List[str] | None = None) -> None:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.cmd == "batch":
+        _batch(args)
         return
 
     if args.cmd == "lp":
-        c = args.c
-        A_flat = args.A
-        rows = args.rows
-        if len(A_flat) % rows != 0:
-            raise SystemExit("length of A must be divisible by rows")
-        cols = len(A_flat) // rows
-        A = [A_flat[i * cols : (i + 1) * cols] for i in range(rows)]
-        result = solve_lp(c, A, args.b)
-        print(json.dumps(result, indent=2))
-        return
+        if args.jsonl:
+            _lp_jsonl(args.jsonl)
+            return
+        if not args.c or args.A is None or args.rows is None or args.b is None:
+            raise SystemExit("lp needs c, --A, --rows and --b (or --jsonl)")
+
+    if args.cmd == "var_hist" and not args.returns and not args.returns_file:
+        raise SystemExit("var_hist needs returns or --returns-file")
+
+    try:
+        out = COMMANDS[args.cmd](vars(args))
+    except ValueError as exc:
+        raise SystemExit(str(exc))
+    print(_dumps(out, indent=2))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,273 @@
+# rolling_var.py
+from __future__ import annotations
+
+import random
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Sequence, Tuple
+
+from .var import _tail_index
+
+
+class _OrderStatTree:
+    """
+    Treap keyed by (value, seq) with subtree aggregates:
+    node count, weight sum and weighted value sum.
+
+    Nodes live in parallel lists; index 0 is the empty sentinel.
+    Freed slots are recycled so memory stays at the window size.
+    """
+
+    def __init__(self, seed: int = 0) -> None:
+        self.val: List[float] = [0.0]
+        self.seq: List[int] = [-1]
+        self.w: List[float] = [0.0]
+        self.prio: List[float] = [0.0]
+        self.left: List[int] = [0]
+        self.right: List[int] = [0]
+        self.cnt: List[int] = [0]
+        self.wsum: List[float] = [0.0]
+        self.xsum: List[float] = [0.0]
+        self.root = 0
+        self._free: List[int] = []
+        self._rng = random.Random(seed)
+
+    def _pull(self, n: int) -> None:
+        l, r = self.left[n], self.right[n]
+        self.cnt[n] = self.cnt[l] + self.cnt[r] + 1
+        self.wsum[n] = self.wsum[l] + self.wsum[r] + self.w[n]
+        self.xsum[n] = self.xsum[l] + self.xsum[r] + self.w[n] * self.val[n]
+
+    def _less(self, a: int, val: float, seq: int) -> bool:
+        va = self.val[a]
+        return va < val or (va == val and self.seq[a] < seq)
+
+    def _split(self, t: int, val: float, seq: int) -> Tuple[int, int]:
+        """Split into (keys < (val, seq), keys >= (val, seq))."""
+        if t == 0:
+            return 0, 0
+        if self._less(t, val, seq):
+            a, b = self._split(self.right[t], val, seq)
+            self.right[t] = a
+            self._pull(t)
+            return t, b
+        a, b = self._split(self.left[t], val, seq)
+        self.left[t] = b
+        self._pull(t)
+        return a, t
+
+    def _merge(self, a: int, b: int) -> int:
+        if a == 0:
+            return b
+        if b == 0:
+            return a
+        if self.prio[a] > self.prio[b]:
+            self.right[a] = self._merge(self.right[a], b)
+            self._pull(a)
+            return a
+        self.left[b] = self._merge(a, self.left[b])
+        self._pull(b)
+        return b
+
+    def insert(self, val: float, seq: int, w: float) -> int:
+        if self._free:
+            n = self._free.pop()
+            self.val[n], self.seq[n], self.w[n] = val, seq, w
+            self.prio[n] = self._rng.random()
+            self.left[n] = self.right[n] = 0
+        else:
+            n = len(self.val)
+            self.val.append(val)
+            self.seq.append(seq)
+            self.w.append(w)
+            self.prio.append(self._rng.random())
+            self.left.append(0)
+            self.right.append(0)
+            self.cnt.append(0)
+            self.wsum.append(0.0)
+            self.xsum.append(0.0)
+        self._pull(n)
+        a, b = self._split(self.root, val, seq)
+        self.root = self._merge(self._merge(a, n), b)
+        return n
+
+    def _remove(self, t: int, n: int) -> int:
+        if t == n:
+            return self._merge(self.left[t], self.right[t])
+        if self._less(n, self.val[t], self.seq[t]):
+            self.left[t] = self._remove(self.left[t], n)
+        else:
+            self.right[t] = self._remove(self.right[t], n)
+        self._pull(t)
+        return t
+
+    def remove(self, n: int) -> None:
+        self.root = self._remove(self.root, n)
+        self._free.append(n)
+
+    def kth(self, k: int) -> Tuple[float, float]:
+        """(k-th smallest value, sum of w*value over ranks 0..k)."""
+        n = self.root
+        acc = 0.0
+        while n:
+            l = self.left[n]
+            lc = self.cnt[l]
+            if k < lc:
+                n = l
+                continue
+            acc += self.xsum[l] + self.w[n] * self.val[n]
+            if k == lc:
+                return self.val[n], acc
+            k -= lc + 1
+            n = self.right[n]
+        raise IndexError("rank out of range")
+
+    def weighted_quantile(self, target: float) -> Tuple[float, float, float]:
+        """
+        Smallest value whose cumulative weight reaches target.
+        Returns (value, cumulative weight, cumulative w*value) up to and
+        including that value.
+        """
+        n = self.root
+        acc_w = 0.0
+        acc_x = 0.0
+        last = (0.0, 0.0, 0.0)
+        while n:
+            l = self.left[n]
+            lw = self.wsum[l]
+            if target <= lw and l:
+                n = l
+                continue
+            acc_w += lw + self.w[n]
+            acc_x += self.xsum[l] + self.w[n] * self.val[n]
+            last = (self.val[n], acc_w, acc_x)
+            if target <= lw + self.w[n]:
+                return last
+            target -= lw + self.w[n]
+            n = self.right[n]
+        # Rounding pushed the target past the total: the max node is the answer
+        return last
+
+    def rescale(self, factor: float) -> None:
+        """Multiply every live weight by factor and rebuild aggregates."""
+        if self.root == 0:
+            return
+        order: List[int] = []
+        stack = [self.root]
+        while stack:
+            n = stack.pop()
+            order.append(n)
+            for c in (self.left[n], self.right[n]):
+                if c:
+                    stack.append(c)
+        for n in order:
+            self.w[n] *= factor
+        for n in reversed(order):
+            self._pull(n)
+
+
+class RollingVaR:
+    """
+    Rolling-window historical VaR / CVaR with O(log n) updates.
+
+    Each `update` inserts one return and evicts the oldest once the window
+    is full. An order-statistics treap keeps counts and tail sums per
+    subtree, so the VaR quantile and the CVaR tail sum are read in
+    O(log n) for any alpha instead of re-sorting the window.
+
+    window: number of most recent returns kept
+    alphas: confidence levels reported by `snapshot`
+    decay: optional EWMA factor in (0,1); observation of age j gets
+        weight decay**j and the quantile is taken on cumulative weight.
+        None gives equal weights and the same index convention as
+        `historical_var` / `cvar_historical`.
+    """
+
+    _RESCALE_AT = 1e200
+
+    def __init__(
+        self,
+        window: int,
+        alphas: Sequence[float] = (0.95,),
+        decay: float | None = None,
+        seed: int = 0,
+    ) -> None:
+        if window <= 0:
+            raise ValueError("window must be > 0")
+        if not alphas:
+            raise ValueError("alphas must be non-empty")
+        for a in alphas:
+            if not (0.0 < a < 1.0):
+                raise ValueError("alpha must be in (0,1)")
+        if decay is not None and not (0.0 < decay < 1.0):
+            raise ValueError("decay must be in (0,1)")
+        self.window = int(window)
+        self.alphas = tuple(float(a) for a in alphas)
+        self.decay = decay
+        self._tree = _OrderStatTree(seed)
+        self._nodes: Deque[int] = deque()
+        self._seq = 0
+        self._w = 1.0
+        self._cache: Dict[float, Tuple[float, float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    @property
+    def full(self) -> bool:
+        return len(self._nodes) == self.window
+
+    def update(self, ret: float) -> None:
+        """Add one return, evicting the oldest if the window is full."""
+        tree = self._tree
+        if len(self._nodes) == self.window:
+            tree.remove(self._nodes.popleft())
+        w = 1.0
+        if self.decay is not None:
+            # New points get weight 1/decay relative to the previous one;
+            # rescale before the raw weights overflow.
+            w = self._w
+            self._w /= self.decay
+            if self._w > self._RESCALE_AT:
+                tree.rescale(1.0 / w)
+                self._w /= w
+                w = 1.0
+        self._nodes.append(tree.insert(float(ret), self._seq, w))
+        self._seq += 1
+        self._cache.clear()
+
+    def extend(self, returns: Iterable[float]) -> None:
+        for r in returns:
+            self.update(r)
+
+    def var_es(self, alpha: float | None = None) -> Tuple[float, float]:
+        """(VaR, CVaR) of the current window, losses positive."""
+        a = self.alphas[0] if alpha is None else float(alpha)
+        if not (0.0 < a < 1.0):
+            raise ValueError("alpha must be in (0,1)")
+        hit = self._cache.get(a)
+        if hit is not None:
+            return hit
+        n = len(self._nodes)
+        if n == 0:
+            raise ValueError("no returns observed yet")
+        tree = self._tree
+        if self.decay is None:
+            k = _tail_index(a, n)
+            q, tail = tree.kth(k)
+            out = (-q, -tail / (k + 1))
+        else:
+            target = (1.0 - a) * tree.wsum[tree.root]
+            q, w_tail, x_tail = tree.weighted_quantile(target)
+            out = (-q, -x_tail / w_tail)
+        self._cache[a] = out
+        return out
+
+    def var(self, alpha: float | None = None) -> float:
+        return self.var_es(alpha)[0]
+
+    def cvar(self, alpha: float | None = None) -> float:
+        return self.var_es(alpha)[1]
+
+    def snapshot(self) -> Dict[float, Tuple[float, float]]:
+        """{alpha: (VaR, CVaR)} for every configured alpha."""
+        return {a: self.var_es(a) for a in self.alphas}
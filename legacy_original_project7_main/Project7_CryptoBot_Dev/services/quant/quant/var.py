@@ -2,13 +2,22 @@
 from __future__ import annotations
 
 import math
-from typing import Iterable, List, Tuple
+from typing import Dict, Iterable, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from .normal import norm_pdf as _norm_pdf, norm_ppf as _norm_ppf
 
 
 def _to_array(xs: Iterable[float]) -> List[float]:
     return [float(x) for x in xs]
 
 
+def _tail_index(alpha: float, n: int) -> int:
+    """Index of the VaR order statistic in an ascending sample of size n."""
+    return int((1.0 - alpha) * (n - 1))
+
+
 def historical_var(returns: Iterable[float], alpha: float = 0.95) -> float:
     """
     Historical VaR (right tail, losses positive) for returns series.
@@ -21,7 +30,7 @@ def historical_var(returns: Iterable[float], alpha: float = 0.95) -> float:
         raise ValueError("returns must be non-empty")
 
     # For losses: VaR at alpha is -quantile of returns at (1-alpha)
-    q_idx = int((1.0 - alpha) * (len(arr) - 1))
+    q_idx = _tail_index(alpha, len(arr))
     q = arr[q_idx]
     return -q
 
@@ -33,7 +42,7 @@ def cvar_historical(returns: Iterable[float], alpha: float = 0.95) -> float:
     arr = sorted(_to_array(returns))
     if not arr:
         raise ValueError("returns must be non-empty")
-    q_idx = int((1.0 - alpha) * (len(arr) - 1))
+    q_idx = _tail_index(alpha, len(arr))
     tail = arr[: q_idx + 1]
     return -sum(tail) / len(tail)
 
@@ -74,7 +83,7 @@ def cvar_parametric(
     z = _norm_ppf(1.0 - alpha)
     mu_h = mu * horizon
     sig_h = sigma * math.sqrt(horizon)
-    pdf = math.exp(-0.5 * z * z) / math.sqrt(2.0 * math.pi)
+    pdf = _norm_pdf(z)
     es = -(mu_h + sig_h * pdf / (1.0 - alpha))
     return es
 
@@ -111,15 +120,29 @@ def cornish_fisher_var(
     return -(mu_h + z_cf * sig_h)
 
 
+SeedLike = Union[int, np.random.Generator, None]
+
+
+def _rng(seed: SeedLike) -> np.random.Generator:
+    """Generator from a seed, or the generator itself when one is passed."""
+    if isinstance(seed, np.random.Generator):
+        return seed
+    return np.random.default_rng(seed)
+
+
 def monte_carlo_var(
     mu: float,
     sigma: float,
     alpha: float = 0.95,
     horizon: float = 1.0,
     paths: int = 10000,
+    seed: SeedLike = None,
 ) -> float:
     """
     Monte Carlo VaR assuming Gaussian PnL with (mu, sigma).
+
+    seed: int or np.random.Generator; draws never touch the global
+    `random` state, so equal seeds give equal results on any thread.
     """
     if sigma < 0.0:
         raise ValueError("sigma must be >= 0")
@@ -128,75 +151,159 @@ def monte_carlo_var(
     if not (0.0 < alpha < 1.0):
         raise ValueError("alpha must be in (0,1)")
 
-    import random
+    sig_h = sigma * math.sqrt(horizon)
+    mu_h = mu * horizon
+    samples = mu_h + sig_h * _rng(seed).standard_normal(paths)
+    idx = _tail_index(alpha, paths)
+    return float(-np.partition(samples, idx)[idx])
+
 
-    samples: List[float] = []
+MC_SAMPLING = ("pseudo", "antithetic", "sobol")
+
+
+def _van_der_corput(start: int, n: int) -> np.ndarray:
+    """Base-2 radical inverse of start..start+n-1 (1-D Sobol sequence)."""
+    i = np.arange(start, start + n, dtype=np.uint64).astype(np.uint32)
+    i = ((i >> 1) & 0x55555555) | ((i & 0x55555555) << 1)
+    i = ((i >> 2) & 0x33333333) | ((i & 0x33333333) << 2)
+    i = ((i >> 4) & 0x0F0F0F0F) | ((i & 0x0F0F0F0F) << 4)
+    i = ((i >> 8) & 0x00FF00FF) | ((i & 0x00FF00FF) << 8)
+    i = (i >> 16) | (i << 16)
+    return i.astype(float) / 4294967296.0
+
+
+def mc_var(
+    mu: float,
+    sigma: float,
+    alpha: float = 0.95,
+    horizon: float = 1.0,
+    paths: int = 10000,
+    seed: SeedLike = None,
+    sampling: str = "pseudo",
+    ci_width: float | None = None,
+    ci_level: float = 0.95,
+    batch: int = 1024,
+) -> Dict[str, object]:
+    """
+    Vectorized Monte Carlo VaR for Gaussian PnL with variance reduction.
+
+    sampling: "pseudo" (plain draws), "antithetic" (z, -z pairs) or
+        "sobol" (randomly shifted base-2 low-discrepancy points).
+    seed: int or np.random.Generator driving draws and the Sobol shift.
+    ci_width: when set, sample in doubling batches starting at `batch`
+        and stop once the distribution-free order-statistic confidence
+        interval of the VaR is no wider than this; `paths` is the cap.
+        The interval ignores the extra accuracy of "sobol" points, so it
+        is conservative there.
+
+    Returns dict with:
+      - "VaR": loss at level alpha (positive)
+      - "ci": [low, high] VaR bounds at ci_level
+      - "paths": samples actually drawn
+      - "converged": whether ci_width was met (True if not requested)
+    """
+    if sigma < 0.0:
+        raise ValueError("sigma must be >= 0")
+    if paths <= 0:
+        raise ValueError("paths must be > 0")
+    if not (0.0 < alpha < 1.0):
+        raise ValueError("alpha must be in (0,1)")
+    if not (0.0 < ci_level < 1.0):
+        raise ValueError("ci_level must be in (0,1)")
+    if sampling not in MC_SAMPLING:
+        raise ValueError(f"sampling must be one of {MC_SAMPLING}")
+    if ci_width is not None and ci_width <= 0.0:
+        raise ValueError("ci_width must be > 0")
+
+    rng = _rng(seed)
+    shift = rng.random() if sampling == "sobol" else 0.0
     sig_h = sigma * math.sqrt(horizon)
     mu_h = mu * horizon
-    for _ in range(paths):
-        z = random.gauss(0.0, 1.0)
-        pnl = mu_h + sig_h * z
-        samples.append(pnl)
-    samples.sort()
-    idx = int((1.0 - alpha) * (len(samples) - 1))
-    return -samples[idx]
+    p = 1.0 - alpha
+    z_ci = _norm_ppf(0.5 + 0.5 * ci_level)
+
+    def draw(start: int, n: int) -> np.ndarray:
+        if sampling == "antithetic":
+            half = rng.standard_normal((n + 1) // 2)
+            return np.concatenate((half, -half))[:n]
+        if sampling == "sobol":
+            u = (_van_der_corput(start + 1, n) + shift) % 1.0
+            return _norm_ppf(np.clip(u, 1e-16, 1.0 - 1e-16))
+        return rng.standard_normal(n)
+
+    samples = np.empty(paths)
+    n = min(paths, max(2, int(batch))) if ci_width is not None else paths
+    filled = 0
+    while True:
+        samples[filled:n] = mu_h + sig_h * draw(filled, n - filled)
+        filled = n
+        idx = _tail_index(alpha, n)
+        half_width = z_ci * math.sqrt(n * p * (1.0 - p))
+        lo = max(0, int(math.floor(idx - half_width)))
+        hi = min(n - 1, int(math.ceil(idx + half_width)))
+        part = np.partition(samples[:n], sorted({lo, idx, hi}))
+        width = float(part[hi] - part[lo])
+        converged = ci_width is None or width <= ci_width
+        if converged or n == paths:
+            break
+        n = min(paths, 2 * n)
+
+    return {
+        "VaR": float(-part[idx]),
+        "ci": [float(-part[hi]), float(-part[lo])],
+        "paths": n,
+        "converged": converged,
+    }
 
 
 def var_es(returns: Iterable[float], alpha: float = 0.95) -> Tuple[float, float]:
-    """Convenience: (VaR, CVaR) via historical method."""
-    return historical_var(returns, alpha), cvar_historical(returns, alpha)
-
-
-def _norm_ppf(p: float) -> float:
-    """Inverse CDF for standard normal via Acklam approximation."""
-    if not (0.0 < p < 1.0):
-        raise ValueError("p must be in (0,1)")
-
-    # Coefficients from Peter J. Acklam's approximation
-    a1 = -3.969683028665376e01
-    a2 = 2.209460984245205e02
-    a3 = -2.759285104469687e02
-    a4 = 1.383577518672690e02
-    a5 = -3.066479806614716e01
-    a6 = 2.506628277459239e00
-
-    b1 = -5.447609879822406e01
-    b2 = 1.615858368580409e02
-    b3 = -1.556989798598866e02
-    b4 = 6.680131188771972e01
-    b5 = -1.328068155288572e01
-
-    c1 = -7.784894002430293e-03
-    c2 = -3.223964580411365e-01
-    c3 = -2.400758277161838e00
-    c4 = -2.549732539343734e00
-    c5 = 4.374664141464968e00
-    c6 = 2.938163982698783e00
-
-    d1 = 7.784695709041462e-03
-    d2 = 3.224671290700398e-01
-    d3 = 2.445134137142996e00
-    d4 = 3.754408661907416e00
-
-    plow = 0.02425
-    phigh = 1.0 - plow
-
-    if p < plow:
-        q = math.sqrt(-2.0 * math.log(p))
-        return (
-            (((((c1 * q + c2) * q + c3) * q + c4) * q + c5) * q + c6)
-            / ((((d1 * q + d2) * q + d3) * q + d4) * q + 1.0)
-        )
-    if phigh < p:
-        q = math.sqrt(-2.0 * math.log(1.0 - p))
-        return -(
-            (((((c1 * q + c2) * q + c3) * q + c4) * q + c5) * q + c6)
-            / ((((d1 * q + d2) * q + d3) * q + d4) * q + 1.0)
-        )
-
-    q = p - 0.5
-    r = q * q
-    return (
-        (((((a1 * r + a2) * r + a3) * r + a4) * r + a5) * r + a6) * q
-        / (((((b1 * r + b2) * r + b3) * r + b4) * r + b5) * r + 1.0)
-    )
+    """Convenience: (VaR, CVaR) via historical method, sorting only once."""
+    if not (0.0 < alpha < 1.0):
+        raise ValueError("alpha must be in (0,1)")
+    arr = sorted(_to_array(returns))
+    if not arr:
+        raise ValueError("returns must be non-empty")
+    q_idx = _tail_index(alpha, len(arr))
+    tail = arr[: q_idx + 1]
+    return -arr[q_idx], -sum(tail) / len(tail)
+
+
+def var_es_batch(
+    returns: Sequence[Sequence[float]] | np.ndarray,
+    alphas: Sequence[float] | float = (0.95,),
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Historical VaR/CVaR for many return series and alpha levels in one pass.
+
+    returns: 2-D array (series x observations); a 1-D input is one series.
+    alphas: one or more confidence levels in (0,1).
+    Returns (VaR, CVaR), each of shape (series, len(alphas)), with the same
+    index convention as `historical_var` / `cvar_historical`.
+
+    A single `np.partition` over all needed order statistics replaces the
+    full sort, and the tail sums come from one cumulative sum of the
+    partitioned prefix.
+    """
+    arr = np.asarray(returns, dtype=float)
+    if arr.ndim == 1:
+        arr = arr[np.newaxis, :]
+    if arr.ndim != 2:
+        raise ValueError("returns must be 1-D or 2-D (series x observations)")
+    n = arr.shape[1]
+    if n == 0:
+        raise ValueError("returns must be non-empty")
+    alpha_arr = np.atleast_1d(np.asarray(alphas, dtype=float))
+    if alpha_arr.ndim != 1 or alpha_arr.size == 0:
+        raise ValueError("alphas must be a non-empty 1-D sequence")
+    if np.any((alpha_arr <= 0.0) | (alpha_arr >= 1.0)):
+        raise ValueError("alpha must be in (0,1)")
+
+    q_idx = np.array([_tail_index(float(a), n) for a in alpha_arr], dtype=np.intp)
+    kth = np.unique(q_idx)
+    # Everything left of each kth slot is <= it, so prefix sums are exact tails
+    part = np.partition(arr, kth, axis=1)
+    prefix = np.cumsum(part[:, : kth[-1] + 1], axis=1)
+
+    var = -part[:, q_idx]
+    cvar = -prefix[:, q_idx] / (q_idx + 1)
+    return var, cvar
@@ -0,0 +1,205 @@
+# vol_surface.py
+from __future__ import annotations
+
+import bisect
+import math
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from .black_scholes import ArrayLike, CPLike
+from .implied_vol import IV_CONVERGED, implied_vol_batch
+
+
+class _Smile:
+    """
+    One expiry: natural cubic spline of total variance w = sigma^2 T in
+    x = ln K, stored as per-interval polynomial coefficients so a lookup
+    is a bisect plus a cubic evaluation. Flat vol outside the quoted strikes.
+    """
+
+    def __init__(self, T: float) -> None:
+        self.T = T
+        self.quotes: Dict[float, float] = {}
+        self.x: List[float] = []
+        self.coef: List[Tuple[float, float, float, float]] = []
+        self.dirty = True
+
+    def fit(self) -> None:
+        strikes = sorted(self.quotes)
+        x = [math.log(k) for k in strikes]
+        w = [self.quotes[k] ** 2 * self.T for k in strikes]
+        n = len(x)
+        m = [0.0] * n  # second derivatives, natural ends
+        if n > 2:
+            # Thomas algorithm on the tridiagonal spline system
+            h = [x[i + 1] - x[i] for i in range(n - 1)]
+            diag = [2.0 * (h[i - 1] + h[i]) for i in range(1, n - 1)]
+            rhs = [
+                6.0 * ((w[i + 1] - w[i]) / h[i] - (w[i] - w[i - 1]) / h[i - 1])
+                for i in range(1, n - 1)
+            ]
+            for i in range(1, n - 2):
+                f = h[i] / diag[i - 1]
+                diag[i] -= f * h[i]
+                rhs[i] -= f * rhs[i - 1]
+            sol = [0.0] * (n - 2)
+            sol[-1] = rhs[-1] / diag[-1]
+            for i in range(n - 4, -1, -1):
+                sol[i] = (rhs[i] - h[i + 1] * sol[i + 1]) / diag[i]
+            m[1 : n - 1] = sol
+        coef = []
+        for i in range(n - 1):
+            hi = x[i + 1] - x[i]
+            b = (w[i + 1] - w[i]) / hi - hi * (2.0 * m[i] + m[i + 1]) / 6.0
+            coef.append((w[i], b, 0.5 * m[i], (m[i + 1] - m[i]) / (6.0 * hi)))
+        if n == 1:
+            coef.append((w[0], 0.0, 0.0, 0.0))
+        self.x = x
+        self.coef = coef
+        self.dirty = False
+
+    def total_variance(self, lnK: float) -> float:
+        x = self.x
+        if lnK <= x[0]:
+            return self.coef[0][0]
+        if lnK >= x[-1]:
+            if len(x) == 1:
+                return self.coef[0][0]
+            a, b, c, d = self.coef[-1]
+            h = x[-1] - x[-2]
+            return a + h * (b + h * (c + h * d))
+        i = bisect.bisect_right(x, lnK) - 1
+        a, b, c, d = self.coef[i]
+        t = lnK - x[i]
+        return a + t * (b + t * (c + t * d))
+
+
+class VolSurface:
+    """
+    Implied-volatility surface built from (expiry, strike, vol) quotes.
+
+    Each expiry is a smile (see `_Smile`); between expiries total variance
+    is interpolated linearly in T at fixed strike, with flat vol before the
+    first and after the last expiry. Smiles are keyed on ln K, so spot
+    moves need no refit.
+
+    `update` upserts quotes and only marks the touched expiries dirty;
+    dirty smiles are refit lazily on the next lookup (or by `refit`), so a
+    tick that changes a few quotes refits a few slices, not the surface.
+    Lookups are O(log n) bisects over precomputed spline coefficients.
+    """
+
+    def __init__(self, quotes: Iterable[Tuple[float, float, float]] = ()) -> None:
+        self._smiles: Dict[float, _Smile] = {}
+        self._expiries: List[float] = []
+        self.update(quotes)
+
+    @property
+    def expiries(self) -> List[float]:
+        return list(self._expiries)
+
+    def update(self, quotes: Iterable[Tuple[float, float, float]]) -> int:
+        """Upsert (T, K, sigma) quotes; returns the number of expiries touched."""
+        touched = set()
+        for T, K, sigma in quotes:
+            T, K, sigma = float(T), float(K), float(sigma)
+            if T <= 0.0 or K <= 0.0:
+                raise ValueError("T and K must be > 0")
+            if not (sigma > 0.0 and math.isfinite(sigma)):
+                raise ValueError("sigma must be finite and > 0")
+            smile = self._smiles.get(T)
+            if smile is None:
+                smile = self._smiles[T] = _Smile(T)
+                bisect.insort(self._expiries, T)
+            if smile.quotes.get(K) != sigma:
+                smile.quotes[K] = sigma
+                smile.dirty = True
+                touched.add(T)
+        return len(touched)
+
+    def remove(self, T: float, K: float) -> None:
+        """Drop one quote; an expiry with no quotes left is removed."""
+        smile = self._smiles[float(T)]
+        del smile.quotes[float(K)]
+        if smile.quotes:
+            smile.dirty = True
+        else:
+            del self._smiles[float(T)]
+            self._expiries.remove(float(T))
+
+    def update_from_prices(
+        self,
+        price: ArrayLike,
+        cp: CPLike,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike = 0.0,
+        q: ArrayLike = 0.0,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Invert option prices with `implied_vol_batch` (warm-started from the
+        current surface) and upsert the converged quotes.
+        Returns the solver output.
+        """
+        K_arr, T_arr = np.broadcast_arrays(np.asarray(K, dtype=float), np.asarray(T, dtype=float))
+        sigma0 = None
+        if self._expiries:
+            # no warm start where sigma() is undefined; the solver flags those rows bad_input
+            valid = (T_arr > 0.0) & (K_arr > 0.0)
+            sigma0 = np.full(K_arr.shape, np.nan)
+            sigma0[valid] = self.sigma_batch(K_arr[valid], T_arr[valid])
+        out = implied_vol_batch(price, cp, S, K_arr, T_arr, r, q, sigma0=sigma0)
+        ok = out["status"] == IV_CONVERGED
+        self.update(zip(T_arr[ok], K_arr[ok], out["sigma"][ok]))
+        return out
+
+    def refit(self) -> int:
+        """Refit dirty smiles now; returns how many were refit."""
+        n = 0
+        for smile in self._smiles.values():
+            if smile.dirty:
+                smile.fit()
+                n += 1
+        return n
+
+    def _smile(self, T: float) -> _Smile:
+        smile = self._smiles[T]
+        if smile.dirty:
+            smile.fit()
+        return smile
+
+    def total_variance(self, K: float, T: float) -> float:
+        if not self._expiries:
+            raise ValueError("surface has no quotes")
+        if T <= 0.0 or K <= 0.0:
+            raise ValueError("T and K must be > 0")
+        lnK = math.log(K)
+        exp = self._expiries
+        j = bisect.bisect_left(exp, T)
+        if j < len(exp) and exp[j] == T:
+            return self._smile(T).total_variance(lnK)
+        if j == 0:
+            s = self._smile(exp[0])
+            return s.total_variance(lnK) * T / s.T
+        if j == len(exp):
+            s = self._smile(exp[-1])
+            return s.total_variance(lnK) * T / s.T
+        t0, t1 = exp[j - 1], exp[j]
+        w0 = self._smile(t0).total_variance(lnK)
+        w1 = self._smile(t1).total_variance(lnK)
+        return w0 + (w1 - w0) * (T - t0) / (t1 - t0)
+
+    def sigma(self, K: float, T: float) -> float:
+        """Interpolated implied vol at strike K and expiry T."""
+        return math.sqrt(max(self.total_variance(float(K), float(T)), 0.0) / float(T))
+
+    def sigma_batch(self, K: ArrayLike, T: ArrayLike) -> np.ndarray:
+        """`sigma` over broadcastable strike / expiry arrays."""
+        K_arr, T_arr = np.broadcast_arrays(np.asarray(K, dtype=float), np.asarray(T, dtype=float))
+        out = np.empty(K_arr.shape)
+        flat = out.reshape(-1)
+        for i, (k, t) in enumerate(zip(K_arr.ravel().tolist(), T_arr.ravel().tolist())):
+            flat[i] = self.sigma(k, t)
+        return out
@@ -0,0 +1,38 @@
+import argparse, math, time
+import numpy as np
+from quant.normal import norm_cdf, norm_pdf, norm_ppf
+
+KERNELS = {
+    "pdf": (norm_pdf, lambda rng, n: rng.normal(size=n)),
+    "cdf": (norm_cdf, lambda rng, n: rng.normal(size=n) * 3),
+    "ppf": (norm_ppf, lambda rng, n: rng.uniform(1e-9, 1 - 1e-9, size=n)),
+}
+
+def _best(fn, repeat: int) -> float:
+    best = math.inf
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="Scalar loop vs array kernels in quant.normal")
+    parser.add_argument("--max-exp", type=int, default=6, help="largest size is 10**max_exp")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'kernel':<6} {'n':>9} {'scalar_s':>11} {'array_s':>11} {'speedup':>9} {'max_abs_diff':>13}")
+    for name, (fn, sample) in KERNELS.items():
+        for e in range(args.max_exp + 1):
+            n = 10 ** e
+            x = sample(rng, n)
+            xs = x.tolist()
+            t_scalar = _best(lambda: [fn(v) for v in xs], args.repeat)
+            t_array = _best(lambda: fn(x), args.repeat)
+            diff = float(np.max(np.abs(fn(x) - np.array([fn(v) for v in xs]))))
+            print(f"{name:<6} {n:>9} {t_scalar:>11.6f} {t_array:>11.6f} {t_scalar / t_array:>9.1f} {diff:>13.2e}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+import argparse, os, pathlib, subprocess, sys, time
+
+HERE = pathlib.Path(__file__).resolve().parents[1]
+REPO = HERE.parents[3]
+
+# (label, python statement, cwd, budget ms over a bare interpreter)
+TARGETS = [
+    ("quant.qcli", "import quant.qcli", HERE, 80.0),
+    ("crypto_quant_ai.api_service", "import crypto_quant_ai.api_service", HERE, 1200.0),
+    ("services/quant/app.py", "import app", REPO / "services" / "quant", 1200.0),
+]
+
+def _env(cwd: pathlib.Path) -> dict:
+    env = dict(os.environ)
+    paths = [str(cwd), str(HERE), str(HERE / "src"), str(HERE / "vendor" / "fm-sdk-python")]
+    env["PYTHONPATH"] = os.pathsep.join(paths + ([env["PYTHONPATH"]] if env.get("PYTHONPATH") else []))
+    return env
+
+def _time(stmt: str, cwd: pathlib.Path, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        subprocess.run([sys.executable, "-c", stmt], cwd=cwd, env=_env(cwd), check=True)
+        best = min(best, time.perf_counter() - t0)
+    return best * 1e3
+
+def _top_modules(stmt: str, cwd: pathlib.Path, n: int):
+    res = subprocess.run([sys.executable, "-X", "importtime", "-c", stmt], cwd=cwd, env=_env(cwd),
+                         capture_output=True, text=True, check=True)
+    top = []
+    for line in res.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cum_us, name = line[len("import time:"):].split("|", 2)
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        if depth == 1:  # direct imports of the target module
+            top.append((int(cum_us), name.strip()))
+    return sorted(top, reverse=True)[:n]
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold-import time of service entry points vs budgets")
+    parser.add_argument("--repeat", type=int, default=5, help="best-of-N subprocess runs")
+    parser.add_argument("--top", type=int, default=8, help="heaviest direct imports to list per target")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply all budgets (slow CI boxes)")
+    args = parser.parse_args()
+
+    base = _time("pass", HERE, args.repeat)
+    print(f"baseline interpreter start: {base:.1f} ms")
+    failed = False
+    for label, stmt, cwd, budget in TARGETS:
+        try:
+            ms = _time(stmt, cwd, args.repeat) - base
+        except subprocess.CalledProcessError:
+            print(f"{label:<32} import failed (missing dependency?)")
+            failed = True
+            continue
+        limit = budget * args.scale
+        ok = ms <= limit
+        failed |= not ok
+        print(f"{label:<32} {ms:8.1f} ms  budget {limit:6.0f} ms  {'ok' if ok else 'OVER'}")
+        for us, name in _top_modules(stmt, cwd, args.top):
+            print(f"    {us / 1e3:8.1f} ms  {name}")
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
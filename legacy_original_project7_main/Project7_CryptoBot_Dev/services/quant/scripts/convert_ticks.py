@@ -0,0 +1,18 @@
+import argparse, os, time
+from crypto_quant_ai.data.colstore import csv_to_colstore
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert a CSV tick file to the memory-mapped columnar format")
+    parser.add_argument("csv")
+    parser.add_argument("--out", default="", help="default: <csv without extension>.ticks")
+    parser.add_argument("--chunk-rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    out = args.out or os.path.splitext(args.csv)[0] + ".ticks"
+    t0 = time.perf_counter()
+    ticks = csv_to_colstore(args.csv, out, chunk_rows=args.chunk_rows)
+    print(f"{len(ticks)} rows -> {out} ({os.path.getsize(out)} bytes, {time.perf_counter() - t0:.2f}s)")
+    print("fingerprint:", ticks.fingerprint())
+
+if __name__ == "__main__":
+    main()
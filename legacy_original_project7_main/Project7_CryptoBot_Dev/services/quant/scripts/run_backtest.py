@@ -4,21 +4,31 @@ from crypto_quant_ai.alpha.momentum_funding import MomentumFunding
 from crypto_quant_ai.alpha.perp_skew_mm import PerpSkewMM
 from crypto_quant_ai.alpha.basis_trade import BasisCarry
 from crypto_quant_ai.backtest.engine import Backtest
-from crypto_quant_ai.data.feed import SyntheticTicks, CSVTicks
+from crypto_quant_ai.backtest.cache import ResultCache
+from crypto_quant_ai.data.feed import SyntheticTicks, ticks_to_columns
+from crypto_quant_ai.data.colstore import open_ticks
 
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--policy", default=os.path.join(project_root(), "src/crypto_quant_ai/config/policy.yml"))
-    parser.add_argument("--dataset", default="")
+    parser.add_argument("--dataset", default="", help="CSV or colstore (.ticks) file; synthetic when empty")
     parser.add_argument("--strategy", choices=["momentum_funding","perp_skew_mm","basis_carry","all"], default="all")
     parser.add_argument("--steps", type=int, default=500)
+    parser.add_argument("--mode", choices=["event","columns"], default="event",
+                        help="columns: vectorized research engine (no FM gate)")
+    parser.add_argument("--progress", type=int, default=0, help="event mode: print running metrics every N ticks")
+    parser.add_argument("--profile", action="store_true", help="event mode: per-stage timings -> artifacts/profile.json, profile.collapsed")
+    parser.add_argument("--cache", default="", help="columns mode: ResultCache file; unchanged runs are not replayed")
+    parser.add_argument("--checkpoint", default="", help="event mode: checkpoint file, rewritten every --checkpoint-every ticks")
+    parser.add_argument("--checkpoint-every", type=int, default=100_000)
+    parser.add_argument("--resume", action="store_true", help="continue from --checkpoint if it exists")
     args = parser.parse_args()
 
     pol = load_policy(args.policy)
     print("Policy hash:", policy_hash(pol))
 
     if args.dataset and os.path.exists(args.dataset):
-        ticks = CSVTicks(args.dataset)
+        ticks = open_ticks(args.dataset)
     else:
         ticks = SyntheticTicks(steps=args.steps)
 
@@ -27,9 +37,18 @@ def main():
     if args.strategy in ("perp_skew_mm","all"): strats.append(PerpSkewMM())
     if args.strategy in ("basis_carry","all"): strats.append(BasisCarry())
 
-    bt = Backtest(pol, strats, artifacts_dir=os.path.join(project_root(), "artifacts"))
-    metrics = bt.run(ticks)
+    cache = ResultCache(args.cache) if args.cache else None
+    bt = Backtest(pol, strats, artifacts_dir=os.path.join(project_root(), "artifacts"), profile=args.profile, cache=cache,
+                  checkpoint=args.checkpoint or None, checkpoint_every=args.checkpoint_every)
+    if args.mode == "columns":
+        metrics = bt.run_columns(ticks.columns() if hasattr(ticks, "columns") else ticks_to_columns(ticks))
+    else:
+        report = (lambda i, m: print(f"[{i} ticks]", m)) if args.progress else None
+        metrics = bt.run(ticks, on_progress=report, every=args.progress or 1, resume=args.resume)
     print("Backtest:", metrics)
+    if bt.profiler is not None:
+        for name, st in bt.profiler.report()["stages"].items():
+            print(f"  {name:28s} {st['calls']:>9d} calls  {st['total_s']:8.3f}s  {st['share']:6.1%}  p99 <{st['p99_us']:g}us")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,46 @@
+import argparse, os, json
+from crypto_quant_ai.config.config import load_policy, policy_hash, project_root
+from crypto_quant_ai.backtest.sweep import run_sweep
+from crypto_quant_ai.data.feed import SyntheticTicks, ticks_to_columns
+from crypto_quant_ai.data.colstore import open_ticks
+
+DEFAULT_GRID = {
+    "momentum_funding": {"lookback": [20, 30, 60], "thresh": [0.3, 0.5, 1.0]},
+    "perp_skew_mm": {"skew_bps": [3, 5, 8]},
+}
+
+def main():
+    parser = argparse.ArgumentParser(description="Parameter sweep + walk-forward over Backtest in a process pool")
+    parser.add_argument("--policy", default=os.path.join(project_root(), "src/crypto_quant_ai/config/policy.yml"))
+    parser.add_argument("--dataset", default="", help="CSV or colstore (.ticks) file; synthetic when empty")
+    parser.add_argument("--steps", type=int, default=100000, help="synthetic ticks")
+    parser.add_argument("--grid", default="", help="JSON grid (or path to one); default sweeps momentum_funding x perp_skew_mm")
+    parser.add_argument("--folds", type=int, default=4, help="walk-forward windows")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--mode", choices=["columns","event"], default="columns")
+    parser.add_argument("--out", default=os.path.join(project_root(), "artifacts", "sweep"))
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--cache", default="", help="ResultCache file; unchanged runs are not replayed")
+    args = parser.parse_args()
+
+    pol = load_policy(args.policy)
+    print("Policy hash:", policy_hash(pol))
+    if args.grid:
+        grid = json.load(open(args.grid)) if os.path.exists(args.grid) else json.loads(args.grid)
+    else:
+        grid = DEFAULT_GRID
+    if args.dataset and os.path.exists(args.dataset):
+        cols = open_ticks(args.dataset).columns()
+    else:
+        cols = ticks_to_columns(SyntheticTicks(steps=args.steps, start_ts=0))  # fixed ts: same columns, same cache keys
+
+    res = run_sweep(cols, grid, pol, args.out, folds=args.folds, workers=args.workers, mode=args.mode,
+                    cache_path=args.cache or None)
+    print(f"{len(res['rows'])} runs, {res['n_trials']} trials per window -> {args.out}")
+    for r in res["rows"][:args.top]:
+        print(f"{r['run_id']}  dsr={r['dsr']:.3f}  sharpe={r['sharpe']:.2f}  pnl={r['pnl']:.2f}  trades={r['trades']}  {json.dumps(r['config'])}")
+    for wf in res["walk_forward"]:
+        print(f"walk-forward {wf['train']} -> {wf['test']}: {json.dumps(wf['config'])}  oos sharpe={wf['oos']['sharpe']:.2f} pnl={wf['oos']['pnl']:.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,28 @@
 from typing import Dict, Any, Optional
+import inspect
+
+# Side codes for array-level signals: 0 = no order, FADE = against the
+# current position (sell when long, buy when flat or short)
+BUY, SELL, FADE = 1, -1, 2
 
 class Strategy:
     name = "base"
 
     def step(self, tick: Dict[str, Any], pos: float) -> Optional[Dict[str, Any]]:
         raise NotImplementedError
+
+    def signals(self, cols: Dict[str, Any]):
+        """Array form of `step` for `Backtest.run_columns`: (side int8 array, weight array or scalar)."""
+        raise NotImplementedError
+
+    def params(self) -> Dict[str, Any]:
+        """Constructor arguments (read back from same-named attributes); part of the backtest cache key."""
+        sig = inspect.signature(type(self).__init__)
+        return {k: getattr(self, k) for k in list(sig.parameters)[1:]}
+
+    def get_state(self) -> Dict[str, Any]:
+        """Internal state for a backtest checkpoint (by default the instance attributes)."""
+        return {k: v for k, v in vars(self).items() if not callable(v)}
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        vars(self).update(state)
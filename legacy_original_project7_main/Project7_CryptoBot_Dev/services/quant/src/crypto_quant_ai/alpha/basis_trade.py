@@ -1,5 +1,6 @@
 from typing import Dict, Any, Optional
-from .base import Strategy
+import numpy as np
+from .base import Strategy, BUY, SELL
 
 class BasisCarry(Strategy):
     name = "basis_carry"
@@ -16,3 +17,9 @@ class BasisCarry(Strategy):
         elif basis_bps < -self.fwd_basis_bps:
             return {"action":"buy", "weight": 0.5}
         return None
+
+    def signals(self, cols: Dict[str, Any]):
+        fr = np.asarray(cols.get("funding_rate", np.zeros(len(cols["mid"]))), dtype=float)
+        basis_bps = fr * 1e4 * 1440
+        side = np.where(basis_bps > self.fwd_basis_bps, SELL, np.where(basis_bps < -self.fwd_basis_bps, BUY, 0))
+        return side.astype(np.int8), 0.5
@@ -1,5 +1,6 @@
 from typing import Dict, Any, Optional
-from .base import Strategy
+import numpy as np
+from .base import Strategy, BUY, SELL
 
 class CrossExchangeArb(Strategy):
     name = "xex_arb"
@@ -8,6 +9,9 @@ class CrossExchangeArb(Strategy):
         self.key = other_price_key
         self.thresh = trigger_bps
 
+    def params(self) -> Dict[str, Any]:
+        return {"other_price_key": self.key, "trigger_bps": self.thresh}
+
     def step(self, tick: Dict[str, Any], pos: float) -> Optional[Dict[str, Any]]:
         if self.key not in tick:
             return None
@@ -15,3 +19,11 @@ class CrossExchangeArb(Strategy):
         if abs(delta) >= self.thresh:
             return {"action": "buy" if delta>0 else "sell", "weight": 0.7}
         return None
+
+    def signals(self, cols: Dict[str, Any]):
+        mid = np.asarray(cols["mid"], dtype=float)
+        if self.key not in cols:
+            return np.zeros(mid.size, dtype=np.int8), 0.7
+        delta = (np.asarray(cols[self.key], dtype=float) - mid) / np.maximum(mid, 1e-9) * 1e4
+        side = np.where(np.abs(delta) >= self.thresh, np.where(delta > 0, BUY, SELL), 0)
+        return side.astype(np.int8), 0.7
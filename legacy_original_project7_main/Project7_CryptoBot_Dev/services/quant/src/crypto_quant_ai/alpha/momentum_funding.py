@@ -1,5 +1,6 @@
 from typing import Dict, Any, Optional
-from .base import Strategy
+import numpy as np
+from .base import Strategy, BUY, SELL
 
 class MomentumFunding(Strategy):
     name = "momentum_funding"
@@ -23,3 +24,14 @@ class MomentumFunding(Strategy):
         elif adj < -self.thresh/1e3:
             return {"action":"sell", "weight": 1.0}
         return None
+
+    def signals(self, cols: Dict[str, Any]):
+        mid = np.asarray(cols["mid"], dtype=float)
+        side = np.zeros(mid.size, dtype=np.int8)
+        n = mid.size - self.lookback + 1
+        if n > 0:
+            first, last = mid[:n], mid[self.lookback - 1:]
+            ret = (last - first) / np.maximum(first, 1e-9)
+            adj = ret - self.funding_bias * self.lookback
+            side[self.lookback - 1:] = np.where(adj > self.thresh/1e3, BUY, np.where(adj < -self.thresh/1e3, SELL, 0))
+        return side, 1.0
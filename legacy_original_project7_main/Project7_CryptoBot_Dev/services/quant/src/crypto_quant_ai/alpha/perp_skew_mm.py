@@ -1,5 +1,6 @@
 from typing import Dict, Any, Optional
-from .base import Strategy
+import numpy as np
+from .base import Strategy, FADE
 
 class PerpSkewMM(Strategy):
     name = "perp_skew_mm"
@@ -15,3 +16,7 @@ class PerpSkewMM(Strategy):
             side = "sell" if pos > 0 else "buy"
             return {"action": side, "weight": 0.25, "post_only": True}
         return None
+
+    def signals(self, cols: Dict[str, Any]):
+        spread_bps = (np.asarray(cols["spread"], dtype=float) / np.asarray(cols["mid"], dtype=float)) * 1e4
+        return np.where(spread_bps >= self.skew_bps, FADE, 0).astype(np.int8), 0.25
@@ -1,5 +1,4 @@
 
-import uvicorn
 from fastapi import FastAPI
 from pydantic import BaseModel
 from typing import List
@@ -69,4 +68,5 @@ if Instrumentator is not None:
     Instrumentator().instrument(app).expose(app, include_in_schema=False, should_gzip=True)
 
 if __name__ == "__main__":
+    import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8001)
@@ -0,0 +1,62 @@
+from typing import Dict, Any, Optional
+import json, os, sqlite3, threading, time
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_used ON results (used_at);
+"""
+
+class ResultCache:
+    """
+    Local store of backtest results ({"metrics", "card"}) keyed by
+    Backtest.cache_key, a content hash of everything the result depends on.
+    Keys never go stale, so there is no TTL; past max_entries the least
+    recently used results are evicted. One SQLite file (WAL mode), safe to
+    share between sweep workers.
+    """
+    def __init__(self, path: str, max_entries: int = 10000):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be > 0")
+        self.path = path
+        self.max_entries = int(max_entries)
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._conn() as db:
+            db.executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=30.0)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._local.db = db
+        return db
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        db = self._conn()
+        with db:
+            row = db.execute("SELECT payload FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            db.execute("UPDATE results SET used_at = ? WHERE key = ?", (time.time(), key))
+        return json.loads(row[0])
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        db = self._conn()
+        with db:
+            db.execute("INSERT OR REPLACE INTO results (key, payload, used_at) VALUES (?, ?, ?)",
+                       (key, json.dumps(result), time.time()))
+            db.execute("DELETE FROM results WHERE key IN ("
+                       "SELECT key FROM results ORDER BY used_at DESC LIMIT -1 OFFSET ?)", (self.max_entries,))
+
+    def __len__(self) -> int:
+        return self._conn().execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def clear(self) -> None:
+        with self._conn() as db:
+            db.execute("DELETE FROM results")
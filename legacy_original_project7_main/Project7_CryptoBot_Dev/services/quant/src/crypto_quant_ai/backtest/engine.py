@@ -1,9 +1,28 @@
 from dataclasses import dataclass, asdict
-from typing import Dict, Any, List, Tuple
+from typing import Callable, Dict, Any, Iterable, Iterator, List, Optional, Tuple, TYPE_CHECKING
 from ..execution.oms_async import OMS, Order, SimExchange, SmartRouter
 from ..risk.guards import run_guard_chain
-from ..data.feed import predicted_slippage_bps
-import time, json, math, statistics, hashlib, os, pathlib, random
+from ..data.feed import predicted_slippage_bps, fingerprint, iter_from
+from ..config.config import policy_hash
+from ..alpha.base import FADE
+from ..metrics.online import OnlineMetrics
+from .profiler import StageProfiler
+from contextlib import contextmanager
+from decimal import Decimal
+import time, json, math, hashlib, heapq, os, pathlib, pickle, random
+if TYPE_CHECKING:
+    from quant.fixed_point import FixedSpec
+    from .cache import ResultCache
+
+# part of every result-cache key: bump whenever a change alters simulated results
+ENGINE_VERSION = 2
+_MISSING = object()
+
+# fixed ctx fields of the simulated venue, shared by both engine modes
+MD_AGE_MS = 100
+VENUE_SCORE = 0.8
+LIQ_BUFFER_BPS = 200
+_SCAN_BLOCK = 4096
 
 @dataclass
 class Metrics:
@@ -14,86 +33,482 @@ class Metrics:
     psr: float
     trades: int
     winrate: float
+    max_drawdown: float = 0.0
+    skew: float = 0.0  # of the per-fill returns, for the deflated Sharpe ratio
+    kurt: float = 3.0  # non-excess
+
+def _bps_rate(bps: float) -> Decimal:
+    return Decimal(str(bps)) / 10000
 
-def _psr(returns: List[float]) -> float:
-    if len(returns) < 10:
-        return 0.0
-    mu = statistics.mean(returns)
-    sd = statistics.pstdev(returns) or 1e-9
-    sr = (mu / sd) * (len(returns)**0.5)
-    # Probabilistic Sharpe Ratio (approx): Phi((sr - 0)/sqrt(1 - 0.5))
-    import math
-    from math import erf, sqrt
-    z = sr / math.sqrt(1.0 - 0.5)
-    return 0.5 * (1 + erf(z / math.sqrt(2)))
+class _Leg:
+    """Running cash, position and trade stats of one symbol."""
+    def __init__(self, symbol: str, spec: 'FixedSpec' = None, portfolio: OnlineMetrics = None):
+        self.symbol = symbol
+        self.spec = spec  # when set, cash/fees/position are booked exactly in ticks/lots
+        self.book = None
+        if spec is not None:
+            from quant.fixed_point import PnLBook
+            self.book = PnLBook(spec)
+        self.cash = 0.0
+        self.pos = 0.0
+        self.fees = 0.0
+        self.funding_pnl = 0.0
+        self.stats = OnlineMetrics()  # per-fill returns; O(1) memory however many fills
+        self.portfolio = portfolio  # shared across legs by MultiSymbolBacktest
+        self.prev_mid = None
 
 class Backtest:
-    def __init__(self, policy, strategies: List, artifacts_dir: str):
+    """
+    profile: time each stage of the event loop (see StageProfiler) and write
+        profile.json / profile.collapsed next to the model card.
+    cache: a ResultCache for `run_columns`; runs whose inputs hash to a
+        stored key return the stored metrics and model card without
+        replaying the data. The key covers policy, data fingerprint,
+        strategy classes and params, spec, mode and ENGINE_VERSION;
+        strategies are assumed fresh (no state from an earlier run). `run`
+        is never cached: its fills depend on the FM gate's answers, which
+        come from a remote service no key can pin down.
+    checkpoint: file that `run` rewrites every checkpoint_every ticks with
+        the full engine state (leg, strategies' get_state, venue order ids,
+        the global RNG) and the feed offset; run(..., resume=True) continues
+        from it and ends with the same metrics as an uninterrupted run. The
+        file is removed once the run completes.
+    """
+    _slip = staticmethod(predicted_slippage_bps)
+
+    def __init__(self, policy, strategies: List, artifacts_dir: str, spec: 'FixedSpec' = None,
+                 profile: bool = False, cache: 'ResultCache' = None,
+                 checkpoint: str = None, checkpoint_every: int = 100_000):
         venues = [SimExchange(name="CEX_A"), SimExchange(name="CEX_B")]
         self.oms = OMS(SmartRouter(venues), policy, tca_ledger=None)
         self.strats = strategies
         self.artifacts = artifacts_dir
+        self.spec = spec  # when set, cash/fees/position are booked exactly in ticks/lots
+        self.profile = profile
+        self.cache = cache
+        self.profiler = None  # StageProfiler of the last profiled run
+        self.checkpoint = checkpoint
+        self.checkpoint_every = checkpoint_every
+        self._venues = {v.name: v for v in venues}
         os.makedirs(self.artifacts, exist_ok=True)
 
-    def run(self, ticks) -> Metrics:
-        cash = 0.0
-        pos = 0.0
-        fees = 0.0
-        funding_pnl = 0.0
-        rets = []
-        wins = 0
-        trades = 0
-        prev_mid = None
-
-        for t in ticks:
-            mid = t["mid"]
-            if prev_mid is None:
-                prev_mid = mid
-            ctx = {
-                "mid": mid,
-                "spread": t["spread"],
-                "md_age_ms": 100,
-                "bp_per_min": t["bp_per_min"],
-                "venue_score": 0.8,
-                "pred_slippage_bps": predicted_slippage_bps(t["spread"], t["bp_per_min"]),
-                "liq_buffer_bps": 200,
-                "position_usd": abs(pos) * mid
-            }
-            # Strategy decisions
-            for s in self.strats:
-                sig = s.step(t, pos)
-                if not sig:
-                    continue
-                side = sig.get("action")
-                w = sig.get("weight", 0.25)
-                qty = max(0.001, w * 0.01)  # fixed tiny sizing for demo
-                price = None if side in ("buy","sell") else None
-                order = Order(symbol="BTC/USDT", side=side, qty=qty, price=price, post_only=sig.get("post_only", False))
-                resp = self.oms.submit(order, ctx)
-                if resp["status"] == "ACK":
-                    f = resp["fill"]
-                    trades += 1
-                    fees += f["fee"]
-                    cash += -f["price"] * f["qty"] if side=="buy" else f["price"] * f["qty"]
-                    pos += f["qty"] if side=="buy" else -f["qty"]
-                    pnl_tick = (mid - prev_mid) * pos
-                    rets.append(pnl_tick - f["fee"])
-                    if pnl_tick > 0:
-                        wins += 1
-            # funding
-            funding_pnl += pos * mid * t.get("funding_rate", 0.0) / 24.0
-            prev_mid = mid
-
-        final_pnl = cash + pos * prev_mid
-        sharpe = (statistics.mean(rets)/(statistics.pstdev(rets) or 1e-9)) * (len(rets)**0.5) if rets else 0.0
-        psr = _psr(rets) if rets else 0.0
-        winrate = wins / max(1, trades)
-        # model card
+    def cache_key(self, data, mode: str = "event") -> Optional[str]:
+        """Content hash of this run's inputs, or None when the data has no fingerprint."""
+        fp = fingerprint(data)
+        if fp is None:
+            return None
+        blob = json.dumps({**self._inputs(mode), "data": fp}, sort_keys=True, default=str)
+        return hashlib.sha256(blob.encode()).hexdigest()
+
+    def _inputs(self, mode: str) -> Dict[str, Any]:
+        """Everything a result depends on except the data."""
+        return {
+            "engine": ENGINE_VERSION, "mode": mode, "policy": policy_hash(self.oms.policy),
+            "strategies": [[type(s).__name__, s.params()] for s in self.strats],
+            "spec": repr(self.spec) if self.spec is not None else None,
+        }
+
+    def _cached(self, key: Optional[str]) -> Optional[Metrics]:
+        hit = self.cache.get(key) if key is not None else None
+        if hit is None:
+            return None
+        with open(os.path.join(self.artifacts, "model_card.json"), "w") as f:
+            json.dump(hit["card"], f, indent=2)
+        return Metrics(**hit["metrics"])
+
+    @contextmanager
+    def _profiling(self, prof: StageProfiler):
+        # instance attributes shadow the methods for the run, then are removed again
+        targets = [(self, "_step", "tick"), (self, "_slip", "slippage"), (self.oms, "submit", "oms.submit"),
+                   (self.oms, "_guard", "guards"), (self.oms, "_gate", "fm_gate"),
+                   (self.oms.router, "route", "route"), (self.oms.router, "rank", "route.rank")]
+        targets += [(v, "execute", f"execute.{v.name}") for v in self._venues.values()]
+        targets += [(s, "step", f"strategy.{s.name}") for s in self.strats]
+        saved = [(obj, attr, vars(obj).get(attr, _MISSING)) for obj, attr, _ in targets]
+        for obj, attr, stage in targets:
+            setattr(obj, attr, prof.wrap(getattr(obj, attr), stage))
+        prof.start()
+        try:
+            yield prof
+        finally:
+            prof.stop()
+            for obj, attr, old in saved:
+                if old is _MISSING:
+                    vars(obj).pop(attr, None)
+                else:
+                    setattr(obj, attr, old)
+
+    def _fee_rate(self, venue: str, liquidity: str) -> Decimal:
+        v = self._venues[venue]
+        return _bps_rate(v.maker_fee_bps if liquidity == "M" else v.taker_fee_bps)
+
+    def run(self, ticks, on_progress: Callable[[int, Metrics], None] = None, every: int = 100_000,
+            resume: bool = False) -> Metrics:
+        """
+        on_progress(ticks seen, metrics so far) is called every `every` ticks.
+        resume: continue from self.checkpoint if it exists; the feed is
+        entered at the saved offset (feed.iter_from when available).
+        """
+        key = self.cache_key(ticks) if self.checkpoint else None
+        leg, start = _Leg("BTC/USDT", self.spec), 0
+        if resume and self.checkpoint and os.path.exists(self.checkpoint):
+            leg, start = self._restore(key)
+        feed = iter_from(ticks, start) if start else ticks
+        if self.profile:
+            self.profiler = StageProfiler()
+            with self._profiling(self.profiler):
+                self._loop(leg, feed, on_progress, every, start, key)
+            self.profiler.write(self.artifacts)
+        else:
+            self._loop(leg, feed, on_progress, every, start, key)
+        m = self._leg_metrics(leg)
+        self._write_card(m)
+        if self.checkpoint and os.path.exists(self.checkpoint):
+            os.remove(self.checkpoint)
+        return m
+
+    def _loop(self, leg: "_Leg", ticks, on_progress, every: int, start: int = 0, key: str = None) -> None:
+        save = self.checkpoint_every if self.checkpoint else 0
+        for i, t in enumerate(ticks, start + 1):
+            self._step(leg, t, self.strats)
+            if on_progress is not None and i % every == 0:
+                on_progress(i, self._leg_metrics(leg))
+            if save and i % save == 0:
+                self._save(leg, i, key)
+
+    def _save(self, leg: "_Leg", offset: int, key: Optional[str]) -> None:
+        state = {
+            "engine": ENGINE_VERSION, "key": key, "inputs": self._inputs("event"), "offset": offset, "leg": leg,
+            "strategies": [s.get_state() for s in self.strats],
+            "venues": {name: v.get_state() for name, v in self._venues.items()},
+            "random": random.getstate(),
+        }
+        tmp = self.checkpoint + ".tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, self.checkpoint)  # a crash mid-write leaves the previous checkpoint intact
+
+    def _restore(self, key: Optional[str]) -> Tuple["_Leg", int]:
+        with open(self.checkpoint, "rb") as f:
+            state = pickle.load(f)
+        if state["engine"] != ENGINE_VERSION:
+            raise ValueError(f"checkpoint is from engine version {state['engine']}, this is {ENGINE_VERSION}")
+        # the key also covers the data, but only feeds with a fingerprint have one;
+        # policy, strategy params and spec are checked either way, as set_state
+        # would otherwise silently overwrite the constructor params
+        if state["inputs"] != self._inputs("event") or (
+                key is not None and state["key"] is not None and state["key"] != key):
+            raise ValueError("checkpoint was written by a backtest with different inputs")
+        for s, st in zip(self.strats, state["strategies"]):
+            s.set_state(st)
+        for name, st in state["venues"].items():
+            self._venues[name].set_state(st)
+        random.setstate(state["random"])
+        return state["leg"], state["offset"]
+
+    def _step(self, leg: "_Leg", t: Dict[str, Any], strats) -> None:
+        mid = t["mid"]
+        if leg.prev_mid is None:
+            leg.prev_mid = mid
+        ctx = {
+            "mid": mid,
+            "spread": t["spread"],
+            "md_age_ms": MD_AGE_MS,
+            "bp_per_min": t["bp_per_min"],
+            "venue_score": VENUE_SCORE,
+            "pred_slippage_bps": self._slip(t["spread"], t["bp_per_min"]),
+            "liq_buffer_bps": LIQ_BUFFER_BPS,
+            "position_usd": abs(leg.pos) * mid
+        }
+        # Strategy decisions
+        for s in strats:
+            sig = s.step(t, leg.pos)
+            if not sig:
+                continue
+            side = sig.get("action")
+            w = sig.get("weight", 0.25)
+            qty = max(0.001, w * 0.01)  # fixed tiny sizing for demo
+            price = None if side in ("buy","sell") else None
+            order = Order(symbol=leg.symbol, side=side, qty=qty, price=price, post_only=sig.get("post_only", False))
+            resp = self.oms.submit(order, ctx)
+            if resp["status"] == "ACK":
+                f = resp["fill"]
+                if leg.book is not None:
+                    leg.book.fill(side, f["price"], f["qty"], self._fee_rate(resp["venue"], f["liquidity"]))
+                    leg.pos = float(leg.spec.qty_decimal(leg.book.position))
+                else:
+                    leg.fees += f["fee"]
+                    leg.cash += -f["price"] * f["qty"] if side=="buy" else f["price"] * f["qty"]
+                    leg.pos += f["qty"] if side=="buy" else -f["qty"]
+                pnl_tick = (mid - leg.prev_mid) * leg.pos
+                leg.stats.add(pnl_tick - f["fee"], pnl_tick > 0)
+                if leg.portfolio is not None:
+                    leg.portfolio.add(pnl_tick - f["fee"], pnl_tick > 0)
+        # funding
+        leg.funding_pnl += leg.pos * mid * t.get("funding_rate", 0.0) / 24.0
+        leg.prev_mid = mid
+
+    def _leg_metrics(self, leg: "_Leg") -> Metrics:
+        cash, fees, st = leg.cash, leg.fees, leg.stats
+        if leg.prev_mid is None:
+            final_pnl = 0.0
+        elif leg.book is not None:
+            snap = leg.book.snapshot()
+            cash, fees = float(snap["cash"]), float(snap["fees"])
+            final_pnl = float(leg.spec.cash_decimal(leg.book.equity(leg.spec.to_ticks(leg.prev_mid))))
+        else:
+            final_pnl = cash + leg.pos * leg.prev_mid
+        return Metrics(final_pnl, fees, leg.funding_pnl, st.sharpe, st.psr, st.n, st.wins / max(1, st.n), st.max_dd,
+                       st.skew, st.kurt)
+
+    def _write_card(self, m: Metrics, extra: Dict[str, Any] = None) -> Dict[str, Any]:
         card = {
-            "final_pnl": final_pnl, "fees": fees, "funding_pnl": funding_pnl,
-            "sharpe": sharpe, "psr": psr, "trades": trades, "winrate": winrate,
+            "final_pnl": m.pnl, "fees": m.fees, "funding_pnl": m.funding_pnl,
+            "sharpe": m.sharpe, "psr": m.psr, "trades": m.trades, "winrate": m.winrate,
+            "max_drawdown": m.max_drawdown, "skew": m.skew, "kurt": m.kurt,
             "ts": time.time()
         }
+        card.update(extra or {})
         with open(os.path.join(self.artifacts, "model_card.json"), "w") as f:
             json.dump(card, f, indent=2)
-        return Metrics(final_pnl, fees, funding_pnl, sharpe, psr, trades, winrate)
+        return card
+
+    def run_columns(self, cols: Dict[str, Any]) -> Metrics:
+        """
+        Research mode: the same simulation as `run` on NumPy tick columns
+        (see data.feed.ticks_to_columns / CSVTicks.columns / ColumnTicks.columns). Strategies must
+        implement `signals(cols)`.
+
+        The stateless guards become masks; only the position limit is
+        scanned sequentially (in blocks, skipping stretches where the
+        position is over the limit). Orders fill as taker at mid +/- spread/2
+        on the router's first venue, as market orders do in `run`. The FM
+        gate is not consulted (treated as allowed, size 1). PnL, fees,
+        funding and trades match `run` exactly; sharpe/psr to float rounding.
+        """
+        import numpy as np
+        key = self.cache_key(cols, "columns") if self.cache is not None else None
+        hit = self._cached(key)
+        if hit is not None:
+            return hit
+        mid = np.asarray(cols["mid"], dtype=float)
+        spread = np.asarray(cols["spread"], dtype=float)
+        n = mid.size
+        if n == 0 or not self.strats:  # nothing trades: the flat result `run` gives
+            m = Metrics(0.0, 0.0, 0.0, 0.0, 0.0, 0, 0.0)
+            self._write_card(m)
+            return m
+        fr = np.asarray(cols.get("funding_rate", np.zeros(n)), dtype=float)
+
+        sides, qtys = [], []
+        for s in self.strats:
+            side, w = s.signals(cols)
+            sides.append(np.broadcast_to(np.asarray(side, dtype=np.int8), (n,)))
+            qtys.append(np.broadcast_to(np.maximum(0.001, np.asarray(w, dtype=float) * 0.01), (n,)))
+        S = np.stack(sides, axis=1)
+        Q = np.stack(qtys, axis=1)
+        cand = np.flatnonzero(_static_guard_mask(cols, self.oms.policy) & (S != 0).any(axis=1))
+        limit = self.oms.policy.position_limit_usd
+        if self.spec is not None:
+            # `run` books lot-rounded sizes: scan in whole lots (exact in float), so the
+            # guard, FADE sides and funding see the position the event loop does
+            lot = float(self.spec.lot_size)
+            rows, strat, dq, after = _fill_scan(mid[cand] * lot, S[cand], self.spec.to_lots(Q[cand]).astype(float), limit)
+        else:
+            rows, strat, dq, after = _fill_scan(mid[cand], S[cand], Q[cand], limit)
+        t = cand[rows]
+        side = S[t, strat].astype(int)
+        # sides from the signals (a zero-lot fill has dq == 0); FADE trades against the position before the fill
+        sgn = np.where(side == FADE, np.where(after - dq > 0, -1, 1), side)
+        qty = Q[t, strat]  # fees are charged on the order size, as the venue does
+        price = mid[t] + sgn * spread[t] / 2
+        venue = self.oms.router.rank({"venue_score": VENUE_SCORE})[0]
+        fee = (venue.taker_fee_bps/1e4) * price * qty
+        trades = int(t.size)
+
+        if self.spec is not None:
+            from quant.fixed_point import PnLBook
+            book = PnLBook(self.spec)
+            lots = self.spec.to_lots(qty)
+            book.fills(sgn, self.spec.to_ticks(price), lots, self._fee_rate(venue.name, "T"))
+            # position after each fill, converted as leg.pos is (via Decimal)
+            held, inv = np.unique(np.cumsum(sgn * lots), return_inverse=True)
+            after = np.array([float(self.spec.qty_decimal(v)) for v in held.tolist()])[inv]
+            snap = book.snapshot()
+            cash, fees = float(snap["cash"]), float(snap["fees"])
+            final_pnl = float(self.spec.cash_decimal(book.equity(self.spec.to_ticks(float(mid[-1])))))
+        else:
+            flow = np.where(sgn > 0, -price * qty, price * qty)
+            # cumsum adds in fill order, exactly like the event loop
+            cash = float(np.cumsum(flow)[-1]) if trades else 0.0
+            fees = float(np.cumsum(fee)[-1]) if trades else 0.0
+            final_pnl = cash + (float(after[-1]) if trades else 0.0) * float(mid[-1])
+
+        prev_mid = np.concatenate((mid[:1], mid[:-1]))
+        pnl_tick = (mid[t] - prev_mid[t]) * after
+        rets = pnl_tick - fee
+        wins = int((pnl_tick > 0).sum())
+        # position held at the end of each tick, for funding
+        last = np.flatnonzero(np.r_[t[1:] != t[:-1], True]) if trades else np.zeros(0, dtype=int)
+        held = np.zeros(n)
+        held[t[last]] = after[last]
+        has = np.zeros(n, dtype=bool)
+        has[t[last]] = True
+        pos_end = held[np.maximum.accumulate(np.where(has, np.arange(n), 0))]
+        funding_pnl = float(np.cumsum(pos_end * mid * fr / 24.0)[-1])
+
+        sharpe = psr = max_dd = skew = 0.0
+        kurt = 3.0
+        if trades:
+            sd = float(rets.std()) or 1e-9
+            sharpe = float(rets.mean()) / sd * (trades ** 0.5)
+            if trades >= 10:  # OnlineMetrics.psr on NumPy moments
+                psr = 0.5 * (1 + math.erf(sharpe / math.sqrt(1.0 - 0.5) / math.sqrt(2)))
+            cum = np.cumsum(rets)
+            max_dd = float((np.maximum.accumulate(np.maximum(cum, 0.0)) - cum).max())
+            dev = rets - rets.mean()
+            m2 = float((dev * dev).sum())
+            if m2 > 0:  # OnlineMetrics.skew / kurt
+                skew = math.sqrt(trades) * float((dev ** 3).sum()) / m2 ** 1.5
+                kurt = trades * float((dev ** 4).sum()) / (m2 * m2)
+        m = Metrics(final_pnl, fees, funding_pnl, sharpe, psr, trades, wins / max(1, trades), max_dd, skew, kurt)
+        card = self._write_card(m)
+        if key is not None:
+            self.cache.put(key, {"metrics": asdict(m), "card": card})
+        return m
+
+
+
+def _tagged(feed: Iterable[Dict[str, Any]], i: int, symbol: str) -> Iterator[Tuple[float, int, str, Dict[str, Any]]]:
+    # (ts, stream index) orders the merge; the index breaks ts ties, so ticks are never compared
+    for t in feed:
+        yield t["ts"], i, symbol, t
+
+class MultiSymbolBacktest(Backtest):
+    """
+    Event-driven backtest over several instruments.
+
+    Per-symbol tick streams (each sorted by ts) are merged lazily with
+    heapq.merge, so memory is one pending tick per symbol however long the
+    feeds are. Every symbol keeps its own position, cash and stats, and a
+    tick only reaches the strategies subscribed to its symbol.
+
+    strategies: {symbol: [Strategy, ...]}; give each symbol its own
+        instances, since strategies keep per-instrument state.
+    specs: optional {symbol: FixedSpec} for exact fixed-point books.
+    """
+    def __init__(self, policy, strategies: Dict[str, List], artifacts_dir: str, specs: Dict[str, 'FixedSpec'] = None):
+        super().__init__(policy, [], artifacts_dir)
+        self.subs = strategies
+        self.specs = specs or {}
+
+    def run(self, feeds: Dict[str, Iterable[Dict[str, Any]]]) -> Tuple[Metrics, Dict[str, Metrics]]:
+        """Returns (portfolio totals, per-symbol metrics)."""
+        portfolio = OnlineMetrics()  # fills of all legs in merged time order, for the portfolio drawdown
+        legs = {sym: _Leg(sym, self.specs.get(sym), portfolio) for sym in feeds}
+        streams = [_tagged(feed, i, sym) for i, (sym, feed) in enumerate(feeds.items())]
+        for _, _, sym, t in heapq.merge(*streams):
+            self._step(legs[sym], t, self.subs.get(sym, ()))
+        per = {sym: self._leg_metrics(leg) for sym, leg in legs.items()}
+        total = Metrics(
+            sum(m.pnl for m in per.values()),
+            sum(m.fees for m in per.values()),
+            sum(m.funding_pnl for m in per.values()),
+            portfolio.sharpe,
+            portfolio.psr,
+            portfolio.n,
+            portfolio.wins / max(1, portfolio.n),
+            portfolio.max_dd,
+            portfolio.skew,
+            portfolio.kurt,
+        )
+        self._write_card(total, {"symbols": {sym: asdict(m) for sym, m in per.items()}})
+        return total, per
+
+
+def _static_guard_mask(cols: Dict[str, Any], policy):
+    """Per-tick result of every guard except the position limit, for the ctx built in `run`."""
+    import numpy as np
+    mid = np.asarray(cols["mid"], dtype=float)
+    spread = np.asarray(cols["spread"], dtype=float)
+    bpmin = np.asarray(cols["bp_per_min"], dtype=float)
+    pred_slip = np.minimum(50.0, 0.5 * spread + 0.2 * bpmin)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ok = (mid > 0) & ((spread / mid) * 1e4 <= policy.max_spread_bps)
+    ok &= bpmin <= policy.volatility_cap_bp_per_min
+    ok &= pred_slip <= policy.max_slippage_bps
+    fixed = (MD_AGE_MS <= policy.freshness_ms and LIQ_BUFFER_BPS >= policy.liquidation_buffer_bps
+             and VENUE_SCORE >= policy.venue_min_score)
+    return ok & fixed
+
+def _next_within(mid, start: int, apos: float, limit: float) -> int:
+    # first i >= start with |pos| * mid[i] <= limit (the position-limit guard), else len(mid)
+    import numpy as np
+    step = _SCAN_BLOCK
+    while start < mid.size:
+        hit = np.flatnonzero(apos * mid[start:start + step] <= limit)
+        if hit.size:
+            return start + int(hit[0])
+        start += step
+        step *= 2
+    return mid.size
+
+def _fill_scan(mid, S, Q, limit: float):
+    """
+    Position-limit pass over candidate ticks: mid (m,), side codes S and
+    order sizes Q (m, strategies). Within a tick every strategy sees the
+    position left by the previous one; the guard uses the position at the
+    start of the tick. Returns (row, strategy, signed qty, position after)
+    per fill, in fill order.
+    """
+    import numpy as np
+    m, k = S.shape
+    fade = (S == FADE).any(axis=1)
+    flows = np.where(S == FADE, 0, S) * Q
+    out = []
+    pos = 0.0
+    i = 0
+    while i < m:
+        if abs(pos) * mid[i] > limit:
+            i = _next_within(mid, i + 1, abs(pos), limit)
+            continue
+        if fade[i]:
+            # sides depend on the running position: step through the run of such ticks
+            nf = np.flatnonzero(~fade[i:i + _SCAN_BLOCK])
+            stop = i + int(nf[0]) if nf.size else min(m, i + _SCAN_BLOCK)
+            rr, cc, dd, aa = [], [], [], []
+            for r, (srow, qrow, mr) in enumerate(zip(S[i:stop].tolist(), Q[i:stop].tolist(), mid[i:stop].tolist())):
+                if abs(pos) * mr > limit:
+                    continue
+                for j, sj in enumerate(srow):
+                    if sj == 0:
+                        continue
+                    if sj == FADE:
+                        sj = -1 if pos > 0 else 1
+                    d = sj * qrow[j]
+                    pos += d
+                    rr.append(i + r)
+                    cc.append(j)
+                    dd.append(d)
+                    aa.append(pos)
+            out.append((np.array(rr, dtype=int), np.array(cc, dtype=int), np.array(dd, dtype=float), np.array(aa, dtype=float)))
+            i = stop
+            continue
+        stop = min(m, i + _SCAN_BLOCK)
+        nf = np.flatnonzero(fade[i:stop])
+        if nf.size:
+            stop = i + int(nf[0])
+        seg = flows[i:stop]
+        r = seg.shape[0]
+        cum = np.cumsum(np.concatenate(([pos], seg.ravel())))
+        before = cum[0:r * k:k]
+        bad = np.flatnonzero(np.abs(before) * mid[i:stop] > limit)
+        r_ok = int(bad[0]) if bad.size else r
+        rr, cc = np.nonzero(S[i:i + r_ok] != 0)
+        out.append((i + rr, cc, seg[rr, cc], cum[1 + rr * k + cc]))
+        pos = float(cum[r_ok * k])
+        i += r_ok
+    if not out:
+        e = np.zeros(0)
+        return e.astype(int), e.astype(int), e, e
+    return tuple(np.concatenate(part) for part in zip(*out))
@@ -0,0 +1,93 @@
+from typing import Dict, Any, Callable, List, Tuple
+import json, os, time
+
+class StageProfiler:
+    """
+    Per-stage timing for the event-driven backtest.
+
+    `wrap(fn, stage)` returns fn timed as `stage`; Backtest installs such
+    wrappers on instance attributes (strategy.step, the OMS guard / FM gate
+    hooks, router.rank, venue.execute, ...) only when profiling, so the
+    unprofiled path runs the original callables untouched. Nested stages
+    form stacks: every stage gets calls, inclusive time and a log2
+    latency histogram, every stack its self time.
+    """
+    def __init__(self, root: str = "backtest"):
+        self.root = root
+        self.stages: Dict[str, List[int]] = {}  # stage -> [calls, total ns, hist bucket counts...]
+        self.self_ns: Dict[Tuple[str, ...], int] = {}
+        self._path: Tuple[str, ...] = (root,)
+        self._child: List[int] = [0]
+        self._t0 = None
+        self.wall_ns = 0
+
+    def wrap(self, fn: Callable, stage: str) -> Callable:
+        clock = time.perf_counter_ns
+        def timed(*args, **kwargs):
+            parent = self._path
+            path = self._path = parent + (stage,)
+            self._child.append(0)
+            t0 = clock()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                dt = clock() - t0
+                self._path = parent
+                child = self._child.pop()
+                self._child[-1] += dt
+                self._record(stage, path, dt, dt - child)
+        return timed
+
+    def _record(self, stage: str, path: Tuple[str, ...], dt: int, self_dt: int) -> None:
+        st = self.stages.get(stage)
+        if st is None:
+            st = self.stages[stage] = [0, 0] + [0] * 64
+        st[0] += 1
+        st[1] += dt
+        st[2 + dt.bit_length()] += 1  # bucket b holds [2^(b-1), 2^b) ns
+        self.self_ns[path] = self.self_ns.get(path, 0) + self_dt
+
+    def start(self) -> None:
+        self._t0 = time.perf_counter_ns()
+
+    def stop(self) -> None:
+        if self._t0 is not None:
+            self.wall_ns += time.perf_counter_ns() - self._t0
+            self._t0 = None
+
+    def report(self) -> Dict[str, Any]:
+        """{"wall_s", "stages": {stage: {calls, total_s, share, mean_us, p50_us, p99_us, hist_us}}}; quantiles are histogram bucket upper bounds."""
+        stages = {}
+        for name, st in sorted(self.stages.items(), key=lambda kv: -kv[1][1]):
+            calls, total, hist = st[0], st[1], st[2:]
+            def quantile(q):
+                need, seen = q * calls, 0
+                for b, c in enumerate(hist):
+                    seen += c
+                    if c and seen >= need:
+                        return (1 << b) / 1e3
+                return 0.0
+            stages[name] = {
+                "calls": calls,
+                "total_s": total / 1e9,
+                "share": total / self.wall_ns if self.wall_ns else 0.0,
+                "mean_us": total / calls / 1e3,
+                "p50_us": quantile(0.50),
+                "p99_us": quantile(0.99),
+                "hist_us": {f"<{(1 << b) / 1e3:g}": c for b, c in enumerate(hist) if c},
+            }
+        return {"wall_s": self.wall_ns / 1e9, "stages": stages}
+
+    def collapsed(self) -> str:
+        """Flamegraph collapsed stacks ("a;b;c <self microseconds>" per line); the root's self time is the feed and loop overhead."""
+        self_ns = dict(self.self_ns)
+        staged = sum(self_ns.values())  # everything inside some stage
+        self_ns[(self.root,)] = max(0, self.wall_ns - staged)
+        lines = [f"{';'.join(p)} {ns // 1000}" for p, ns in sorted(self_ns.items()) if ns >= 1000]
+        return "\n".join(lines) + "\n"
+
+    def write(self, out_dir: str) -> None:
+        with open(os.path.join(out_dir, "profile.json"), "w") as f:
+            json.dump(self.report(), f, indent=2)
+        with open(os.path.join(out_dir, "profile.collapsed"), "w") as f:
+            f.write(self.collapsed())
@@ -0,0 +1,187 @@
+from dataclasses import asdict
+from typing import Dict, Any, Iterator, List, Tuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing.shared_memory import SharedMemory
+import itertools, json, math, os
+import numpy as np
+from .engine import Backtest
+from .cache import ResultCache
+from ..alpha.momentum_funding import MomentumFunding
+from ..alpha.perp_skew_mm import PerpSkewMM
+from ..alpha.basis_trade import BasisCarry
+from ..alpha.cross_exchange_arb import CrossExchangeArb
+from ..metrics.dsr import deflated_sharpe_ratio
+from ..data.feed import fingerprint
+
+STRATEGIES = {
+    "momentum_funding": MomentumFunding,
+    "perp_skew_mm": PerpSkewMM,
+    "basis_carry": BasisCarry,
+    "xex_arb": CrossExchangeArb,
+}
+
+Config = Dict[str, Dict[str, Any]]  # {strategy name: constructor kwargs}
+
+def expand_grid(grid: Dict[str, Dict[str, List[Any]]]) -> List[Config]:
+    """
+    {"momentum_funding": {"lookback": [20, 30], "thresh": [0.5]},
+     "perp_skew_mm": {"skew_bps": [3, 5]}} -> 4 configs, each running one
+    instance of every listed strategy.
+    """
+    per = []
+    for name, params in grid.items():
+        if name not in STRATEGIES:
+            raise ValueError(f"unknown strategy {name!r}; expected one of {sorted(STRATEGIES)}")
+        keys = list(params)
+        per.append([(name, dict(zip(keys, vals))) for vals in itertools.product(*(params[k] for k in keys))])
+    return [dict(combo) for combo in itertools.product(*per)]
+
+def walk_forward_windows(n: int, folds: int) -> List[Tuple[int, int]]:
+    """`folds` consecutive equal [start, stop) windows over n ticks; each is the test window of the one before."""
+    if folds < 1 or n < folds:
+        raise ValueError("need 1 <= folds <= number of ticks")
+    edges = [n * k // folds for k in range(folds + 1)]
+    return list(zip(edges[:-1], edges[1:]))
+
+class SharedColumns:
+    """Tick columns copied once into shared memory; workers map read-only views instead of re-reading the data."""
+    def __init__(self, cols: Dict[str, Any]):
+        self._shm = {}
+        self.spec = {}
+        try:
+            for name, col in cols.items():
+                arr = np.ascontiguousarray(col, dtype=float)
+                shm = SharedMemory(create=True, size=max(arr.nbytes, 1))
+                self._shm[name] = shm
+                np.ndarray(arr.shape, dtype=float, buffer=shm.buf)[:] = arr
+                self.spec[name] = (shm.name, arr.shape[0])
+        except Exception:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        for shm in self._shm.values():
+            shm.close()
+            shm.unlink()
+        self._shm = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def attach_columns(spec: Dict[str, Tuple[str, int]]):
+    """(read-only column views, handles to keep alive) for a SharedColumns.spec."""
+    handles, cols = {}, {}
+    for name, (shm_name, n) in spec.items():
+        handles[name] = SharedMemory(name=shm_name)
+        view = np.ndarray((n,), dtype=float, buffer=handles[name].buf)
+        view.flags.writeable = False
+        cols[name] = view
+    return cols, handles
+
+_W: Dict[str, Any] = {}
+
+def _init_worker(spec, policy, mode: str, out_dir: str, cache_path: str = None) -> None:
+    _W["cols"], _W["handles"] = attach_columns(spec)
+    _W.update(policy=policy, mode=mode, out_dir=out_dir, cache=ResultCache(cache_path) if cache_path else None)
+
+class _ColumnTicks:
+    """Tick dicts over columns, for the event engine; fingerprinted like the columns themselves."""
+    def __init__(self, cols: Dict[str, Any]):
+        self.cols = cols
+
+    def __iter__(self) -> Iterator[Dict[str, float]]:
+        names = list(self.cols)
+        for row in zip(*(self.cols[k].tolist() for k in names)):
+            yield dict(zip(names, row))
+
+    def fingerprint(self) -> str:
+        return fingerprint(self.cols)
+
+def _run_one(run_id: str, config: Config, window: Tuple[int, int]) -> Dict[str, Any]:
+    start, stop = window
+    cols = {k: v[start:stop] for k, v in _W["cols"].items()}
+    strats = [STRATEGIES[name](**params) for name, params in config.items()]
+    bt = Backtest(_W["policy"], strats, os.path.join(_W["out_dir"], "runs", run_id), cache=_W["cache"])
+    m = bt.run_columns(cols) if _W["mode"] == "columns" else bt.run(_ColumnTicks(cols))
+    return {"run_id": run_id, "config": config, "window": [start, stop], **asdict(m)}
+
+def rank(rows: List[Dict[str, Any]], n_trials: int) -> List[Dict[str, Any]]:
+    """
+    Adds "dsr" (deflated Sharpe ratio vs n_trials) to every row and sorts
+    best first. Metrics.sharpe is scaled by sqrt(trades); DSR takes the
+    per-trade Sharpe, the trade count and the run's skew and kurtosis.
+    """
+    for r in rows:
+        t = r["trades"]
+        r["dsr"] = (deflated_sharpe_ratio(r["sharpe"] / math.sqrt(t), n_trials, t, r["skew"], r["kurt"])
+                    if t >= 2 else 0.0)
+    return sorted(rows, key=lambda r: r["dsr"], reverse=True)
+
+def walk_forward(rows: List[Dict[str, Any]], windows: List[Tuple[int, int]]) -> List[Dict[str, Any]]:
+    """Best config (by DSR) on each window, scored on the next window."""
+    by_window: Dict[Tuple[int, int], List[Dict[str, Any]]] = {}
+    for r in rows:
+        by_window.setdefault(tuple(r["window"]), []).append(r)
+    out = []
+    for train, test in zip(windows, windows[1:]):
+        best = max(by_window[train], key=lambda r: r["dsr"])
+        oos = next(r for r in by_window[test] if r["config"] == best["config"])
+        out.append({
+            "train": list(train), "test": list(test), "config": best["config"],
+            "in_sample_dsr": best["dsr"],
+            "oos": {k: oos[k] for k in ("run_id", "pnl", "fees", "sharpe", "trades", "dsr")},
+        })
+    return out
+
+def run_sweep(cols: Dict[str, Any], grid: Dict[str, Dict[str, List[Any]]], policy, out_dir: str,
+              folds: int = 1, workers: int = None, mode: str = "columns", cache_path: str = None) -> Dict[str, Any]:
+    """
+    Every grid config on every walk-forward window, across a process pool.
+
+    Tick columns go to workers once through shared memory. Each run writes
+    its own model card under out_dir/runs/<run_id>/ and one JSON line to
+    out_dir/results.jsonl as it completes; rows are ranked by deflated
+    Sharpe with n_trials = number of configs, since a window's best is
+    chosen among the configs run on it (windows are not alternatives to
+    each other). mode "columns" uses
+    Backtest.run_columns, "event" the event-driven Backtest.run. With
+    cache_path, runs are looked up in / stored to a shared ResultCache.
+    Returns {"n_trials", "rows" (ranked), "walk_forward"}; also written to
+    out_dir/summary.json.
+    """
+    if mode not in ("columns", "event"):
+        raise ValueError("mode must be 'columns' or 'event'")
+    configs = expand_grid(grid)
+    n = len(next(iter(cols.values())))
+    windows = walk_forward_windows(n, folds)
+    tasks = [(f"c{k:04d}-w{w}", cfg, win) for k, cfg in enumerate(configs) for w, win in enumerate(windows)]
+    os.makedirs(out_dir, exist_ok=True)
+    rows = []
+    with SharedColumns(cols) as shared, open(os.path.join(out_dir, "results.jsonl"), "w") as out:
+        def record(row):
+            rows.append(row)
+            out.write(json.dumps(row) + "\n")
+            out.flush()
+        if workers == 1:
+            _init_worker(shared.spec, policy, mode, out_dir, cache_path)
+            try:
+                for task in tasks:
+                    record(_run_one(*task))
+            finally:
+                handles = _W["handles"]
+                _W.clear()  # drop the views before closing their buffers
+                for h in handles.values():
+                    h.close()
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(shared.spec, policy, mode, out_dir, cache_path)) as pool:
+                for fut in as_completed([pool.submit(_run_one, *task) for task in tasks]):
+                    record(fut.result())
+    ranked = rank(rows, len(configs))
+    summary = {"n_trials": len(configs), "rows": ranked, "walk_forward": walk_forward(ranked, windows)}
+    with open(os.path.join(out_dir, "summary.json"), "w") as f:
+        json.dump(summary, f, indent=2)
+    return summary
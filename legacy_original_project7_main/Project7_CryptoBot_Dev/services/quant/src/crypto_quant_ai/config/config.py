@@ -1,5 +1,5 @@
 from dataclasses import dataclass, asdict
-import yaml, json, hashlib, pathlib
+import json, hashlib, pathlib
 
 @dataclass
 class RiskPolicy:
@@ -18,6 +18,7 @@ class RiskPolicy:
     circuit_breakers: dict
 
 def load_policy(path: str) -> RiskPolicy:
+    import yaml
     with open(path, 'r') as f:
         cfg = yaml.safe_load(f)
     return RiskPolicy(**cfg)
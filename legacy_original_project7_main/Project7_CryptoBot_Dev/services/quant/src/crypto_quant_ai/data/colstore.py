@@ -0,0 +1,131 @@
+"""
+Binary columnar tick files.
+
+Layout: a HEADER_SIZE-byte header (MAGIC, uint32 JSON length, JSON with
+row count, column names/dtypes/offsets and a content hash), then every
+column as one contiguous little-endian float64 or int64 array. Files are
+written once from CSV (`csv_to_colstore`) and read through np.memmap, so
+opening is O(1) and column slices are zero-copy.
+"""
+from typing import Any, Dict, Iterator
+import csv, hashlib, itertools, json, os, struct
+import numpy as np
+from .feed import COLUMNS, CSVTicks
+
+MAGIC = b"CQTICKS1"
+HEADER_SIZE = 4096
+_DTYPES = {"float64": np.dtype("<f8"), "int64": np.dtype("<i8")}
+_DEFAULTS = {"bp_per_min": 10.0, "funding_rate": 0.0}
+_CSV_NAMES = {"ts": "timestamp"}
+_ROW_CHUNK = 65536
+
+def csv_to_colstore(csv_path: str, out_path: str, chunk_rows: int = 1_000_000) -> "ColumnTicks":
+    """
+    Convert a CSVTicks file (timestamp, mid, bid, ask, spread[, bp_per_min,
+    funding_rate]) in chunks of chunk_rows, so memory stays bounded. Missing
+    optional columns get CSVTicks' defaults; timestamps are stored as int64
+    when they are all integral, else float64.
+    """
+    with open(csv_path, 'r') as f:
+        header = next(csv.reader([f.readline()]))
+        n = sum(1 for line in f if line.strip())
+    missing = [c for c in ("timestamp", "mid", "bid", "ask", "spread") if c not in header]
+    if missing:
+        raise ValueError(f"{csv_path}: missing columns {missing}")
+    src = {name: header.index(_CSV_NAMES.get(name, name)) for name in COLUMNS if _CSV_NAMES.get(name, name) in header}
+
+    tmp = out_path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.truncate(HEADER_SIZE + len(COLUMNS) * n * 8)
+    if n:
+        out = np.memmap(tmp, dtype="<f8", mode="r+", offset=HEADER_SIZE, shape=(len(COLUMNS), n))
+        with open(csv_path, 'r') as f:
+            f.readline()
+            lines = (line for line in f if line.strip())
+            row = 0
+            while row < n:
+                block = np.loadtxt(itertools.islice(lines, chunk_rows), delimiter=",", ndmin=2)
+                k = block.shape[0]
+                for j, name in enumerate(COLUMNS):
+                    out[j, row:row + k] = block[:, src[name]] if name in src else _DEFAULTS[name]
+                row += k
+        ts = out[0]
+        integral = bool(np.all(np.isfinite(ts)) and np.all(ts == np.round(ts)) and np.all(np.abs(ts) < 2.0**53))
+        if integral:
+            # same 8-byte width: rewrite the ts column as int64 in place
+            ts.view("<i8")[:] = ts.astype("<i8")
+        out.flush()
+        del out
+    else:
+        integral = False
+    meta = {
+        "version": 1, "rows": n,
+        "columns": [{"name": name, "dtype": "int64" if name == "ts" and integral else "float64",
+                     "offset": HEADER_SIZE + j * n * 8} for j, name in enumerate(COLUMNS)],
+    }
+    with open(tmp, "r+b") as f:
+        h = hashlib.sha256()
+        f.seek(HEADER_SIZE)
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+        meta["sha256"] = h.hexdigest()
+        blob = json.dumps(meta).encode()
+        if len(MAGIC) + 4 + len(blob) > HEADER_SIZE:
+            raise ValueError("colstore header too large")
+        f.seek(0)
+        f.write(MAGIC + struct.pack("<I", len(blob)) + blob)
+    os.replace(tmp, out_path)
+    return ColumnTicks(out_path)
+
+class ColumnTicks:
+    """
+    Tick feed over a colstore file; usable wherever CSVTicks is.
+
+    columns(start, stop) returns zero-copy read-only column views (for
+    Backtest.run_columns), chunks(size) walks the file in such slices, and
+    iteration / iter_from(offset) yield the same tick dicts as CSVTicks,
+    built a block at a time from the mapped columns.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            head = f.read(HEADER_SIZE)
+        if head[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path}: not a colstore tick file")
+        (size,) = struct.unpack("<I", head[len(MAGIC):len(MAGIC) + 4])
+        self.meta = json.loads(head[len(MAGIC) + 4:len(MAGIC) + 4 + size])
+        self.rows = int(self.meta["rows"])
+        # one read-only mapping of the whole file; columns are views into it
+        mm = np.memmap(path, dtype=np.uint8, mode="r") if self.rows else np.zeros(HEADER_SIZE, dtype=np.uint8)
+        self._cols = {c["name"]: mm[c["offset"]:c["offset"] + self.rows * 8].view(_DTYPES[c["dtype"]])
+                      for c in self.meta["columns"]}
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def fingerprint(self) -> str:
+        return "sha256:" + self.meta["sha256"]
+
+    def columns(self, start: int = 0, stop: int = None) -> Dict[str, Any]:
+        return {name: col[start:stop] for name, col in self._cols.items()}
+
+    def chunks(self, size: int = 1 << 20) -> Iterator[Dict[str, Any]]:
+        for start in range(0, self.rows, size):
+            yield self.columns(start, start + size)
+
+    def __iter__(self) -> Iterator[Dict]:
+        return self.iter_from(0)
+
+    def iter_from(self, offset: int) -> Iterator[Dict]:
+        """Ticks from row offset on, without touching the rows before it."""
+        names = list(self._cols)
+        keys = itertools.repeat(names)
+        for start in range(offset, self.rows, _ROW_CHUNK):
+            block = [self._cols[k][start:start + _ROW_CHUNK].astype(float).tolist() for k in names]
+            yield from map(dict, map(zip, keys, zip(*block)))
+
+def open_ticks(path: str):
+    """ColumnTicks for a colstore file, CSVTicks otherwise."""
+    with open(path, "rb") as f:
+        is_col = f.read(len(MAGIC)) == MAGIC
+    return ColumnTicks(path) if is_col else CSVTicks(path)
@@ -1,35 +1,74 @@
-import csv, random, time
-from typing import Dict, Iterator, Optional, List
+import csv, hashlib, itertools, json, random, time
+from typing import Any, Dict, Iterable, Iterator, Optional, List
+
+COLUMNS = ("ts", "mid", "bid", "ask", "spread", "bp_per_min", "funding_rate")
 
 class SyntheticTicks:
-    def __init__(self, steps=1000, start_price=30000.0, seed=42):
-        random.seed(seed)
+    # Each iteration replays the same seeded path from its own Random, so
+    # several feeds can be interleaved (e.g. MultiSymbolBacktest) without
+    # sharing the global RNG; ts runs from start_ts in steps of dt.
+    def __init__(self, steps=1000, start_price=30000.0, seed=42, start_ts: Optional[float] = None, dt: float = 1.0):
         self.steps = steps
-        self.p = start_price
+        self.start_price = start_price
+        self.seed = seed
+        self.start_ts = time.time() if start_ts is None else start_ts
+        self.dt = dt
+        self._fixed_ts = start_ts is not None
+
+    def fingerprint(self) -> str:
+        # the generator's inputs identify the path; a wall-clock start_ts is left out
+        params = {"steps": self.steps, "start_price": self.start_price, "seed": self.seed, "dt": self.dt,
+                  "start_ts": self.start_ts if self._fixed_ts else None}
+        return "synthetic:" + json.dumps(params, sort_keys=True)
 
     def __iter__(self) -> Iterator[Dict]:
-        for i in range(self.steps):
-            drift = 0.0001
-            shock = random.gauss(0, 1) * 20
-            self.p = max(10.0, self.p * (1 + drift) + shock)
-            spread = max(0.5, abs(random.gauss(1.0, 0.3)))
+        return self.iter_from(0)
+
+    def iter_from(self, offset: int) -> Iterator[Dict]:
+        """Ticks from index offset on; the path before it is regenerated without building ticks."""
+        rng = random.Random(self.seed)
+        p = self.start_price
+        drift = 0.0001
+        for i in range(min(offset, self.steps)):
+            p = max(10.0, p * (1 + drift) + rng.gauss(0, 1) * 20)
+            rng.gauss(1.0, 0.3)
+            rng.gauss(0, 0.00001)
+        for i in range(offset, self.steps):
+            shock = rng.gauss(0, 1) * 20
+            p = max(10.0, p * (1 + drift) + shock)
+            spread = max(0.5, abs(rng.gauss(1.0, 0.3)))
             yield {
-                "ts": time.time() + i,
-                "mid": self.p,
-                "bid": self.p - spread/2,
-                "ask": self.p + spread/2,
+                "ts": self.start_ts + i * self.dt,
+                "mid": p,
+                "bid": p - spread/2,
+                "ask": p + spread/2,
                 "spread": spread,
-                "bp_per_min": abs(shock) / max(self.p, 1) * 1e4,
-                "funding_rate": random.gauss(0, 0.00001)
+                "bp_per_min": abs(shock) / max(p, 1) * 1e4,
+                "funding_rate": rng.gauss(0, 0.00001)
             }
 
 class CSVTicks:
     def __init__(self, path: str):
         self.path = path
 
+    def fingerprint(self) -> str:
+        """sha256 of the file contents."""
+        h = hashlib.sha256()
+        with open(self.path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+        return "sha256:" + h.hexdigest()
+
     def __iter__(self) -> Iterator[Dict]:
+        return self.iter_from(0)
+
+    def iter_from(self, offset: int) -> Iterator[Dict]:
+        """Ticks from row offset on; earlier rows are skipped as raw lines, not parsed."""
         with open(self.path, 'r') as f:
-            r = csv.DictReader(f)
+            header = next(csv.reader([f.readline()]))
+            for _ in itertools.islice(f, offset):
+                pass
+            r = csv.DictReader(f, fieldnames=header)
             for row in r:
                 yield {
                     "ts": float(row["timestamp"]),
@@ -41,5 +80,57 @@ class CSVTicks:
                     "funding_rate": float(row.get("funding_rate", 0.0))
                 }
 
+    def columns(self) -> Dict[str, Any]:
+        """The whole file as float64 NumPy columns (for Backtest.run_columns)."""
+        import numpy as np
+        with open(self.path, 'r') as f:
+            header = next(csv.reader(f))
+        data = np.loadtxt(self.path, delimiter=",", skiprows=1, ndmin=2)
+        src = {"ts": "timestamp"}
+        cols = {}
+        for name in COLUMNS:
+            key = src.get(name, name)
+            if key in header:
+                cols[name] = np.ascontiguousarray(data[:, header.index(key)])
+        n = data.shape[0]
+        cols.setdefault("bp_per_min", np.full(n, 10.0))
+        cols.setdefault("funding_rate", np.zeros(n))
+        return cols
+
+def fingerprint(data) -> Optional[str]:
+    """
+    Content id of backtest input: a feed's own fingerprint() or a hash of
+    NumPy tick columns. None for anything else (e.g. a generator), which
+    cannot be identified without consuming it.
+    """
+    if hasattr(data, "fingerprint"):
+        return data.fingerprint()
+    if isinstance(data, dict):
+        import numpy as np
+        h = hashlib.sha256()
+        for name in sorted(data):
+            h.update(name.encode() + b"\0")
+            h.update(np.ascontiguousarray(data[name], dtype=float).tobytes())
+        return "columns:" + h.hexdigest()
+    return None
+
+def iter_from(feed, offset: int) -> Iterator[Dict]:
+    """Ticks of feed from index offset on: feed.iter_from when it has one, else by consuming the first offset."""
+    if hasattr(feed, "iter_from"):
+        return feed.iter_from(offset)
+    return itertools.islice(iter(feed), offset, None)
+
 def predicted_slippage_bps(spread: float, bp_per_min: float) -> float:
     return min(50.0, 0.5 * (spread) + 0.2 * (bp_per_min))
+
+def ticks_to_columns(ticks: Iterable[Dict]) -> Dict[str, Any]:
+    """Tick dicts (e.g. SyntheticTicks) to float64 NumPy columns; extra numeric fields (e.g. mid_other) are kept."""
+    import numpy as np
+    rows = list(ticks)
+    extra = [k for k, v in (rows[0].items() if rows else ()) if k not in COLUMNS and isinstance(v, (int, float))]
+    cols = {}
+    for name in list(COLUMNS) + extra:
+        default = 10.0 if name == "bp_per_min" else 0.0
+        if name in ("bp_per_min", "funding_rate") or (rows and name in rows[0]):
+            cols[name] = np.fromiter((r.get(name, default) for r in rows), dtype=float, count=len(rows))
+    return cols
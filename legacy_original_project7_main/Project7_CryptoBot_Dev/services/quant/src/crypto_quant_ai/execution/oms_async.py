@@ -32,6 +32,12 @@ class SimExchange:
         self.name = name
         self._oid = 0
 
+    def get_state(self) -> Dict[str, Any]:
+        return {"oid": self._oid}
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        self._oid = state["oid"]
+
     def _next_id(self) -> str:
         self._oid += 1
         return f"{self.name}-{self._oid}"
@@ -94,15 +100,22 @@ class OMS:
         self.policy = policy
         self.tca = tca_ledger
 
+    # guard / FM gate calls go through these so a profiler can wrap them per instance
+    def _guard(self, ctx: Dict[str, Any]) -> GuardResult:
+        return run_guard_chain(ctx, self.policy)
+
+    def _gate(self, symbol: str, fm_context: Dict[str, Any], fm_features: Dict[str, Any]) -> Dict[str, Any]:
+        return gate_decision(symbol, fm_context, fm_features)
+
     def submit(self, order: Order, ctx: Dict[str, Any]) -> Dict[str, Any]:
         # Guard chain
-        g = run_guard_chain(ctx, self.policy)
+        g = self._guard(ctx)
         if not g.ok:
             return {"status":"REJECT", "reason": g.reason, "order": asdict(order)}
 
         fm_context = ctx.get('fm_context', ctx)
         fm_features = ctx.get('fm_features', ctx.get('features', {}))
-        decision = gate_decision(order.symbol, fm_context, fm_features)
+        decision = self._gate(order.symbol, fm_context, fm_features)
         if not decision.get("allowed", True):
             return {
                 "status": "REJECT",
@@ -1,6 +1,6 @@
 
 from dataclasses import dataclass
-import numpy as np
+import math
 
 @dataclass
 class TCAResult:
@@ -15,11 +15,12 @@ def square_root_impact(q: float, daily_vol: float, daily_vol_usd: float, y: floa
     if daily_vol_usd <= 0 or q <= 0:
         return 0.0
     psi = q / daily_vol_usd
-    impact_frac = y * daily_vol * np.sqrt(max(psi, 0.0))
+    impact_frac = y * daily_vol * math.sqrt(max(psi, 0.0))
     return float(impact_frac * 1e4)
 
 def tca(arrival: float, fills_prices, fills_qty, ref_vwap: float, ref_twap: float,
         fee_bps: float, q_usd: float, daily_vol: float, daily_vol_usd: float, y: float = 0.5) -> TCAResult:
+    import numpy as np
     px = np.array(fills_prices, dtype=float)
     qty = np.array(fills_qty, dtype=float)
     vwap = (px*qty).sum() / max(qty.sum(), 1e-12)
@@ -1,6 +1,6 @@
 
 import numpy as np
-from math import erf, sqrt, log
+from quant.normal import norm_cdf
 
 def deflated_sharpe_ratio(sr: float, n_trials: int, t: int, skew: float = 0.0, kurt: float = 3.0) -> float:
     """Approximate Deflated Sharpe Ratio (Bailey & López de Prado).
@@ -14,5 +14,5 @@ def deflated_sharpe_ratio(sr: float, n_trials: int, t: int, skew: float = 0.0, k
     mu_gumbel = sr_std * np.sqrt(2*np.log(max(n_trials, 2)))
     beta_gumbel = sr_std / np.sqrt(2*np.log(max(n_trials, 2)))
     z = (sr - mu_gumbel) / max(beta_gumbel, 1e-12)
-    p = 0.5*(1 + erf(z/sqrt(2)))
+    p = norm_cdf(z)
     return float(max(0.0, min(1.0, p)))
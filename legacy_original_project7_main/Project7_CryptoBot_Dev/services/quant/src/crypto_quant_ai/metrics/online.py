@@ -0,0 +1,115 @@
+from typing import Dict, Any
+import math
+
+class OnlineMetrics:
+    """
+    Constant-memory trade statistics, updated one return at a time.
+
+    Keeps count, mean and central moments M2..M4 (Welford / Terriberry
+    updates), the win count and the cumulative-PnL path summary (total,
+    peak, trough, max drawdown), so sharpe, PSR and the DSR inputs (skew,
+    kurtosis, trade count) are available at any point of a run. Two
+    accumulators combine with `merge` (Pébay's pairwise formulas); the
+    moments merge in any order, the drawdown assumes `other` follows `self`
+    in time, as consecutive shards of one run do.
+    """
+    __slots__ = ("n", "mean", "m2", "m3", "m4", "wins", "cum", "peak", "trough", "max_dd")
+
+    def __init__(self):
+        self.n = 0
+        self.mean = self.m2 = self.m3 = self.m4 = 0.0
+        self.wins = 0
+        self.cum = self.peak = self.trough = self.max_dd = 0.0
+
+    def add(self, x: float, win: bool = None) -> None:
+        """One return; `win` defaults to x > 0."""
+        n1 = self.n
+        self.n = n = n1 + 1
+        delta = x - self.mean
+        dn = delta / n
+        dn2 = dn * dn
+        term1 = delta * dn * n1
+        self.mean += dn
+        self.m4 += term1 * dn2 * (n * n - 3 * n + 3) + 6 * dn2 * self.m2 - 4 * dn * self.m3
+        self.m3 += term1 * dn * (n - 2) - 3 * dn * self.m2
+        self.m2 += term1
+        if win if win is not None else x > 0:
+            self.wins += 1
+        self.cum += x
+        if self.cum > self.peak:
+            self.peak = self.cum
+        elif self.cum < self.trough:
+            self.trough = self.cum
+        if self.peak - self.cum > self.max_dd:
+            self.max_dd = self.peak - self.cum
+
+    def merge(self, other: "OnlineMetrics") -> "OnlineMetrics":
+        """Fold `other` (the later shard) into self; returns self."""
+        na, nb = self.n, other.n
+        if nb == 0:
+            return self
+        if na == 0:
+            for k in self.__slots__:
+                setattr(self, k, getattr(other, k))
+            return self
+        n = na + nb
+        d = other.mean - self.mean
+        d2 = d * d
+        m2a, m3a = self.m2, self.m3
+        self.m4 += (other.m4 + d2 * d2 * na * nb * (na * na - na * nb + nb * nb) / n**3
+                    + 6 * d2 * (na * na * other.m2 + nb * nb * m2a) / n**2
+                    + 4 * d * (na * other.m3 - nb * m3a) / n)
+        self.m3 += (other.m3 + d2 * d * na * nb * (na - nb) / n**2
+                    + 3 * d * (na * other.m2 - nb * m2a) / n)
+        self.m2 += other.m2 + d2 * na * nb / n
+        self.mean += d * nb / n
+        self.n = n
+        self.wins += other.wins
+        self.max_dd = max(self.max_dd, other.max_dd, self.peak - self.cum - other.trough)
+        self.trough = min(self.trough, self.cum + other.trough)
+        self.peak = max(self.peak, self.cum + other.peak)
+        self.cum += other.cum
+        return self
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation."""
+        return math.sqrt(self.m2 / self.n) if self.n else 0.0
+
+    @property
+    def skew(self) -> float:
+        return math.sqrt(self.n) * self.m3 / self.m2**1.5 if self.m2 > 0 else 0.0
+
+    @property
+    def kurt(self) -> float:
+        """Non-excess kurtosis (3 for a normal), as deflated_sharpe_ratio takes it."""
+        return self.n * self.m4 / (self.m2 * self.m2) if self.m2 > 0 else 3.0
+
+    @property
+    def sharpe(self) -> float:
+        """Per-trade Sharpe scaled by sqrt(trades), as Metrics.sharpe."""
+        if not self.n:
+            return 0.0
+        return self.mean / (self.std or 1e-9) * math.sqrt(self.n)
+
+    @property
+    def psr(self) -> float:
+        # Probabilistic Sharpe Ratio (approx): Phi((sr - 0)/sqrt(1 - 0.5))
+        if self.n < 10:
+            return 0.0
+        z = self.sharpe / math.sqrt(1.0 - 0.5)
+        return 0.5 * (1 + math.erf(z / math.sqrt(2)))
+
+    def dsr(self, n_trials: int) -> float:
+        """Deflated Sharpe of the per-trade Sharpe against n_trials, with this run's skew and kurtosis."""
+        if self.n < 2:
+            return 0.0
+        from .dsr import deflated_sharpe_ratio
+        return deflated_sharpe_ratio(self.mean / (self.std or 1e-9), n_trials, self.n, self.skew, self.kurt)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "trades": self.n, "mean": self.mean, "std": self.std, "skew": self.skew, "kurt": self.kurt,
+            "sharpe": self.sharpe, "psr": self.psr, "winrate": self.wins / max(1, self.n),
+            "cum_pnl": self.cum, "max_drawdown": self.max_dd,
+        }
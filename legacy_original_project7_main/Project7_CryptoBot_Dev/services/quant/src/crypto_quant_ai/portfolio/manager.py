@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import Dict, Any, List, Tuple
 import math
+from crypto_quant_ai.config.config import RiskPolicy
 
 @dataclass
 class Weights:
@@ -24,3 +25,10 @@ def meta_allocate(sharpes: Dict[str, float], corr_cap: float=0.7) -> Weights:
     mixed = {k: (0.5*raw[k] + 0.5*ew[k]) for k in raw}
     leverage = 1.5 if sum(pos.values()) > 0 else 0.0
     return Weights(mixed, leverage)
+
+def kelly_weights(mu: Dict[str, float], cov: List[List[float]], policy: RiskPolicy, fraction: float=0.5, long_only: bool=False) -> Weights:
+    # Joint multi-asset Kelly (cov rows/cols follow mu's key order), gross leverage capped by policy
+    names = list(mu)
+    from quant.kelly import kelly_portfolio
+    res = kelly_portfolio([mu[k] for k in names], cov, policy.leverage_limit, fraction, long_only)
+    return Weights({k: float(w) for k, w in zip(names, res["weights"])}, res["leverage"])
@@ -0,0 +1,77 @@
+import os
+from dataclasses import replace
+
+import pytest
+
+from crypto_quant_ai.alpha.momentum_funding import MomentumFunding
+from crypto_quant_ai.alpha.perp_skew_mm import PerpSkewMM
+from crypto_quant_ai.backtest.engine import Backtest
+from crypto_quant_ai.config.config import load_policy, project_root
+from crypto_quant_ai.data.feed import SyntheticTicks
+from crypto_quant_ai.execution import oms_async
+
+
+class _Preempted(Exception):
+    pass
+
+
+class _DiesAt:
+    """Feed that raises after n ticks, as a preempted worker would stop."""
+    def __init__(self, feed, n):
+        self.feed, self.n = feed, n
+
+    def fingerprint(self):
+        return self.feed.fingerprint()
+
+    def __iter__(self):
+        for i, t in enumerate(self.feed):
+            if i == self.n:
+                raise _Preempted
+            yield t
+
+
+def _bt(path, ckpt, strats=None):
+    pol = load_policy(os.path.join(project_root(), "src/crypto_quant_ai/config/policy.yml"))
+    pol = replace(pol, max_spread_bps=1e9, position_limit_usd=1e12)
+    return Backtest(pol, strats or [MomentumFunding(), PerpSkewMM()], str(path), checkpoint=str(ckpt), checkpoint_every=700)
+
+
+def test_resume_is_bit_identical(monkeypatch, tmp_path):
+    monkeypatch.setattr(oms_async, "gate_decision", lambda *a, **k: {"allowed": True})
+    feed = SyntheticTicks(steps=5000)
+    full_bt = _bt(tmp_path / "full", tmp_path / "unused.ckpt")
+    full = full_bt.run(feed)
+    ckpt = tmp_path / "run.ckpt"
+    with pytest.raises(_Preempted):
+        _bt(tmp_path / "a", ckpt).run(_DiesAt(feed, 3333))
+    assert ckpt.exists()
+    seen = []
+    bt = _bt(tmp_path / "a", ckpt)
+    resumed = bt.run(feed, resume=True, on_progress=lambda i, m: seen.append(i), every=1000)
+    assert full.trades > 1000
+    assert resumed == full
+    assert seen == [3000, 4000, 5000]  # entered the feed at the 2800-tick checkpoint
+    assert bt._venues["CEX_A"]._oid == full_bt._venues["CEX_A"]._oid
+    assert not ckpt.exists()
+
+
+def test_resume_rejects_other_inputs(monkeypatch, tmp_path):
+    monkeypatch.setattr(oms_async, "gate_decision", lambda *a, **k: {"allowed": True})
+    feed = SyntheticTicks(steps=2000)
+    ckpt = tmp_path / "run.ckpt"
+    with pytest.raises(_Preempted):
+        _bt(tmp_path, ckpt).run(_DiesAt(feed, 1500))
+    with pytest.raises(ValueError):
+        _bt(tmp_path, ckpt, [MomentumFunding(lookback=5), PerpSkewMM()]).run(feed, resume=True)
+
+
+def test_resume_checks_strategy_params_without_a_fingerprint(monkeypatch, tmp_path):
+    monkeypatch.setattr(oms_async, "gate_decision", lambda *a, **k: {"allowed": True})
+    feed = list(SyntheticTicks(steps=2000))  # a plain list has no fingerprint
+    ckpt = tmp_path / "run.ckpt"
+    with pytest.raises(_Preempted):
+        _bt(tmp_path, ckpt).run(iter(_DiesAt(feed, 1500)))
+    other = [MomentumFunding(lookback=5), PerpSkewMM()]
+    with pytest.raises(ValueError):
+        _bt(tmp_path, ckpt, other).run(feed, resume=True)
+    assert other[0].lookback == 5
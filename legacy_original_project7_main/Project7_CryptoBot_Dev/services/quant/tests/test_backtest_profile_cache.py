@@ -0,0 +1,68 @@
+import json
+import os
+
+from crypto_quant_ai.alpha.momentum_funding import MomentumFunding
+from crypto_quant_ai.alpha.perp_skew_mm import PerpSkewMM
+from crypto_quant_ai.backtest.cache import ResultCache
+from crypto_quant_ai.backtest.engine import Backtest
+from crypto_quant_ai.config.config import load_policy, project_root
+from crypto_quant_ai.data.feed import SyntheticTicks, ticks_to_columns
+from crypto_quant_ai.execution import oms_async
+
+
+def _policy():
+    return load_policy(os.path.join(project_root(), "src/crypto_quant_ai/config/policy.yml"))
+
+
+def test_profile_matches_plain_run_and_writes_report(monkeypatch, tmp_path):
+    monkeypatch.setattr(oms_async, "gate_decision", lambda *a, **k: {"allowed": True})
+    feed = SyntheticTicks(steps=2000)
+    plain = Backtest(_policy(), [MomentumFunding(), PerpSkewMM()], str(tmp_path / "a")).run(feed)
+    strats = [MomentumFunding(), PerpSkewMM()]
+    bt = Backtest(_policy(), strats, str(tmp_path / "b"), profile=True)
+    assert bt.run(feed) == plain
+    report = json.load(open(tmp_path / "b" / "profile.json"))
+    stages = report["stages"]
+    assert stages["tick"]["calls"] == 2000
+    assert stages["strategy.momentum_funding"]["calls"] == 2000
+    assert {"guards", "fm_gate", "route.rank", "slippage"} <= set(stages)
+    stacks = (tmp_path / "b" / "profile.collapsed").read_text().splitlines()
+    assert any(s.startswith("backtest;tick;oms.submit;guards ") for s in stacks)
+    # the wrappers are gone after the run
+    assert "step" not in vars(strats[0]) and "_guard" not in vars(bt.oms)
+
+
+def test_result_cache_hits_skip_the_replay(tmp_path):
+    cache = ResultCache(str(tmp_path / "results.sqlite3"), max_entries=2)
+    cols = ticks_to_columns(SyntheticTicks(steps=3000, start_ts=0))
+    first = Backtest(_policy(), [MomentumFunding()], str(tmp_path / "a"), cache=cache).run_columns(cols)
+    # any change to the inputs is a different key
+    other = Backtest(_policy(), [MomentumFunding(lookback=10)], str(tmp_path / "c"), cache=cache)
+    other.run_columns(cols)
+    bt = Backtest(_policy(), [MomentumFunding()], str(tmp_path / "b"), cache=cache)
+    assert other.cache_key(cols, "columns") != bt.cache_key(cols, "columns")
+    bt._write_card = None  # a replay would call it
+    assert bt.run_columns(cols) == first
+    assert json.load(open(tmp_path / "b" / "model_card.json"))["final_pnl"] == first.pnl
+    # the hit made `first` the most recently used: a third key evicts `other`
+    Backtest(_policy(), [PerpSkewMM()], str(tmp_path / "d"), cache=cache).run_columns(cols)
+    assert len(cache) == 2
+    assert cache.get(bt.cache_key(cols, "columns")) is not None
+    assert cache.get(other.cache_key(cols, "columns")) is None
+
+
+def test_event_runs_are_not_cached(monkeypatch, tmp_path):
+    # fills depend on the FM gate's answers, which the key cannot cover
+    monkeypatch.setattr(oms_async, "gate_decision", lambda *a, **k: {"allowed": True})
+    cache = ResultCache(str(tmp_path / "results.sqlite3"))
+    feed = SyntheticTicks(steps=500, start_ts=0)
+    Backtest(_policy(), [MomentumFunding()], str(tmp_path / "a"), cache=cache).run(feed)
+    assert len(cache) == 0
+    monkeypatch.setattr(oms_async, "gate_decision", lambda *a, **k: {"allowed": False})
+    assert Backtest(_policy(), [MomentumFunding()], str(tmp_path / "b"), cache=cache).run(feed).trades == 0
+
+
+def test_synthetic_fingerprint_ignores_wall_clock_start():
+    a, b = SyntheticTicks(steps=10), SyntheticTicks(steps=10)
+    assert a.fingerprint() == b.fingerprint()
+    assert SyntheticTicks(steps=10, seed=1).fingerprint() != a.fingerprint()
@@ -0,0 +1,16 @@
+import numpy as np
+
+from quant.black_scholes import bs_greeks, bs_greeks_batch, bs_price_batch
+
+
+def test_bs_batch_matches_scalar_including_degenerate_rows():
+    cp = ["c", "p", "call", "put", "c", "p"]
+    K = [80.0, 95.0, 100.0, 120.0, 90.0, 110.0]
+    T = [0.5, 1.0, 0.0, 0.25, 0.75, 0.1]
+    sigma = [0.6, 0.3, 0.5, 0.0, 0.9, 0.4]
+    out = bs_greeks_batch(cp, 100.0, K, T, 0.02, sigma, 0.01)
+    for i in range(len(cp)):
+        ref = bs_greeks(cp[i], 100.0, K[i], T[i], 0.02, sigma[i], 0.01)
+        for key, val in ref.items():
+            assert abs(out[key][i] - val) <= 1e-12 * max(1.0, abs(val)), (i, key)
+    assert np.array_equal(bs_price_batch(cp, 100.0, K, T, 0.02, sigma, 0.01), out["price"])
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from crypto_quant_ai.data.colstore import ColumnTicks, csv_to_colstore, open_ticks
+from crypto_quant_ai.data.feed import CSVTicks
+
+
+def _csv(path, rows, full=True):
+    head = "timestamp,mid,bid,ask,spread" + (",bp_per_min,funding_rate" if full else "")
+    lines = [head] + [",".join(str(v) for v in r) for r in rows]
+    path.write_text("\n".join(lines) + "\n")
+    return str(path)
+
+
+def test_roundtrip_matches_csv_ticks(tmp_path):
+    rows = [(1700000000 + i, 100.0 + i / 7, 99.5 + i / 7, 100.5 + i / 7, 1.0, 3.25 * i, 1e-5 * i) for i in range(50)]
+    src = _csv(tmp_path / "t.csv", rows)
+    ticks = csv_to_colstore(src, str(tmp_path / "t.ticks"), chunk_rows=16)
+    assert ticks.meta["columns"][0]["dtype"] == "int64"
+    assert list(ticks) == list(CSVTicks(src))
+    assert list(ticks.iter_from(45)) == list(CSVTicks(src))[45:]
+    cols, ref = ticks.columns(), CSVTicks(src).columns()
+    for k in ref:
+        assert np.array_equal(cols[k], ref[k]), k
+    assert not cols["mid"].flags.writeable
+    assert [len(c["mid"]) for c in ticks.chunks(20)] == [20, 20, 10]
+    assert isinstance(open_ticks(str(tmp_path / "t.ticks")), ColumnTicks)
+    assert isinstance(open_ticks(src), CSVTicks)
+
+
+def test_defaults_float_ts_and_fingerprint(tmp_path):
+    src = _csv(tmp_path / "t.csv", [(1.5, 100, 99.5, 100.5, 1), (2.5, 101, 100.5, 101.5, 1)], full=False)
+    a = csv_to_colstore(src, str(tmp_path / "a.ticks"))
+    assert a.meta["columns"][0]["dtype"] == "float64"
+    assert list(a) == list(CSVTicks(src))
+    assert a.columns()["bp_per_min"].tolist() == [10.0, 10.0]
+    b = csv_to_colstore(src, str(tmp_path / "b.ticks"))
+    assert a.fingerprint() == b.fingerprint()
+    with pytest.raises(ValueError):
+        ColumnTicks(src)
+
+
+def test_empty_file(tmp_path):
+    ticks = csv_to_colstore(_csv(tmp_path / "t.csv", []), str(tmp_path / "t.ticks"))
+    assert len(ticks) == 0 and list(ticks) == [] and ticks.columns()["mid"].size == 0
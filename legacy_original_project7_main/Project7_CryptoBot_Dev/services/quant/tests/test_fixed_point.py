@@ -0,0 +1,45 @@
+import os
+from decimal import Decimal
+
+import numpy as np
+
+from crypto_quant_ai.alpha.momentum_funding import MomentumFunding
+from crypto_quant_ai.backtest.engine import Backtest
+from crypto_quant_ai.config.config import load_policy, project_root
+from crypto_quant_ai.data.feed import SyntheticTicks
+from crypto_quant_ai.execution import oms_async
+from quant.fixed_point import FixedSpec, PnLBook, fee_units, round_div
+
+
+def test_fixed_point_book_is_exact():
+    spec = FixedSpec("BTC/USDT", "0.01", "0.000001")
+    book = PnLBook(spec)
+    book.fill("buy", "30000.01", "0.0025", "0.0002")
+    book.fill("sell", 30010.0, 0.0025, Decimal("0.0002"))
+    snap = book.snapshot(mark="30005")
+    assert snap["position"] == 0
+    assert snap["cash"] == Decimal("0.024975")
+    assert snap["fees"] == Decimal("0.030005")
+    assert snap["pnl"] == snap["cash"] - snap["fees"]
+    assert round_div(np.array([5, -5, 15, -15, 7]), 10).tolist() == [0, 0, 2, -2, 1]
+
+    rng = np.random.default_rng(0)
+    ticks = spec.to_ticks(rng.uniform(29000.0, 31000.0, 500))
+    lots = spec.to_lots(rng.uniform(0.001, 0.1, 500))
+    sides = rng.choice([-1, 1], 500)
+    legs = PnLBook(spec).fills(sides, ticks, lots, "0.0002")
+    for s, t, q, c, f in zip(sides, ticks, lots, legs["cash"], legs["fee"]):
+        notional = Decimal(int(t)) * spec.tick_size * Decimal(int(q)) * spec.lot_size
+        assert spec.cash_decimal(c) == -int(s) * notional
+        assert spec.cash_decimal(f) == (notional * Decimal("0.0002")).quantize(spec.cash_unit, rounding="ROUND_HALF_EVEN")
+    assert fee_units(10**15, "0.0002") == 2 * 10**11
+
+
+def test_backtest_fixed_point_matches_float(monkeypatch, tmp_path):
+    monkeypatch.setattr(oms_async, "gate_decision", lambda *a, **k: {"allowed": True})
+    pol = load_policy(os.path.join(project_root(), "src/crypto_quant_ai/config/policy.yml"))
+    flt = Backtest(pol, [MomentumFunding()], str(tmp_path)).run(SyntheticTicks(steps=200))
+    fix = Backtest(pol, [MomentumFunding()], str(tmp_path), spec=FixedSpec("BTC/USDT", "0.01", "0.000001")).run(SyntheticTicks(steps=200))
+    assert fix.trades == flt.trades >= 1
+    assert abs(fix.fees - flt.fees) < 1e-6 * fix.trades
+    assert abs(fix.pnl - flt.pnl) < 0.01 * fix.trades
@@ -0,0 +1,28 @@
+import numpy as np
+
+from quant.black_scholes import bs_greeks_batch
+from quant.implied_vol import implied_vol, implied_vol_batch
+
+
+def test_implied_vol_round_trip_and_warm_start():
+    rng = np.random.default_rng(5)
+    n = 2000
+    cp = rng.choice(["c", "p"], n)
+    K = 100.0 * np.exp(rng.uniform(-0.5, 0.5, n))
+    T = rng.uniform(0.05, 2.0, n)
+    sigma = rng.uniform(0.1, 1.5, n)
+    g = bs_greeks_batch(cp, 100.0, K, T, 0.02, sigma, 0.0)
+
+    cold = implied_vol_batch(g["price"], cp, 100.0, K, T, 0.02)
+    ok = g["vega"] > 1e-2
+    assert np.all(cold["status"][ok] == "converged")
+    assert np.max(np.abs(cold["sigma"][ok] - sigma[ok])) < 1e-6
+
+    warm = implied_vol_batch(g["price"], cp, 100.0, K, T, 0.02, sigma0=sigma * 1.01)
+    assert warm["iterations"][ok].mean() < cold["iterations"][ok].mean()
+
+
+def test_implied_vol_statuses():
+    out = implied_vol_batch([5.0, 1e-3, 200.0, 1.0], ["c", "c", "c", "p"], 100.0, [95.0, 100.0, 100.0, 100.0], [1.0, 1.0, 1.0, 0.0])
+    assert list(out["status"]) == ["below_intrinsic", "converged", "above_max", "bad_input"]
+    assert abs(implied_vol(10.0, "c", 100.0, 100.0, 1.0) - 0.2513) < 1e-3
@@ -0,0 +1,38 @@
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+HEAVY = ("numpy", "yaml", "fm_sdk", "requests", "httpx")
+
+
+def _run(code):
+    env = {"PYTHONPATH": f"{ROOT}:{ROOT / 'src'}:{ROOT / 'vendor' / 'fm-sdk-python'}", "PATH": ""}
+    return subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True)
+
+
+def test_light_imports_do_not_load_heavy_modules():
+    code = (
+        "import sys, quant, quant.qcli, crypto_quant_ai.fm.client, crypto_quant_ai.config.config\n"
+        f"print(','.join(m for m in {HEAVY!r} if m in sys.modules))"
+    )
+    res = _run(code)
+    assert res.returncode == 0, res.stderr
+    assert res.stdout.strip() == ""
+
+
+@pytest.mark.parametrize("load", [
+    "quant.VolSurface",
+    "from quant.vol_surface import VolSurface",
+    "import quant.implied_vol",
+    "from quant.implied_vol import implied_vol_batch",
+])
+def test_lazy_exports_win_over_same_named_submodules(load):
+    # the wall-clock budget lives in scripts/check_import_time.py, not here
+    pytest.importorskip("numpy")
+    res = _run(f"import quant\n{load}\nfrom quant import implied_vol\n"
+               "print(type(implied_vol).__name__, type(quant.implied_vol).__name__, 'implied_vol' in dir(quant))")
+    assert res.returncode == 0, res.stderr
+    assert res.stdout.split() == ["function", "function", "True"]
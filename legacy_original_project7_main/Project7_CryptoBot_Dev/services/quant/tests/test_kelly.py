@@ -0,0 +1,45 @@
+import os
+
+import numpy as np
+
+from crypto_quant_ai.config.config import load_policy, project_root
+from crypto_quant_ai.portfolio.manager import kelly_weights
+from quant.kelly import KellyOptimizer, kelly_optimal_fraction
+
+
+def _problem(n, seed=0):
+    rng = np.random.default_rng(seed)
+    F = rng.standard_normal((n, 4)) * 0.02
+    cov = F @ F.T + np.diag(rng.uniform(1e-4, 4e-4, n))
+    return rng.normal(0.0005, 0.001, n), cov
+
+
+def test_kelly_uncapped_matches_closed_form():
+    mu, cov = _problem(30)
+    res = KellyOptimizer(cov, fraction=0.5).solve(mu)
+    assert not res["capped"]
+    assert np.allclose(res["weights"], 0.5 * np.linalg.solve(cov, mu))
+    one = KellyOptimizer([[0.04]]).solve([0.02])
+    assert abs(one["weights"][0] - kelly_optimal_fraction(0.02, 0.04)) < 1e-12
+
+
+def test_kelly_leverage_cap_is_optimal_and_warm():
+    mu, cov = _problem(200)
+    opt = KellyOptimizer(cov, leverage_limit=2.0, fraction=0.5)
+    res = opt.solve(mu)
+    w = res["weights"]
+    assert res["capped"] and abs(res["leverage"] - 2.0) < 1e-9
+    # KKT: |mu - Σw/c| <= lam everywhere, with equality on the support
+    g = mu - cov @ w / 0.5
+    lam = np.abs(g[w != 0.0]).max()
+    assert np.allclose(np.abs(g[w != 0.0]), lam) and np.abs(g).max() <= lam + 1e-12
+    again = opt.solve(mu * 1.001)
+    assert again["iterations"] <= res["iterations"]
+
+
+def test_kelly_weights_use_policy_leverage_limit():
+    pol = load_policy(os.path.join(project_root(), "src/crypto_quant_ai/config/policy.yml"))
+    mu, cov = _problem(5)
+    out = kelly_weights({f"s{i}": m * 50 for i, m in enumerate(mu)}, cov.tolist(), pol)
+    assert abs(out.total_leverage - pol.leverage_limit) < 1e-9
+    assert set(out.by_strategy) == {f"s{i}" for i in range(5)}
@@ -0,0 +1,71 @@
+import numpy as np
+
+from quant.lp import CSCMatrix, solve_lp, solve_lp_batch, solve_lp_sparse
+
+
+def test_solve_lp_call_shape_and_statuses():
+    res = solve_lp([1.0, 2.0], [[1.0, 1.0], [1.0, 0.0]], [4.0, 3.0])
+    assert res["status"] == "optimal"
+    assert res["x"] == [0.0, 4.0, 0.0, 3.0]
+    assert res["objective"] == 8.0
+    assert solve_lp([1.0], [[1.0]], [-1.0])["status"] == "infeasible"
+    assert solve_lp([1.0, 1.0], [[1.0, -1.0]], [1.0])["status"] == "unbounded"
+
+
+def test_bounds_equalities_and_sparse_input():
+    A = CSCMatrix.from_triplets([0, 0], [0, 1], [1.0, 1.0], (1, 2))
+    res = solve_lp_sparse([1.0, 1.0], A_eq=A, b_eq=[2.0], bounds=[(0.0, 1.5), (0.0, None)], maximize=False)
+    assert res["status"] == "optimal"
+    assert abs(res["objective"] - 2.0) < 1e-12
+    assert abs(res["x"][0] - 1.5) < 1e-12
+
+
+def test_warm_start_after_rhs_change():
+    rng = np.random.default_rng(0)
+    m, n = 40, 400
+    A = rng.uniform(0.0, 1.0, (m, n)) * (rng.uniform(size=(m, n)) < 0.2)
+    b = rng.uniform(1.0, 2.0, m)
+    c = rng.uniform(0.0, 1.0, n)
+    cold = solve_lp_sparse(c, A, b, bounds=(0.0, 1.0))
+    assert cold["status"] == "optimal"
+
+    b2 = b * (1.0 + 0.05 * rng.standard_normal(m))
+    warm = solve_lp_sparse(c, A, b2, bounds=(0.0, 1.0), warm_start=cold["basis"])
+    ref = solve_lp_sparse(c, A, b2, bounds=(0.0, 1.0))
+    assert warm["warm_started"] and warm["status"] == "optimal"
+    assert abs(warm["objective"] - ref["objective"]) < 1e-9
+    assert warm["iterations"] < ref["iterations"]
+    x = np.array(warm["x"])
+    assert np.all(A @ x <= b2 + 1e-9) and x.min() >= -1e-12 and x.max() <= 1.0 + 1e-12
+
+
+def test_solve_lp_batch_matches_scalar():
+    rng = np.random.default_rng(1)
+    K, m, n = 200, 3, 5
+    A = rng.uniform(0.0, 1.0, (K, m, n))
+    b = rng.uniform(0.5, 2.0, (K, m))
+    c = rng.uniform(-0.2, 1.0, (K, n))
+    b[0, 0] = -0.1  # needs Phase I -> scalar fallback, infeasible
+    out = solve_lp_batch(c, A, b)
+    for k in range(K):
+        ref = solve_lp(c[k].tolist(), A[k].tolist(), b[k].tolist())
+        assert out["status"][k] == ref["status"]
+        if ref["status"] == "optimal":
+            assert abs(out["objective"][k] - ref["objective"]) < 1e-9
+    assert out["status"][0] == "infeasible"
+
+
+def test_solve_lp_batch_degenerate_cycling_and_iter_limit():
+    # Chvatal's example: Dantzig pricing with first-row ratio ties cycles forever
+    c = [[10.0, -57.0, -9.0, -24.0]]
+    A = [[[0.5, -5.5, -2.5, 9.0], [0.5, -1.5, -0.5, 1.0], [1.0, 0.0, 0.0, 0.0]]]
+    b = [[0.0, 0.0, 1.0]]
+    out = solve_lp_batch(c, A, b)
+    assert out["status"][0] == "optimal"
+    assert abs(out["objective"][0] - 1.0) < 1e-9
+    # an iteration-limit row keeps its last (feasible) iterate
+    out = solve_lp_batch(c, A, b, max_iter=3)
+    assert out["status"][0] == "iter_limit"
+    x = out["x"][0]
+    assert np.all(np.isfinite(x)) and np.all(x >= -1e-12)
+    assert np.allclose(np.asarray(A[0]) @ x[:4] + x[4:], b[0])
@@ -0,0 +1,23 @@
+from quant.black_scholes import bs_price
+from quant.mc_pricer import MCPricer, Payoff
+
+
+def test_mc_pricer_control_variate_and_parity():
+    pr = MCPricer(100.0, 0.03, 0.6, 0.5, steps=50, paths=20_000, seed=4)
+    books = [
+        Payoff("european", "c", 100.0),
+        Payoff("asian", "c", 100.0),
+        Payoff("up-and-out", "c", 100.0, barrier=140.0),
+        Payoff("up-and-in", "c", 100.0, barrier=140.0),
+        Payoff("down-and-out", "p", 90.0, barrier=70.0, name="dop"),
+    ]
+    out = pr.price(books)
+    exact = bs_price("c", 100.0, 100.0, 0.5, 0.03, 0.6)
+    assert abs(out["european_c_100"]["price"] - exact) < 1e-9
+    assert abs(out["european_c_100"]["price_plain"] - exact) < 4 * out["european_c_100"]["stderr_plain"]
+    # knock-in + knock-out rebuilds the vanilla path by path
+    ko, ki = out["up-and-out_c_100_140"], out["up-and-in_c_100_140"]
+    assert abs(ko["price"] + ki["price"] - exact) < 1e-9
+    for name in ("asian_c_100", "up-and-in_c_100_140", "dop"):
+        assert out[name]["stderr"] < out[name]["stderr_plain"]
+    assert out["asian_c_100"]["stderr"] < out["asian_c_100"]["stderr_plain"] / 2
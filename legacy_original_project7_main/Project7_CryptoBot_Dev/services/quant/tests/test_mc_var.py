@@ -0,0 +1,16 @@
+from quant.var import mc_var, monte_carlo_var, parametric_var
+
+
+def test_monte_carlo_var_is_seeded():
+    assert monte_carlo_var(0.0, 0.05, paths=5000, seed=11) == monte_carlo_var(0.0, 0.05, paths=5000, seed=11)
+
+
+def test_mc_var_sampling_schemes_converge():
+    exact = parametric_var(0.01, 0.05, 0.95)
+    for sampling in ("pseudo", "antithetic", "sobol"):
+        out = mc_var(0.01, 0.05, 0.95, paths=200000, seed=2, sampling=sampling, ci_width=0.004)
+        assert out["converged"]
+        assert out["paths"] < 200000
+        lo, hi = out["ci"]
+        assert lo <= out["VaR"] <= hi
+        assert abs(out["VaR"] - exact) < 0.004
@@ -0,0 +1,25 @@
+import numpy as np
+
+from quant.monte_carlo import GBMSimulator
+
+
+def test_chunked_paths_match_full_run():
+    sim = GBMSimulator(100.0, 0.05, 0.6, seed=1)
+    full = sim.path_matrix(1000, 21, seed=7)
+    chunked = np.concatenate(list(sim.iter_paths(1000, 21, chunk=64, seed=7)))
+    assert full.shape == (1000, 21)
+    assert np.all(full[:, 0] == 100.0)
+    assert np.array_equal(full, chunked)
+
+    term = np.concatenate(list(sim.iter_terminal(20, 1000, chunk=100, seed=7)))
+    assert np.allclose(term, full[:, -1], rtol=1e-12)
+    f32 = np.concatenate(list(sim.iter_terminal(20, 1000, dtype=np.float32, seed=7)))
+    assert f32.dtype == np.float32
+    assert np.allclose(f32, term, rtol=1e-6)
+
+
+def test_terminal_moments():
+    sim = GBMSimulator(100.0, 0.1, 0.3, dt=1.0 / 252.0, seed=3)
+    st = np.array(sim.terminal(252, 20000))
+    assert abs(st.mean() - 100.0 * np.exp(0.1)) < 1.0
+    assert len(sim.path(5)) == 5
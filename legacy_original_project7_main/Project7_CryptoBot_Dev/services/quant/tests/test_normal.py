@@ -0,0 +1,23 @@
+import math
+
+import numpy as np
+
+from quant.normal import norm_cdf, norm_pdf, norm_ppf
+
+
+def test_array_kernels_match_scalar():
+    x = np.linspace(-12.0, 12.0, 4001)
+    assert np.max(np.abs(norm_cdf(x) - [norm_cdf(v) for v in x])) < 5e-16
+    assert np.max(np.abs(norm_pdf(x) - [norm_pdf(v) for v in x])) < 5e-16
+    p = np.linspace(1e-10, 1 - 1e-10, 4001)
+    assert np.max(np.abs(norm_ppf(p) - [norm_ppf(v) for v in p])) < 1e-15
+    # Relative accuracy deep in the lower tail
+    tail = np.array([-8.0, -15.0, -30.0])
+    exact = np.array([0.5 * math.erfc(-v / math.sqrt(2.0)) for v in tail])
+    assert np.max(np.abs(norm_cdf(tail) / exact - 1.0)) < 1e-12
+
+
+def test_scalar_kernels_return_floats():
+    assert isinstance(norm_cdf(0.3), float)
+    assert norm_cdf(0.0) == 0.5
+    assert abs(norm_ppf(norm_cdf(1.3)) - 1.3) < 1e-8
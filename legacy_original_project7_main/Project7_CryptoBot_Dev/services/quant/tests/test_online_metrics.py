@@ -0,0 +1,52 @@
+import math
+import random
+import statistics
+
+from crypto_quant_ai.metrics.online import OnlineMetrics
+
+
+def _feed(xs):
+    acc = OnlineMetrics()
+    for x in xs:
+        acc.add(x)
+    return acc
+
+
+def test_matches_batch_statistics():
+    rng = random.Random(7)
+    xs = [rng.gauss(0.05, 1.0) ** 3 for _ in range(5000)]
+    acc = _feed(xs)
+    mu, sd = statistics.fmean(xs), statistics.pstdev(xs)
+    assert math.isclose(acc.mean, mu, rel_tol=1e-12)
+    assert math.isclose(acc.std, sd, rel_tol=1e-12)
+    skew = sum((x - mu) ** 3 for x in xs) / len(xs) / sd ** 3
+    kurt = sum((x - mu) ** 4 for x in xs) / len(xs) / sd ** 4
+    assert math.isclose(acc.skew, skew, rel_tol=1e-9)
+    assert math.isclose(acc.kurt, kurt, rel_tol=1e-9)
+    cum = peak = dd = 0.0
+    for x in xs:
+        cum += x
+        peak = max(peak, cum)
+        dd = max(dd, peak - cum)
+    assert math.isclose(acc.max_dd, dd, rel_tol=1e-12)
+    assert acc.wins == sum(x > 0 for x in xs)
+    assert math.isclose(acc.sharpe, mu / sd * math.sqrt(len(xs)), rel_tol=1e-12)
+
+
+def test_merge_of_shards_equals_one_pass():
+    rng = random.Random(11)
+    xs = [rng.uniform(-1.0, 1.2) for _ in range(3000)]
+    whole = _feed(xs)
+    merged = OnlineMetrics()
+    for a, b in [(0, 1), (1, 900), (900, 900), (900, 3000)]:
+        merged.merge(_feed(xs[a:b]))
+    for k in ("mean", "m2", "m3", "m4", "cum", "peak", "trough", "max_dd"):
+        assert math.isclose(getattr(merged, k), getattr(whole, k), rel_tol=1e-9, abs_tol=1e-9), k
+    assert (merged.n, merged.wins) == (whole.n, whole.wins)
+
+
+def test_empty_and_short_runs():
+    acc = OnlineMetrics()
+    assert (acc.sharpe, acc.psr, acc.dsr(10), acc.max_dd) == (0.0, 0.0, 0.0, 0.0)
+    acc.add(1.0)
+    assert acc.psr == 0.0 and acc.snapshot()["trades"] == 1
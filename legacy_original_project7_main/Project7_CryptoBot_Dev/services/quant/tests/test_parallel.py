@@ -0,0 +1,57 @@
+import math
+
+from quant.parallel import parallel_gbm_terminal, parallel_monte_carlo_var
+
+
+def test_parallel_var_independent_of_worker_count():
+    one = parallel_monte_carlo_var(0.0, 0.02, 0.99, paths=200_000, seed=11, workers=1, blocks=8)
+    two = parallel_monte_carlo_var(0.0, 0.02, 0.99, paths=200_000, seed=11, workers=2, blocks=8)
+    assert one == two
+    assert abs(one["VaR"] - 0.02 * 2.3263) < 1e-3
+    assert one["ES"] > one["VaR"]
+
+
+def test_parallel_gbm_quantiles():
+    out = parallel_gbm_terminal(100.0, 0.0, 0.5, 252, paths=50_000, quantiles=(0.05, 0.5, 0.95), seed=2, workers=1, blocks=4)
+    q = out["quantiles"]
+    assert q[0.05] < q[0.5] < q[0.95]
+    assert abs(q[0.5] - 100.0 * math.exp(-0.125)) < 1.5
+    assert abs(out["mean"] - 100.0) < 1.0
+
+
+def _same_samples(S0, sigma, steps, paths, seed, blocks):
+    import numpy as np
+
+    from quant.parallel import _gbm_chunks
+
+    children = np.random.SeedSequence(seed).spawn(blocks)
+    sizes = [paths // blocks + (1 if i < paths % blocks else 0) for i in range(blocks)]
+    return np.concatenate([
+        np.concatenate(list(_gbm_chunks(np.random.default_rng(c), n, 65536, S0, 0.0, sigma, 1.0 / 252.0, steps)))
+        for c, n in zip(children, sizes)
+    ])
+
+
+def test_parallel_gbm_bounded_payload_and_accuracy():
+    import numpy as np
+
+    from quant.parallel import HIST_BINS, HIST_SIGMAS, _run_block
+
+    paths, blocks = 40_000, 4
+    out = parallel_gbm_terminal(100.0, 0.0, 0.5, 252, paths=paths, quantiles=(0.01, 0.5, 0.99), seed=5, workers=1, blocks=blocks)
+    x = np.sort(_same_samples(100.0, 0.5, 252, paths, 5, blocks))
+    q = out["quantiles"]
+    assert q[0.01] == x[int(0.01 * (paths - 1))]  # tails: exact order statistics
+    assert q[0.99] == x[int(0.99 * (paths - 1))]
+    width = 2 * HIST_SIGMAS * 0.5 / HIST_BINS  # one log-space bin
+    assert abs(math.log(q[0.5]) - math.log(x[int(0.5 * (paths - 1))])) <= width
+    assert math.isclose(out["mean"], x.mean(), rel_tol=1e-12)
+    assert math.isclose(out["std"], x.std(ddof=1), rel_tol=1e-9)
+    # a block's payload is bounded by its tail k plus the histogram, never half its paths
+    part = _run_block("gbm", (100.0, 0.0, 0.5, 1.0 / 252.0, 252), np.random.SeedSequence(1), 20_000, 200, 0, 4096, True)
+    assert part[3].size == 200 and part[4].size == 0 and part[5].size == HIST_BINS + 2
+
+
+def test_parallel_std_without_cancellation():
+    out = parallel_gbm_terminal(1e9, 0.0, 1e-6, 1, paths=20_000, dt=1.0, seed=1, workers=1, blocks=4)
+    assert abs(out["std"] / 1e3 - 1.0) < 0.02
@@ -0,0 +1,24 @@
+import numpy as np
+
+from quant.portfolio_var import PortfolioVaR
+
+
+def test_portfolio_var_components_and_cache():
+    cov = np.array([[0.04, 0.018, 0.0], [0.018, 0.09, -0.01], [0.0, -0.01, 0.01]])
+    pv = PortfolioVaR(cov, paths=200000, seed=4)
+    w = np.array([1000.0, -500.0, 2000.0])
+
+    mc = pv.evaluate(w, 0.99)
+    par = pv.evaluate(w, 0.99, method="parametric")
+    assert abs(mc["VaR"] - par["VaR"]) / par["VaR"] < 0.02
+    assert abs(mc["ES"] - par["ES"]) / par["ES"] < 0.02
+    assert np.isclose(mc["component_VaR"].sum(), mc["VaR"])
+    assert np.isclose(mc["component_ES"].sum(), mc["ES"])
+    assert np.allclose(mc["marginal_ES"] * w, mc["component_ES"])
+
+    # A position change re-prices the cached scenarios; a cov update does not reuse them
+    scen = pv.scenarios()
+    pv.evaluate(w * 2)
+    assert pv.scenarios() is scen
+    pv.set_covariance(cov * 2)
+    assert pv.scenarios() is not scen and pv.version == 2
@@ -0,0 +1,64 @@
+import json
+
+import numpy as np
+
+from quant.qcli import iter_batch, main
+from quant.var import cvar_historical, historical_var
+
+
+def _lines(reqs):
+    return [json.dumps(r) for r in reqs]
+
+
+def test_batch_keeps_input_order_and_reports_errors():
+    reqs = []
+    for i in range(40):
+        reqs.append({"cmd": "bs", "id": i, "cp": "c", "S": 100.0, "K": 80.0 + i, "T": 1.0, "r": 0.0, "sigma": 0.2})
+    reqs.insert(7, {"cmd": "nope", "id": "bad"})
+    lines = _lines(reqs) + ["{not json"]
+    serial = [json.loads(s) for s in iter_batch(lines, workers=1, chunk=5)]
+    pooled = [json.loads(s) for s in iter_batch(lines, workers=2, chunk=3)]
+    assert serial == pooled
+    assert [r["id"] for r in serial[:-1]] == [r["id"] for r in reqs]
+    assert serial[7]["ok"] is False and "unknown cmd" in serial[7]["error"]
+    assert serial[-1]["ok"] is False and serial[-1]["error"].startswith("JSONDecodeError")
+    prices = [r["result"]["price"] for r in serial[:-1] if r["ok"]]
+    assert all(a > b for a, b in zip(prices, prices[1:]))
+
+
+def test_var_hist_from_files(tmp_path, capsys):
+    rng = np.random.default_rng(3)
+    r = rng.normal(0.0, 0.02, 1000)
+    np.save(tmp_path / "r.npy", r)
+    np.savetxt(tmp_path / "r.csv", np.column_stack([np.arange(r.size), r]), delimiter=",",
+               header="t,ret", comments="")
+    want = {"VaR": historical_var(r.tolist(), 0.99), "CVaR": cvar_historical(r.tolist(), 0.99)}
+    reqs = [
+        {"cmd": "var_hist", "alpha": 0.99, "returns_file": str(tmp_path / "r.npy")},
+        {"cmd": "var_hist", "alpha": 0.99, "returns_file": str(tmp_path / "r.csv"), "column": "ret"},
+    ]
+    for out in iter_batch(_lines(reqs), workers=1):
+        res = json.loads(out)["result"]
+        assert abs(res["VaR"] - want["VaR"]) < 1e-12
+        assert abs(res["CVaR"] - want["CVaR"]) < 1e-12
+    main(["var_hist", "0.99", "--returns-file", str(tmp_path / "r.csv"), "--column", "1"])
+    assert abs(json.loads(capsys.readouterr().out)["VaR"] - want["VaR"]) < 1e-12
+
+
+def _strict(line):
+    def bad(token):
+        raise ValueError(f"non-JSON number {token}")
+    return json.loads(line, parse_constant=bad)
+
+
+def test_lp_outputs_are_strict_json(tmp_path, capsys):
+    unbounded = {"c": [1.0, 1.0], "A": [[1.0, -1.0]], "b": [1.0]}
+    infeasible = {"c": [1.0, 1.0], "A": [[1.0, 1.0]], "b": [-1.0]}
+    out = [_strict(s) for s in iter_batch(_lines([{"cmd": "lp", **p} for p in (unbounded, infeasible)]), workers=1)]
+    assert [r["result"]["status"] for r in out] == ["unbounded", "infeasible"]
+    assert [r["result"]["objective"] for r in out] == [None, None]
+    path = tmp_path / "lps.jsonl"
+    path.write_text("\n".join(_lines([unbounded, infeasible])) + "\n")
+    main(["lp", "--jsonl", str(path)])
+    rows = [_strict(s) for s in capsys.readouterr().out.splitlines()]
+    assert [(r["status"], r["objective"], r["x"]) for r in rows] == [("unbounded", None, None), ("infeasible", None, None)]
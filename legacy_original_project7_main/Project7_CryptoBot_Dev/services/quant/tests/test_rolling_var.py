@@ -0,0 +1,25 @@
+import random
+
+from quant.rolling_var import RollingVaR
+from quant.var import cvar_historical, historical_var
+
+
+def test_rolling_var_matches_window_recompute():
+    rng = random.Random(3)
+    xs = [rng.gauss(0.0, 0.02) for _ in range(600)]
+    rv = RollingVaR(window=100, alphas=(0.95, 0.99))
+    for i, x in enumerate(xs):
+        rv.update(x)
+        window = xs[max(0, i - 99) : i + 1]
+        for a in rv.alphas:
+            var, cvar = rv.var_es(a)
+            assert var == historical_var(window, a)
+            assert abs(cvar - cvar_historical(window, a)) < 1e-12
+    assert len(rv) == 100 and rv.full
+
+
+def test_rolling_var_ewma_weights_recent_losses():
+    rv = RollingVaR(window=50, alphas=(0.9,), decay=0.8)
+    rv.extend([-0.05] * 5 + [0.01] * 45)
+    # Old losses carry almost no weight once 45 small gains arrive
+    assert rv.var() == -0.01
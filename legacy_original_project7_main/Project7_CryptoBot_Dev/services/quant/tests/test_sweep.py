@@ -0,0 +1,57 @@
+import json
+import math
+import os
+
+from crypto_quant_ai.alpha.momentum_funding import MomentumFunding
+from crypto_quant_ai.alpha.perp_skew_mm import PerpSkewMM
+from crypto_quant_ai.backtest.engine import Backtest, MultiSymbolBacktest
+from crypto_quant_ai.backtest.sweep import expand_grid, run_sweep, walk_forward_windows
+from crypto_quant_ai.config.config import load_policy, project_root
+from crypto_quant_ai.data.feed import SyntheticTicks, ticks_to_columns
+from crypto_quant_ai.execution import oms_async
+from crypto_quant_ai.metrics.dsr import deflated_sharpe_ratio
+
+
+def _policy():
+    return load_policy(os.path.join(project_root(), "src/crypto_quant_ai/config/policy.yml"))
+
+
+def test_grid_and_windows():
+    grid = {"momentum_funding": {"lookback": [20, 30], "thresh": [0.5]}, "perp_skew_mm": {"skew_bps": [3, 5]}}
+    configs = expand_grid(grid)
+    assert len(configs) == 4
+    assert {"momentum_funding": {"lookback": 30, "thresh": 0.5}, "perp_skew_mm": {"skew_bps": 5}} in configs
+    assert walk_forward_windows(10, 3) == [(0, 3), (3, 6), (6, 10)]
+
+
+def test_sweep_rows_artifacts_and_ranking(monkeypatch, tmp_path):
+    monkeypatch.setattr(oms_async, "gate_decision", lambda *a, **k: {"allowed": True})
+    cols = ticks_to_columns(SyntheticTicks(steps=3000, start_ts=0))
+    grid = {"momentum_funding": {"lookback": [20, 60]}, "perp_skew_mm": {"skew_bps": [3, 8]}}
+    res = run_sweep(cols, grid, _policy(), str(tmp_path), folds=3, workers=1)
+    assert res["n_trials"] == 4  # configs: each window picks among them
+    rows = [json.loads(line) for line in open(tmp_path / "results.jsonl")]
+    assert len({r["run_id"] for r in rows}) == 12
+    for r in rows:
+        assert os.path.exists(tmp_path / "runs" / r["run_id"] / "model_card.json")
+    dsr = [r["dsr"] for r in res["rows"]]
+    assert dsr == sorted(dsr, reverse=True)
+    r = next(r for r in res["rows"] if r["trades"] >= 2)
+    assert r["dsr"] == deflated_sharpe_ratio(r["sharpe"] / math.sqrt(r["trades"]), 4, r["trades"], r["skew"], r["kurt"])
+    assert r["kurt"] != 3.0  # the run's own moments, not the normal defaults
+    assert len(res["walk_forward"]) == 2
+
+
+def test_multi_symbol_matches_single(monkeypatch, tmp_path):
+    monkeypatch.setattr(oms_async, "gate_decision", lambda *a, **k: {"allowed": True})
+    pol = _policy()
+    feeds = {
+        "BTC/USDT": SyntheticTicks(steps=2000, start_ts=0, seed=1),
+        "ETH/USDT": SyntheticTicks(steps=1500, start_price=2000.0, start_ts=0.5, seed=2),
+    }
+    strats = {sym: [MomentumFunding(), PerpSkewMM()] for sym in feeds}
+    total, per = MultiSymbolBacktest(pol, strats, str(tmp_path)).run(feeds)
+    for sym, feed in feeds.items():
+        single = Backtest(pol, [MomentumFunding(), PerpSkewMM()], str(tmp_path)).run(feed)
+        assert per[sym] == single
+    assert total.trades == sum(m.trades for m in per.values())
@@ -0,0 +1,24 @@
+import random
+
+import numpy as np
+
+from quant.var import cvar_historical, historical_var, var_es, var_es_batch
+
+
+def test_var_es_batch_matches_scalar():
+    rng = random.Random(7)
+    series = [[rng.gauss(0.0, 0.02) for _ in range(n)] for n in (250, 250, 250)]
+    alphas = (0.9, 0.95, 0.99)
+    var, cvar = var_es_batch(np.array(series), alphas)
+    assert var.shape == cvar.shape == (3, 3)
+    for i, rets in enumerate(series):
+        for j, a in enumerate(alphas):
+            assert var[i, j] == historical_var(rets, a)
+            assert abs(cvar[i, j] - cvar_historical(rets, a)) < 1e-12
+            assert var_es(rets, a) == (historical_var(rets, a), cvar_historical(rets, a))
+
+
+def test_var_es_batch_single_series():
+    var, cvar = var_es_batch([0.01, -0.03, 0.02, -0.01, 0.0], 0.75)
+    assert var.shape == (1, 1)
+    assert var[0, 0] == historical_var([0.01, -0.03, 0.02, -0.01, 0.0], 0.75)
@@ -0,0 +1,45 @@
+import math
+
+import numpy as np
+
+from quant.black_scholes import bs_price_batch
+from quant.vol_surface import VolSurface
+
+
+def _smile(T, K):
+    return 0.5 + 0.2 * math.log(K / 100.0) ** 2 + 0.05 * T
+
+
+def test_surface_hits_quotes_and_interpolates():
+    strikes = [60.0, 80.0, 90.0, 100.0, 110.0, 125.0, 150.0]
+    surf = VolSurface((T, K, _smile(T, K)) for T in (0.25, 1.0) for K in strikes)
+    for T in (0.25, 1.0):
+        for K in strikes:
+            assert abs(surf.sigma(K, T) - _smile(T, K)) < 1e-12
+    assert abs(surf.sigma(95.0, 0.25) - _smile(0.25, 95.0)) < 1e-3
+    # linear in total variance between expiries, flat vol outside strikes
+    w = 0.5 * (_smile(0.25, 100.0) ** 2 * 0.25 + _smile(1.0, 100.0) ** 2)
+    assert abs(surf.sigma(100.0, 0.625) - math.sqrt(w / 0.625)) < 1e-12
+    assert surf.sigma(10.0, 1.0) == surf.sigma(60.0, 1.0)
+    assert surf.sigma(100.0, 2.0) == surf.sigma(100.0, 1.0)
+
+
+def test_surface_refits_only_touched_expiries():
+    surf = VolSurface((T, K, 0.6) for T in (0.1, 0.5, 1.0) for K in (80.0, 100.0, 120.0))
+    assert surf.refit() == 3
+    assert surf.update([(0.5, 100.0, 0.7), (0.5, 120.0, 0.6)]) == 1
+    assert surf.refit() == 1
+    assert surf.refit() == 0
+    assert abs(surf.sigma(100.0, 0.5) - 0.7) < 1e-12
+
+
+def test_surface_from_prices():
+    K = np.array([80.0, 100.0, 120.0])
+    prices = bs_price_batch("c", 100.0, K, 0.5, 0.0, 0.65)
+    surf = VolSurface()
+    out = surf.update_from_prices(prices, "c", 100.0, K, 0.5)
+    assert np.all(out["status"] == "converged")
+    assert np.allclose(surf.sigma_batch([90.0, 110.0], 0.5), 0.65, atol=1e-8)
+    # warm-started from the surface: expired rows are flagged, not raised
+    out = surf.update_from_prices(np.append(prices, [1.0, 1.0]), "c", 100.0, np.append(K, [100.0, 100.0]), [0.5] * 3 + [0.0, -0.1])
+    assert out["status"].tolist() == ["converged"] * 3 + ["bad_input"] * 2
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+DEFAULT_PATH = os.path.join(tempfile.gettempdir(), 'quant_analysis_cache.sqlite3')
+DEFAULT_TTL_S = 900.0
+DEFAULT_MAX_ENTRIES = 4096
+# capital buckets are quarter-decades: 1000 and 1700 share one, 1000 and 2000 do not
+BUCKETS_PER_DECADE = 4
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS analyses (
+    id TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS analyses_used ON analyses (used_at);
+CREATE TABLE IF NOT EXISTS analysis_keys (
+    key TEXT PRIMARY KEY,
+    id TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS cache_stats (
+    name TEXT PRIMARY KEY,
+    n INTEGER NOT NULL
+);
+"""
+
+
+def capital_bucket(capital: float) -> int:
+    if capital <= 0:
+        return -1
+    return math.floor(math.log10(capital) * BUCKETS_PER_DECADE)
+
+
+def analysis_key(symbol: str, timeframe: str, capital: float, scan: bool = False) -> str:
+    # scan results use the scan-wide VaR, not the per-symbol one: keep them apart
+    key = f'{symbol}|{timeframe}|{capital_bucket(capital)}'
+    return key + '|scan' if scan else key
+
+
+def analysis_id(symbol: str, timeframe: str, capital: float, scan: bool = False) -> str:
+    """Stable id of the analysis cached under (symbol, timeframe, capital bucket); distinct keys never share one."""
+    return 'analysis_' + hashlib.sha256(analysis_key(symbol, timeframe, capital, scan).encode()).hexdigest()[:32]
+
+
+class AnalysisCache:
+    """
+    Bounded, TTL-evicting store of computed analyses.
+
+    Entries are found by analysis id or by (symbol, timeframe, capital
+    bucket). Everything, including the hit/miss counters, lives in one
+    local SQLite file (WAL mode), so all uvicorn workers on a host share it.
+    When full, the least recently used entries are evicted.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_PATH,
+        ttl_s: float = DEFAULT_TTL_S,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        if ttl_s <= 0 or max_entries <= 0:
+            raise ValueError('ttl_s and max_entries must be > 0')
+        self.path = path
+        self.ttl_s = float(ttl_s)
+        self.max_entries = int(max_entries)
+        self._local = threading.local()
+        with self._conn() as db:
+            db.executescript(_SCHEMA)
+
+    @classmethod
+    def from_env(cls) -> 'AnalysisCache':
+        return cls(
+            os.getenv('QUANT_ANALYSIS_CACHE', DEFAULT_PATH),
+            float(os.getenv('QUANT_ANALYSIS_TTL_S', DEFAULT_TTL_S)),
+            int(os.getenv('QUANT_ANALYSIS_MAX_ENTRIES', DEFAULT_MAX_ENTRIES)),
+        )
+
+    def _conn(self) -> sqlite3.Connection:
+        # one connection per thread; FastAPI runs sync endpoints in a pool
+        db = getattr(self._local, 'db', None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=5.0)
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute('PRAGMA synchronous=NORMAL')
+            self._local.db = db
+        return db
+
+    def _count(self, db: sqlite3.Connection, name: str, n: int = 1) -> None:
+        db.execute(
+            'INSERT INTO cache_stats (name, n) VALUES (?, ?) '
+            'ON CONFLICT(name) DO UPDATE SET n = n + excluded.n',
+            (name, n),
+        )
+
+    def _load(self, db: sqlite3.Connection, analysis_id: str) -> dict | None:
+        now = time.time()
+        row = db.execute(
+            'SELECT payload FROM analyses WHERE id = ? AND expires_at > ?',
+            (analysis_id, now),
+        ).fetchone()
+        if row is None:
+            return None
+        db.execute('UPDATE analyses SET used_at = ? WHERE id = ?', (now, analysis_id))
+        return json.loads(row[0])
+
+    def get(self, analysis_id: str) -> dict | None:
+        """Analysis by id, or None if unknown or expired."""
+        db = self._conn()
+        with db:
+            out = self._load(db, analysis_id)
+            self._count(db, 'hits' if out is not None else 'misses')
+        return out
+
+    def get_by_key(self, symbol: str, timeframe: str, capital: float) -> dict | None:
+        """Analysis for the same symbol, timeframe and capital bucket, or None."""
+        db = self._conn()
+        with db:
+            row = db.execute(
+                'SELECT id FROM analysis_keys WHERE key = ?',
+                (analysis_key(symbol, timeframe, capital),),
+            ).fetchone()
+            out = self._load(db, row[0]) if row else None
+            self._count(db, 'hits' if out is not None else 'misses')
+        return out
+
+    def find(self, analysis_id: str, symbol: str, timeframe: str, capital: float) -> dict | None:
+        """
+        Analysis by id if it was stored for this symbol and timeframe, else
+        by (symbol, timeframe, capital bucket). Counts one hit or one miss.
+        """
+        db = self._conn()
+        with db:
+            out = None
+            keys = db.execute('SELECT key FROM analysis_keys WHERE id = ?', (analysis_id,)).fetchall()
+            if any(k.split('|')[:2] == [symbol, timeframe] for (k,) in keys):
+                out = self._load(db, analysis_id)
+            if out is None:
+                row = db.execute(
+                    'SELECT id FROM analysis_keys WHERE key = ?',
+                    (analysis_key(symbol, timeframe, capital),),
+                ).fetchone()
+                out = self._load(db, row[0]) if row else None
+            self._count(db, 'hits' if out is not None else 'misses')
+        return out
+
+    def get_many_by_key(self, pairs: list[tuple[str, str]], capital: float, scan: bool = False) -> dict:
+        """{(symbol, timeframe): analysis} for the pairs found, in one transaction."""
+        db = self._conn()
+        found = {}
+        with db:
+            for symbol, timeframe in pairs:
+                row = db.execute(
+                    'SELECT id FROM analysis_keys WHERE key = ?',
+                    (analysis_key(symbol, timeframe, capital, scan),),
+                ).fetchone()
+                out = self._load(db, row[0]) if row else None
+                if out is not None:
+                    found[symbol, timeframe] = out
+            self._count(db, 'hits', len(found))
+            self._count(db, 'misses', len(pairs) - len(found))
+        return found
+
+    def put(self, analysis: dict, symbol: str, timeframe: str, capital: float) -> None:
+        """Store an analysis (it must carry an 'id') and evict expired / excess entries."""
+        self.put_many([(analysis, symbol, timeframe, capital)])
+
+    def put_many(self, entries: list[tuple[dict, str, str, float]], scan: bool = False) -> None:
+        """Store (analysis, symbol, timeframe, capital) entries in one transaction."""
+        now = time.time()
+        db = self._conn()
+        with db:
+            db.executemany(
+                'INSERT OR REPLACE INTO analyses (id, payload, expires_at, used_at) VALUES (?, ?, ?, ?)',
+                [(a['id'], json.dumps(a), now + self.ttl_s, now) for a, _, _, _ in entries],
+            )
+            db.executemany(
+                'INSERT OR REPLACE INTO analysis_keys (key, id) VALUES (?, ?)',
+                [(analysis_key(s, tf, c, scan), a['id']) for a, s, tf, c in entries],
+            )
+            db.execute('DELETE FROM analyses WHERE expires_at <= ?', (now,))
+            db.execute(
+                'DELETE FROM analyses WHERE id IN ('
+                'SELECT id FROM analyses ORDER BY used_at DESC LIMIT -1 OFFSET ?)',
+                (self.max_entries,),
+            )
+            db.execute('DELETE FROM analysis_keys WHERE id NOT IN (SELECT id FROM analyses)')
+
+    def stats(self) -> dict:
+        db = self._conn()
+        counts = dict(db.execute('SELECT name, n FROM cache_stats').fetchall())
+        hits, misses = counts.get('hits', 0), counts.get('misses', 0)
+        size = db.execute('SELECT COUNT(*) FROM analyses WHERE expires_at > ?', (time.time(),)).fetchone()[0]
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hits / (hits + misses) if hits + misses else 0.0,
+            'size': size,
+            'max_entries': self.max_entries,
+            'ttl_s': self.ttl_s,
+        }
+
+    def clear(self) -> None:
+        db = self._conn()
+        with db:
+            db.execute('DELETE FROM analyses')
+            db.execute('DELETE FROM analysis_keys')
+            db.execute('DELETE FROM cache_stats')
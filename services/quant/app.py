@@ -1,9 +1,56 @@
-from fastapi import FastAPI
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from strategy_engine import build_analysis, build_plan
-import random
+from starlette.concurrency import run_in_threadpool
+from strategy_engine import build_plan, mc_var95, run_analysis, run_scan
+from analysis_cache import AnalysisCache, capital_bucket
+
+POOL_WORKERS = int(os.getenv('QUANT_POOL_WORKERS', os.cpu_count() or 1))
+# distinct analyses queued or running per uvicorn worker before new ones get 429;
+# at ~30-50 ms each that is well inside the backend's 5 s client timeout
+MAX_INFLIGHT = int(os.getenv('QUANT_MAX_INFLIGHT', 32 * POOL_WORKERS))
+MAX_SCAN_PAIRS = int(os.getenv('QUANT_MAX_SCAN_PAIRS', 5000))
+SCAN_CHUNK = 32
+# chunks one scan keeps in flight, so a large scan leaves room for /analysis
+SCAN_WINDOW = int(os.getenv('QUANT_SCAN_WINDOW', max(1, MAX_INFLIGHT // 4)))
+# every scan shares this VaR scenario set, so scans are reproducible
+SCAN_VAR_SEED = 0
+
+cache = AnalysisCache.from_env()
+_pool: ProcessPoolExecutor | None = None
+_inflight: dict[tuple, asyncio.Future] = {}
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    # created by lifespan; lazily if the app runs without it, never falling back to
+    # run_in_executor(None, ...) and its thread pool for CPU-bound work
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=POOL_WORKERS)
+    return _pool
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global _pool
+    _get_pool()
+    try:
+        yield
+    finally:
+        _pool.shutdown(cancel_futures=True)
+        _pool = None
 
-app = FastAPI(title='Quant Service')
+
+app = FastAPI(title='Quant Service', lifespan=lifespan)
 
 
 class AnalysisReq(BaseModel):
@@ -12,11 +59,35 @@ class AnalysisReq(BaseModel):
     capital: float
 
 
+async def _compute_analysis(symbol: str, timeframe: str, capital: float) -> dict:
+    """
+    Run the analysis in the process pool and cache it. Concurrent requests
+    for the same cache key (symbol, timeframe, capital bucket) share one
+    computation: the result is seeded by symbol + timeframe and its id
+    belongs to that key, so they would compute the same thing.
+    """
+    key = (symbol, timeframe, capital_bucket(capital))
+    fut = _inflight.get(key)
+    if fut is None:
+        if len(_inflight) >= MAX_INFLIGHT:
+            raise HTTPException(status_code=429, detail='quant service busy', headers={'Retry-After': '1'})
+        loop = asyncio.get_running_loop()
+        fut = loop.run_in_executor(_get_pool(), run_analysis, symbol, timeframe, capital)
+        _inflight[key] = fut
+        fut.add_done_callback(lambda _: _inflight.pop(key, None))
+    result = dict(await asyncio.shield(fut))
+    result['meta'] = {**result['meta'], 'capital': capital}
+    await run_in_threadpool(cache.put, result, symbol, timeframe, capital)
+    return result
+
+
 @app.post('/analysis')
-def analysis(req: AnalysisReq):
-    random.seed(req.symbol + req.timeframe)
-    result = build_analysis(req.symbol, req.timeframe, req.capital)
-    result['id'] = f'analysis_{int(random.random() * 1e6)}'
+async def analysis(req: AnalysisReq):
+    result = await run_in_threadpool(cache.get_by_key, req.symbol, req.timeframe, req.capital)
+    if result is None:
+        return await _compute_analysis(req.symbol, req.timeframe, req.capital)
+    # same bucket, possibly a different amount: report the requested capital
+    result['meta']['capital'] = req.capital
     return result
 
 
@@ -28,6 +99,90 @@ class PlanReq(BaseModel):
 
 
 @app.post('/trade-plan/generate')
-def plan(req: PlanReq):
-    result = build_plan({'id': req.analysisId, 'meta': {}}, req.symbol, req.timeframe, req.capital)
-    return result
+async def plan(req: PlanReq):
+    # an analysisId stored for another symbol / timeframe is ignored
+    analysis = await run_in_threadpool(cache.find, req.analysisId, req.symbol, req.timeframe, req.capital)
+    if analysis is None:
+        analysis = await _compute_analysis(req.symbol, req.timeframe, req.capital)
+    return build_plan(analysis, req.symbol, req.timeframe, req.capital)
+
+
+class ScanReq(BaseModel):
+    symbols: list[str]
+    timeframes: list[str] = ['1h']
+    capital: float
+
+
+def _row(symbol: str, timeframe: str, analysis: dict, cached: bool) -> bytes:
+    return (json.dumps({'symbol': symbol, 'timeframe': timeframe, 'cached': cached, 'analysis': analysis}) + '\n').encode()
+
+
+def _error_row(symbol: str, timeframe: str, error: str) -> bytes:
+    return (json.dumps({'symbol': symbol, 'timeframe': timeframe, 'cached': False, 'error': error}) + '\n').encode()
+
+
+def _submit_chunk(chunk: list[tuple[str, str]], capital: float, var: float) -> asyncio.Future:
+    # scan chunks hold slots in _inflight like single analyses, so both share MAX_INFLIGHT
+    fut = asyncio.get_running_loop().run_in_executor(_get_pool(), run_scan, chunk, capital, var)
+    key = ('scan', id(fut))
+    _inflight[key] = fut
+    fut.add_done_callback(lambda _: _inflight.pop(key, None))
+    return fut
+
+
+async def _scan_rows(pairs: list[tuple[str, str]], capital: float):
+    found = await run_in_threadpool(cache.get_many_by_key, pairs, capital, True)
+    for (symbol, timeframe), hit in found.items():
+        hit['meta']['capital'] = capital
+        yield _row(symbol, timeframe, hit, True)
+    todo = [p for p in pairs if p not in found]
+    if not todo:
+        return
+    loop = asyncio.get_running_loop()
+    # the MC VaR inputs do not depend on the symbol: simulate them once per scan
+    var = await loop.run_in_executor(_get_pool(), mc_var95, SCAN_VAR_SEED)
+
+    pending = deque(todo[i:i + SCAN_CHUNK] for i in range(0, len(todo), SCAN_CHUNK))
+    running: dict[asyncio.Future, list] = {}
+    while pending or running:
+        while pending and len(running) < SCAN_WINDOW and len(_inflight) < MAX_INFLIGHT:
+            chunk = pending.popleft()
+            running[_submit_chunk(chunk, capital, var)] = chunk
+        # with no slot of its own, the scan waits for any in-flight work to finish
+        done, _ = await asyncio.wait(running or set(_inflight.values()), return_when=asyncio.FIRST_COMPLETED)
+        for fut in done:
+            chunk = running.pop(fut, None)
+            if chunk is None:
+                continue
+            exc = asyncio.CancelledError('scan chunk cancelled') if fut.cancelled() else fut.exception()
+            if exc is not None:  # one failed chunk must not cut the stream
+                for symbol, timeframe in chunk:
+                    yield _error_row(symbol, timeframe, str(exc))
+                continue
+            results = fut.result()
+            await run_in_threadpool(cache.put_many, [(a, s, tf, capital) for a, (s, tf) in zip(results, chunk)], True)
+            for a, (symbol, timeframe) in zip(results, chunk):
+                yield _row(symbol, timeframe, a, False)
+
+
+@app.post('/analysis/scan')
+async def scan(req: ScanReq):
+    """
+    Analyses for every symbol x timeframe, streamed as NDJSON rows
+    ({symbol, timeframe, cached, analysis}, or {symbol, timeframe, cached,
+    error} for a failed chunk) in completion order: cache hits first, then
+    pool chunks as they finish. All rows computed by a scan share one VaR
+    simulation, so they are cached under scan ids, apart from /analysis.
+    """
+    pairs = [(s, tf) for s in dict.fromkeys(req.symbols) for tf in dict.fromkeys(req.timeframes)]
+    if len(pairs) > MAX_SCAN_PAIRS:
+        raise HTTPException(status_code=422, detail=f'scan is limited to {MAX_SCAN_PAIRS} symbol x timeframe pairs')
+    if len(_inflight) >= MAX_INFLIGHT:
+        raise HTTPException(status_code=429, detail='quant service busy', headers={'Retry-After': '1'})
+    return StreamingResponse(_scan_rows(pairs, req.capital), media_type='application/x-ndjson')
+
+
+@app.get('/analysis/cache/stats')
+async def analysis_cache_stats():
+    stats = await run_in_threadpool(cache.stats)
+    return {**stats, 'inflight': len(_inflight), 'max_inflight': MAX_INFLIGHT}
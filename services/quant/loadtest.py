@@ -0,0 +1,87 @@
+"""
+Concurrent load test for the quant service.
+
+    python loadtest.py --url http://localhost:8100 --requests 400 --concurrency 32
+
+Fires /analysis requests (optionally followed by /trade-plan/generate)
+from a thread pool and reports p50 / p95 / p99 latency, throughput and
+how many requests were shed with 429 or failed. --distinct controls how
+many (symbol, timeframe) pairs are used; pass --capital-jitter to spread
+capitals across cache buckets.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+TIMEFRAMES = ['1m', '5m', '15m', '1h', '4h', '1d']
+
+
+def _post(url: str, body: dict, timeout: float) -> tuple[int, dict | None]:
+    req = urllib.request.Request(
+        url, data=json.dumps(body).encode(), headers={'Content-Type': 'application/json'}
+    )
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            return resp.status, json.loads(resp.read())
+    except urllib.error.HTTPError as exc:
+        return exc.code, None
+
+
+def _one(args: argparse.Namespace, i: int) -> tuple[float, int]:
+    rng = random.Random(i)
+    k = rng.randrange(args.distinct)
+    body = {
+        'symbol': f'SYM{k // len(TIMEFRAMES)}USDT',
+        'timeframe': TIMEFRAMES[k % len(TIMEFRAMES)],
+        'capital': 10_000 * (10 ** rng.uniform(0, 2) if args.capital_jitter else 1),
+    }
+    t0 = time.perf_counter()
+    try:
+        status, data = _post(f'{args.url}/analysis', body, args.timeout)
+        if status == 200 and args.plan:
+            status, _ = _post(f'{args.url}/trade-plan/generate', {**body, 'analysisId': data['id']}, args.timeout)
+    except (OSError, ValueError):
+        status = -1
+    return time.perf_counter() - t0, status
+
+
+def _pct(sorted_s: list[float], p: float) -> float:
+    if not sorted_s:
+        return float('nan')
+    return sorted_s[min(len(sorted_s) - 1, int(p / 100 * len(sorted_s)))] * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description='p50/p99 latency of the quant service under concurrency')
+    parser.add_argument('--url', default='http://localhost:8100')
+    parser.add_argument('--requests', type=int, default=400)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--distinct', type=int, default=64, help='distinct (symbol, timeframe) pairs')
+    parser.add_argument('--capital-jitter', action='store_true')
+    parser.add_argument('--plan', action='store_true', help='also generate a plan per analysis')
+    parser.add_argument('--timeout', type=float, default=5.0, help='client timeout (s), as in the backend')
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        results = list(pool.map(lambda i: _one(args, i), range(args.requests)))
+    wall = time.perf_counter() - t0
+
+    ok = sorted(s for s, status in results if status == 200)
+    shed = sum(1 for _, status in results if status == 429)
+    failed = len(results) - len(ok) - shed
+    print(f'requests {len(results)}  concurrency {args.concurrency}  wall {wall:.2f}s  '
+          f'throughput {len(results) / wall:.1f} req/s')
+    print(f'ok {len(ok)}  429 {shed}  failed {failed}')
+    print(f'latency ms  p50 {_pct(ok, 50):.1f}  p95 {_pct(ok, 95):.1f}  p99 {_pct(ok, 99):.1f}  '
+          f'max {ok[-1] * 1e3 if ok else float("nan"):.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -9,16 +9,33 @@ LEGACY_PATH = Path(__file__).resolve().parents[2] / 'legacy_original_project7_ma
 if str(LEGACY_PATH) not in sys.path:
     sys.path.insert(0, str(LEGACY_PATH))
 
-from quant import kelly_fraction, monte_carlo_var  # type: ignore
+import quant  # type: ignore
+from analysis_cache import analysis_id
 
 
-def build_analysis(symbol: str, timeframe: str, capital: float) -> dict:
-    win_prob = 0.52 + random.random() * 0.08
-    odds = 1.2 + random.random() * 0.5
-    kelly = kelly_fraction(win_prob, odds)
-    var = monte_carlo_var(0.02, 0.06, 0.95, 1.0, 4000)
+def mc_var95(seed: int | None = None) -> float:
+    # a fixed 4000 paths, as /analysis has always drawn: an early-stopping ci_width
+    # loose enough to matter would end most runs after the first 1024-path batch
+    return quant.mc_var(0.02, 0.06, 0.95, 1.0, paths=4000, seed=seed, sampling='antithetic')['VaR']
+
+
+def build_analysis(
+    symbol: str,
+    timeframe: str,
+    capital: float,
+    rng: random.Random | None = None,
+    var: float | None = None,
+) -> dict:
+    """Pass `var` to reuse a VaR computed once for many symbols (see run_scan)."""
+    rng = rng or random.Random()
+    win_prob = 0.52 + rng.random() * 0.08
+    odds = 1.2 + rng.random() * 0.5
+    kelly = quant.kelly_fraction(win_prob, odds)
+    seed = rng.getrandbits(64)  # drawn either way so the rest of the stream is unchanged
+    if var is None:
+        var = mc_var95(seed)
     signals = [
-        {'name': 'Momentum', 'value': round(random.uniform(-0.3, 0.7), 2), 'weight': 0.4},
+        {'name': 'Momentum', 'value': round(rng.uniform(-0.3, 0.7), 2), 'weight': 0.4},
         {'name': 'Signal Strength', 'value': round(kelly, 2), 'weight': 0.3},
         {'name': 'VaR Confidence', 'value': round(var, 2), 'weight': 0.2},
     ]
@@ -34,13 +51,14 @@ def build_analysis(symbol: str, timeframe: str, capital: float) -> dict:
     }
 
 
-def build_plan(analysis: dict, symbol: str, timeframe: str, capital: float) -> dict:
+def build_plan(analysis: dict, symbol: str, timeframe: str, capital: float, rng: random.Random | None = None) -> dict:
+    rng = rng or random.Random()
     qty_pct = min(0.05, math.sqrt(analysis['meta']['kelly']) * 0.04)
     stop_loss = 0.02
     take_profit = 0.04
     rationale = f"Kelly sizing {analysis['meta']['kelly']:.2f} with VaR {analysis['meta']['var95']:.2f}"
     return {
-        'id': f'plan_{int(random.random()*1e6)}',
+        'id': f'plan_{int(rng.random()*1e6)}',
         'analysisId': analysis.get('id', 'analysis_1'),
         'symbol': symbol,
         'timeframe': timeframe,
@@ -49,3 +67,21 @@ def build_plan(analysis: dict, symbol: str, timeframe: str, capital: float) -> d
         'exitRules': {'stopLossPct': stop_loss, 'takeProfitPct': take_profit},
         'meta': {'source': 'legacy-strategy', 'kelly': analysis['meta']['kelly']},
     }
+
+
+def run_analysis(symbol: str, timeframe: str, capital: float, var: float | None = None) -> dict:
+    """Seeded analysis with its id; the unit of work sent to the process pool."""
+    rng = random.Random(symbol + timeframe)
+    result = build_analysis(symbol, timeframe, capital, rng, var)
+    result['id'] = analysis_id(symbol, timeframe, capital)
+    return result
+
+
+def run_scan(pairs: list[tuple[str, str]], capital: float, var: float) -> list[dict]:
+    """Analyses for a chunk of (symbol, timeframe) pairs sharing one VaR, under scan ids."""
+    out = []
+    for symbol, timeframe in pairs:
+        result = run_analysis(symbol, timeframe, capital, var)
+        result['id'] = analysis_id(symbol, timeframe, capital, scan=True)
+        out.append(result)
+    return out
@@ -0,0 +1,64 @@
+import asyncio
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# the service runs from its own directory (uvicorn app:app); mirror that for imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+def _stub_analysis(symbol, timeframe, capital, scan=False):
+    from analysis_cache import analysis_id
+    return {'id': analysis_id(symbol, timeframe, capital, scan), 'summary': symbol, 'signals': [],
+            'meta': {'kelly': 0.1, 'var95': 0.05, 'timeframe': timeframe, 'capital': capital}}
+
+
+async def _until(cond):
+    for _ in range(500):
+        if cond():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError('timed out')
+
+
+@pytest.fixture
+def service(monkeypatch, tmp_path):
+    """
+    The app with a temp cache and a thread pool whose stub workers record
+    their calls, block until `release` is set and fail for symbol 'BAD'.
+    """
+    import httpx
+    import app
+    from analysis_cache import AnalysisCache
+
+    release = threading.Event()
+    calls = []
+
+    def run_analysis(symbol, timeframe, capital, var=None):
+        calls.append((symbol, timeframe))
+        release.wait(5)
+        return _stub_analysis(symbol, timeframe, capital)
+
+    def run_scan(pairs, capital, var):
+        calls.append(pairs)
+        release.wait(5)
+        if any(s == 'BAD' for s, _ in pairs):
+            raise RuntimeError('feed down')
+        return [_stub_analysis(s, tf, capital, scan=True) for s, tf in pairs]
+
+    monkeypatch.setattr(app, 'cache', AnalysisCache(str(tmp_path / 'c.sqlite3')))
+    monkeypatch.setattr(app, 'run_analysis', run_analysis)
+    monkeypatch.setattr(app, 'run_scan', run_scan)
+    monkeypatch.setattr(app, 'mc_var95', lambda seed: 0.05)
+    monkeypatch.setattr(app, '_pool', ThreadPoolExecutor(max_workers=4))
+    yield SimpleNamespace(
+        app=app, release=release, calls=calls, analysis=_stub_analysis, until=_until,
+        client=lambda: httpx.AsyncClient(transport=httpx.ASGITransport(app=app.app), base_url='http://quant'),
+    )
+    release.set()
+    app._pool.shutdown()
+    app._inflight.clear()
@@ -0,0 +1,98 @@
+import pytest
+
+import analysis_cache
+from analysis_cache import AnalysisCache, analysis_id
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    c = _Clock()
+    monkeypatch.setattr(analysis_cache.time, 'time', c)
+    return c
+
+
+def _analysis(symbol, timeframe='1h', capital=10_000):
+    return {'id': analysis_id(symbol, timeframe, capital), 'meta': {'timeframe': timeframe, 'capital': capital}}
+
+
+def _store(cache, symbol, timeframe='1h', capital=10_000):
+    a = _analysis(symbol, timeframe, capital)
+    cache.put(a, symbol, timeframe, capital)
+    return a
+
+
+def test_lookup_by_id_and_key(tmp_path, clock):
+    cache = AnalysisCache(str(tmp_path / 'c.sqlite3'))
+    a = _store(cache, 'BTCUSDT')
+    assert cache.get(a['id']) == a
+    assert cache.get_by_key('BTCUSDT', '1h', 15_000) == a  # same quarter-decade bucket
+    assert cache.get_by_key('BTCUSDT', '1h', 20_000) is None
+    assert cache.get_by_key('ETHUSDT', '1h', 10_000) is None
+    assert cache.stats()['hits'] == 2 and cache.stats()['misses'] == 2
+
+
+def test_ids_are_distinct_per_key():
+    ids = {analysis_id(f'SYM{i}', tf, c) for i in range(300) for tf in ('1h', '4h') for c in (1e4, 1e5)}
+    assert len(ids) == 1200
+
+
+def test_find_ignores_id_of_other_symbol_and_counts_once(tmp_path, clock):
+    cache = AnalysisCache(str(tmp_path / 'c.sqlite3'))
+    btc = _store(cache, 'BTCUSDT')
+    eth = _store(cache, 'ETHUSDT')
+    assert cache.find(btc['id'], 'ETHUSDT', '1h', 10_000) == eth  # falls back to the key
+    assert cache.find(btc['id'], 'BTCUSDT', '1h', 10_000) == btc
+    assert cache.find('analysis_unknown', 'SOLUSDT', '1h', 10_000) is None
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses']) == (2, 1)
+
+
+def test_ttl_expiry(tmp_path, clock):
+    cache = AnalysisCache(str(tmp_path / 'c.sqlite3'), ttl_s=60)
+    a = _store(cache, 'BTCUSDT')
+    clock.now += 59
+    assert cache.get(a['id']) == a
+    clock.now += 2
+    assert cache.get(a['id']) is None
+    assert cache.stats()['size'] == 0
+
+
+def test_lru_eviction(tmp_path, clock):
+    cache = AnalysisCache(str(tmp_path / 'c.sqlite3'), max_entries=2)
+    a = _store(cache, 'A')
+    clock.now += 1
+    b = _store(cache, 'B')
+    clock.now += 1
+    assert cache.get(a['id']) == a  # A is now the most recently used
+    clock.now += 1
+    c = _store(cache, 'C')
+    assert cache.get(b['id']) is None
+    assert cache.get(a['id']) == a and cache.get(c['id']) == c
+    assert cache.get_by_key('B', '1h', 10_000) is None  # its key went with it
+    assert cache.stats()['size'] == 2
+
+
+def test_put_many_get_many_and_clear(tmp_path, clock):
+    cache = AnalysisCache(str(tmp_path / 'c.sqlite3'))
+    entries = [(_analysis(s), s, '1h', 10_000) for s in ('A', 'B', 'C')]
+    cache.put_many(entries)
+    found = cache.get_many_by_key([('A', '1h'), ('B', '1h'), ('Z', '1h')], 10_000)
+    assert set(found) == {('A', '1h'), ('B', '1h')}
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['size']) == (2, 1, 3)
+    assert stats['hit_rate'] == pytest.approx(2 / 3)
+    cache.clear()
+    assert cache.stats()['size'] == 0 and cache.stats()['hits'] == 0
+
+
+def test_rejects_bad_limits(tmp_path):
+    with pytest.raises(ValueError):
+        AnalysisCache(str(tmp_path / 'c.sqlite3'), ttl_s=0)
@@ -0,0 +1,68 @@
+import asyncio
+
+import app
+from analysis_cache import analysis_id
+
+
+def test_concurrent_identical_requests_share_one_computation(service):
+    body = {'symbol': 'BTCUSDT', 'timeframe': '1h', 'capital': 10_000}
+
+    async def go():
+        async with service.client() as c:
+            reqs = [asyncio.ensure_future(c.post('/analysis', json=body)) for _ in range(5)]
+            await service.until(lambda: service.calls)
+            service.release.set()
+            return await asyncio.gather(*reqs)
+
+    resps = asyncio.run(go())
+    assert [r.status_code for r in resps] == [200] * 5
+    assert len(service.calls) == 1
+    assert len({r.json()['id'] for r in resps}) == 1
+
+
+def test_coalescing_is_per_capital_bucket(service):
+    capitals = [10_000, 11_000, 100_000]  # the first two share a bucket
+
+    async def go():
+        async with service.client() as c:
+            reqs = [asyncio.ensure_future(c.post('/analysis', json={'symbol': 'BTCUSDT', 'timeframe': '1h', 'capital': k}))
+                    for k in capitals]
+            await service.until(lambda: len(service.calls) == 2)
+            service.release.set()
+            return await asyncio.gather(*reqs)
+
+    ids = [r.json()['id'] for r in asyncio.run(go())]
+    assert len(service.calls) == 2
+    assert ids == [analysis_id('BTCUSDT', '1h', k) for k in capitals]
+    assert ids[0] == ids[1] != ids[2]
+    # each bucket keeps its own id
+    assert service.app.cache.get_by_key('BTCUSDT', '1h', 100_000)['id'] == ids[2]
+    assert service.app.cache.get_by_key('BTCUSDT', '1h', 10_000)['id'] == ids[0]
+
+
+def test_over_max_inflight_sheds_with_retry_after(service, monkeypatch):
+    monkeypatch.setattr(service.app, 'MAX_INFLIGHT', 1)
+
+    async def go():
+        async with service.client() as c:
+            first = asyncio.ensure_future(c.post('/analysis', json={'symbol': 'A', 'timeframe': '1h', 'capital': 1e4}))
+            await service.until(lambda: service.calls)
+            shed = await c.post('/analysis', json={'symbol': 'B', 'timeframe': '1h', 'capital': 1e4})
+            service.release.set()
+            return await first, shed
+
+    first, shed = asyncio.run(go())
+    assert first.status_code == 200
+    assert shed.status_code == 429 and shed.headers['retry-after'] == '1'
+    assert service.calls == [('A', '1h')]
+
+
+def test_pool_is_created_lazily_without_lifespan(monkeypatch):
+    monkeypatch.setattr(app, '_pool', None)
+    pool = app._get_pool()
+    try:
+        assert pool is app._get_pool()
+        assert type(pool).__name__ == 'ProcessPoolExecutor'
+    finally:
+        pool.shutdown()
+        app._pool = None
@@ -0,0 +1,65 @@
+import asyncio
+import json
+
+import pytest
+
+from analysis_cache import analysis_id
+
+
+@pytest.fixture
+def scan(service, monkeypatch):
+    """The stub service with one pair per chunk and workers that do not block."""
+    monkeypatch.setattr(service.app, 'SCAN_CHUNK', 1)
+    service.release.set()
+    return service
+
+
+def _scan(svc, symbols, capital=10_000):
+    async def go():
+        async with svc.client() as c:
+            return await c.post('/analysis/scan', json={'symbols': symbols, 'capital': capital})
+    resp = asyncio.run(go())
+    assert resp.status_code == 200
+    return [json.loads(line) for line in resp.text.splitlines()]
+
+
+def test_scan_streams_hits_first_and_caches_under_scan_ids(scan):
+    cache = scan.app.cache
+    cache.put_many([(scan.analysis('ETH', '1h', 10_000, scan=True), 'ETH', '1h', 10_000)], scan=True)
+    rows = _scan(scan, ['BTC', 'ETH', 'SOL'])
+    assert [(r['symbol'], r['cached']) for r in rows[:1]] == [('ETH', True)]
+    assert sorted((r['symbol'], r['cached']) for r in rows[1:]) == [('BTC', False), ('SOL', False)]
+    assert sorted(p for chunk in scan.calls for p in chunk) == [('BTC', '1h'), ('SOL', '1h')]
+    # written back under scan keys only: /analysis never serves the scan-wide VaR
+    found = cache.get_many_by_key([('BTC', '1h'), ('SOL', '1h')], 10_000, scan=True)
+    assert set(found) == {('BTC', '1h'), ('SOL', '1h')}
+    assert cache.get_by_key('BTC', '1h', 10_000) is None
+    assert found['BTC', '1h']['id'] != analysis_id('BTC', '1h', 10_000)
+    assert all(r['cached'] for r in _scan(scan, ['BTC', 'SOL']))
+
+
+def test_scan_failed_chunk_yields_error_rows(scan):
+    rows = {r['symbol']: r for r in _scan(scan, ['BTC', 'BAD'])}
+    assert rows['BAD'] == {'symbol': 'BAD', 'timeframe': '1h', 'cached': False, 'error': 'feed down'}
+    assert rows['BTC']['cached'] is False and rows['BTC']['analysis']['summary'] == 'BTC'
+    assert scan.app.cache.get_many_by_key([('BAD', '1h')], 10_000, scan=True) == {}
+
+
+def test_scan_chunks_count_against_max_inflight(scan, monkeypatch):
+    scan.release.clear()
+    monkeypatch.setattr(scan.app, 'MAX_INFLIGHT', 2)
+    monkeypatch.setattr(scan.app, 'SCAN_WINDOW', 2)
+
+    async def go():
+        async with scan.client() as c:
+            pending = asyncio.ensure_future(c.post('/analysis/scan', json={'symbols': ['A', 'B', 'C'], 'capital': 1e4}))
+            await scan.until(lambda: len(scan.calls) == 2)
+            stats = (await c.get('/analysis/cache/stats')).json()
+            shed = await c.post('/analysis', json={'symbol': 'X', 'timeframe': '1h', 'capital': 1e4})
+            scan.release.set()
+            return stats, shed, await pending
+
+    stats, shed, resp = asyncio.run(go())
+    assert stats['inflight'] == 2
+    assert shed.status_code == 429 and shed.headers['retry-after'] == '1'
+    assert len(resp.text.splitlines()) == 3 and len(scan.calls) == 3